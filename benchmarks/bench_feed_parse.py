@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+フィード解析のマイクロベンチマーク
+
+記録済みのフィード（benchmarks/fixtures/*.xml）を--items件に増やし、
+feedparserでの解析（RssCollectorの従来の経路）と src.collectors.fast_feed.parse_entries
+（先頭の--limit件のみ）の処理時間とメモリ使用量のピークを比較する。
+    
+    python3 benchmarks/bench_feed_parse.py [--items 200] [--limit 10] [--repeat 20]
+"""
+import argparse
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from bench_pipeline import FIXTURES_DIR, scale_feed
+from src.collectors.fast_feed import parse_entries
+from src.collectors.rss_collector import RssCollector
+
+
+def peak_kb(func) -> float:
+    """1回実行したときのメモリ使用量のピーク（KB）"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='フィード解析のマイクロベンチマーク')
+    parser.add_argument('--items', type=int, default=200, help='フィードあたりのアイテム数')
+    parser.add_argument('--limit', type=int, default=10, help='取得するエントリー数（MAX_ARTICLES_PER_SOURCE相当）')
+    parser.add_argument('--repeat', type=int, default=20, help='計測の繰り返し回数')
+    args = parser.parse_args()
+    
+    collector = RssCollector(name='bench', url='http://localhost/feed', max_articles=args.limit)
+    
+    print(f"items/feed: {args.items}, limit: {args.limit}, repeat: {args.repeat}")
+    print(f"{'feed':12s} {'KB':>7s} {'parser':12s} {'ms/feed':>9s} {'peak KB':>9s} {'entries':>8s}")
+    for fixture in sorted(FIXTURES_DIR.glob('*.xml')):
+        content = scale_feed(fixture.read_text(encoding='utf-8'), args.items, seed=0)
+        
+        paths = {
+            'feedparser': lambda: collector._parse_with_feedparser(content),
+            'lxml': lambda: parse_entries(content, args.limit),
+        }
+        # 初回はimportとキャッシュの作成を含むため計測から除く
+        for parse in paths.values():
+            parse()
+        
+        results = {}
+        for name, parse in paths.items():
+            seconds = min(timeit.repeat(parse, number=1, repeat=args.repeat))
+            results[name] = seconds
+            print(f"{fixture.stem:12s} {len(content) / 1024:7.0f} {name:12s} {seconds * 1000:9.2f} "
+                  f"{peak_kb(parse):9.0f} {len(parse() or []):8d}")
+        
+        print(f"{'':12s} {'':7s} {'speedup':12s} {results['feedparser'] / results['lxml']:8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+言語判定のマイクロベンチマーク
+
+旧実装（1文字ずつ2回走査）と src.collectors.language.is_english を比較する。
+    
+    python3 benchmarks/bench_language.py [--entries 5000] [--repeat 5]
+"""
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.collectors.language import is_english
+
+
+def legacy_detect_language(text: str) -> bool:
+    """旧NikkeiCollector._detect_languageと同じ判定"""
+    if not text:
+        return False
+    english_chars = sum(1 for c in text if c.isascii() and c.isalpha())
+    total_chars = sum(1 for c in text if c.isalpha())
+    if total_chars == 0:
+        return False
+    return (english_chars / total_chars) > 0.5
+
+
+def make_entries(count: int, seed: int = 0) -> list:
+    """RSSのタイトル+概要を模したテキスト（日英混在・HTML付き）を生成"""
+    rng = random.Random(seed)
+    japanese = '生成AIの活用が進み国内企業のクラウド投資が拡大している。半導体需要も堅調だ。'
+    english = 'OpenAI announced a new model that improves reasoning and coding benchmarks. '
+    entries = []
+    for _ in range(count):
+        body = japanese if rng.random() < 0.6 else english
+        repeat = rng.randint(2, 12)
+        html = (
+            f'<figure class="wp-block-image"><img src="https://cdn.example.com/images/{rng.randint(0, 9999)}.jpg" '
+            f'alt="" class="attachment-large size-large"></figure><p>{body * repeat}</p>'
+        )
+        entries.append(f"{body[:30]} {html}")
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='言語判定のマイクロベンチマーク')
+    parser.add_argument('--entries', type=int, default=5000, help='判定するエントリー数')
+    parser.add_argument('--repeat', type=int, default=5, help='計測の繰り返し回数')
+    args = parser.parse_args()
+    
+    entries = make_entries(args.entries)
+    total_chars = sum(len(entry) for entry in entries)
+    
+    candidates = [
+        ('legacy (2-pass per-char)', lambda: [legacy_detect_language(e) for e in entries]),
+        ('is_english (regex, early exit)', lambda: [is_english(e) for e in entries]),
+    ]
+    
+    print(f"entries: {args.entries}, chars: {total_chars:,}")
+    baseline = None
+    for label, func in candidates:
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"{label:32s} {best * 1000:8.1f} ms  {args.entries / best:12,.0f} entries/s  x{baseline / best:.1f}")
+    
+    # HTMLを除いた判定結果の差分（旧実装はタグ内の英字も数えてしまう）
+    changed = sum(1 for e in entries if legacy_detect_language(e) != is_english(e))
+    print(f"HTML除去により判定が変わったエントリー: {changed}")
+
+
+if __name__ == '__main__':
+    main()
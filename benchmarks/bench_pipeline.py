@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+パイプライン全体のオフラインベンチマーク
+
+記録済みのフィード（benchmarks/fixtures/*.xml）をローカルのHTTPスタブから配信して
+実際のコレクターで収集し、重複統合・要約（Gemini APIの代わりに遅延とエラー率を
+設定できる偽モデル）・出力までをステージごとに計測する。ネットワークとAPIキーは不要。
+    
+    python3 benchmarks/bench_pipeline.py [--sources 8] [--items 50]
+        [--feed-latency 0.05] [--gemini-latency 0.2] [--gemini-error-rate 0.05]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import List, Dict, Optional
+
+# プロジェクトルートをパスに追加
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+_ITEM_RE = re.compile(r'<item>.*?</item>', re.DOTALL)
+_PACK_COUNT_RE = re.compile(r'以下の(\d+)件')
+
+# 生成するアイテムの本文に混ぜる語彙（アイテムごとに本文を変え、重複統合で消えないようにする）
+_VOCABULARY_EN = (
+    'model inference latency cluster startup funding kernel compiler database vector index '
+    'GPU chip datacenter agent browser privacy security regulation robotics battery network'
+).split()
+_VOCABULARY_JA = 'クラウド 半導体 生成AI 決済 通信 量子 自動運転 データセンター 規制 セキュリティ 投資 人材'.split()
+
+
+def scale_feed(fixture: str, count: int, seed: int) -> bytes:
+    """
+    記録済みフィードのアイテムを繰り返してcount件のフィードを生成
+    
+    タイトル・リンクに連番を付け、本文に語をランダムに加えて各アイテムを別物にする。
+    """
+    rng = random.Random(seed)
+    vocabulary = _VOCABULARY_JA if '<language>ja' in fixture else _VOCABULARY_EN
+    items = _ITEM_RE.findall(fixture)
+    head = fixture[:fixture.index(items[0])]
+    tail = fixture[fixture.rindex(items[-1]) + len(items[-1]):]
+    
+    blocks = []
+    for number in range(count):
+        item = items[number % len(items)]
+        extra = ' '.join(f"{rng.choice(vocabulary)}-{rng.randrange(1000)}" for _ in range(40))
+        item = item.replace('</title>', f' #{seed}-{number}</title>', 1)
+        item = item.replace('</link>', f'?bench={seed}-{number}</link>', 1)
+        item = item.replace('</description>', f' {extra}</description>', 1)
+        item = item.replace(']]></description>', f' {extra}]]></description>', 1)
+        blocks.append(item)
+    
+    return (head + '\n'.join(blocks) + tail).encode('utf-8')
+
+
+class FeedStub:
+    """生成したフィードを /feed/<番号> で配信するローカルHTTPサーバー"""
+    
+    def __init__(self, feeds: List[bytes], latency: float = 0.0):
+        self.feeds = feeds
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                try:
+                    body = stub.feeds[int(self.path.rsplit('/', 1)[-1])]
+                except (ValueError, IndexError):
+                    self.send_error(404)
+                    return
+                if latency:
+                    time.sleep(latency)
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, *args):
+                pass
+        
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_port}"
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGenerativeModel:
+    """genai.GenerativeModelの代わりに、遅延とエラー率を設定して応答を返す偽モデル"""
+    
+    def __init__(self, latency: float, jitter: float, error_rate: float, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+    
+    def _draw(self):
+        """1回の呼び出しの応答時間と失敗の有無を決める"""
+        with self._lock:
+            self.calls += 1
+            delay = max(0.0, self._rng.gauss(self.latency, self.latency * self.jitter))
+            fail = self._rng.random() < self.error_rate
+        return delay, fail
+    
+    @staticmethod
+    def _respond(prompt: str, fail: bool) -> _FakeResponse:
+        if fail:
+            raise RuntimeError('503 Service Unavailable (fake)')
+        
+        # パック要約のプロンプトにはJSON配列で応答する
+        match = _PACK_COUNT_RE.search(prompt)
+        if match and 'JSON' in prompt:
+            count = int(match.group(1))
+            return _FakeResponse(json.dumps(
+                [{'id': number, 'summary': f'要約{number}: ベンチマーク用の要約です。'} for number in range(1, count + 1)],
+                ensure_ascii=False
+            ))
+        return _FakeResponse('ベンチマーク用の要約です。\n技術的な要点を3行で示します。\n以上です。')
+    
+    def generate_content(self, prompt: str, generation_config=None, **kwargs):
+        delay, fail = self._draw()
+        time.sleep(delay)
+        return self._respond(prompt, fail)
+    
+    async def generate_content_async(self, prompt: str, generation_config=None, **kwargs):
+        delay, fail = self._draw()
+        await asyncio.sleep(delay)
+        return self._respond(prompt, fail)
+
+
+def make_summarizer(model: FakeGenerativeModel, retry_delay: float):
+    """APIキー・キャッシュ・レート制限なしで、偽モデルを使うGeminiSummarizerを生成"""
+    from src.processors import gemini_summarizer
+    
+    gemini_summarizer.GEMINI_API_KEY = 'offline-benchmark'
+    gemini_summarizer.SUMMARY_CACHE_ENABLED = False
+    gemini_summarizer.GEMINI_REQUESTS_PER_MINUTE = 0
+    summarizer = gemini_summarizer.GeminiSummarizer()
+    summarizer.model = model
+    summarizer.retry_delay = retry_delay
+    return summarizer
+
+
+def percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    """p50 / p95 / p99（最近傍法）"""
+    if not values:
+        return {'p50': None, 'p95': None, 'p99': None}
+    ordered = sorted(values)
+    
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, int(-(-q * len(ordered) // 100)) - 1))]
+    
+    return {'p50': pick(50), 'p95': pick(95), 'p99': pick(99)}
+
+
+class StageRecorder:
+    """ステージごとの処理時間・スループット・ピークメモリを記録"""
+    
+    def __init__(self, trace_memory: bool = False):
+        """
+        Args:
+            trace_memory: tracemallocでステージごとのピークメモリを計測（処理時間は遅くなる）
+        """
+        self.trace_memory = trace_memory
+        self.rows = []
+    
+    def run(self, name: str, func, items_of=len):
+        if self.trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        peak = None
+        if self.trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        
+        self.rows.append({
+            'stage': name,
+            'seconds': elapsed,
+            'items': items_of(result),
+            'peak_bytes': peak,
+        })
+        return result
+
+
+def peak_mb(peak_bytes: Optional[int]) -> str:
+    """ピークメモリの表示（計測していない場合は'-'）"""
+    if peak_bytes is None:
+        return f"{'-':>8s}"
+    return f"{peak_bytes / 1024 / 1024:8.1f}"
+
+
+def max_rss_mb() -> Optional[float]:
+    """プロセスの最大RSS（MB、取得できない環境ではNone）"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Linuxはキロバイト、macOSはバイト単位
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / 1024 / 1024 if sys.platform == 'darwin' else max_rss / 1024
+
+
+def samples(metrics, name: str) -> List[float]:
+    """メトリクス名が一致する全ラベルのヒストグラムの観測値"""
+    values = []
+    for (metric_name, _), histogram in metrics.histograms.items():
+        if metric_name == name:
+            values.extend(histogram.samples)
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description='パイプライン全体のオフラインベンチマーク')
+    parser.add_argument('--sources', type=int, default=8, help='ソース数（記録済みフィードを順に割り当て）')
+    parser.add_argument('--items', type=int, default=50, help='ソースあたりのアイテム数')
+    parser.add_argument('--feed-latency', type=float, default=0.05, help='HTTPスタブの応答遅延（秒）')
+    parser.add_argument('--gemini-latency', type=float, default=0.2, help='偽モデルの平均応答時間（秒）')
+    parser.add_argument('--gemini-jitter', type=float, default=0.3, help='応答時間の標準偏差（平均に対する比率）')
+    parser.add_argument('--gemini-error-rate', type=float, default=0.05, help='偽モデルのエラー率')
+    parser.add_argument('--no-packing', action='store_true', help='プロンプトパッキングを無効化')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='ステージごとのピークメモリをtracemallocで計測（処理時間は遅くなる）')
+    parser.add_argument('--seed', type=int, default=0, help='乱数シード')
+    parser.add_argument('--verbose', action='store_true', help='パイプラインのログを表示')
+    args = parser.parse_args()
+    
+    # 偽モデルのエラーによるログで結果が埋もれないよう、既定ではログを抑制
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+    
+    from src.collectors import CollectionOrchestrator, create_collectors
+    from src.collectors import feed_fetcher
+    from src.metrics import get_metrics
+    from src.processors import Deduplicator
+    from src.writers import create_writers
+    from src.writers import markdown_writer, jsonl_writer
+    
+    workdir = Path(tempfile.mkdtemp(prefix='bench_pipeline_'))
+    # 条件付きGETの状態を持ち越さず、毎回フィード全体を取得・解析する
+    feed_fetcher.FEED_CONDITIONAL_FETCH = False
+    feed_fetcher.FEED_STATE_DIR = workdir / 'feeds'
+    markdown_writer.OUTPUT_DIR = workdir
+    jsonl_writer.OUTPUT_DIR = workdir
+    
+    fixtures = sorted(FIXTURES_DIR.glob('*.xml'))
+    feeds = [
+        scale_feed(fixtures[index % len(fixtures)].read_text(encoding='utf-8'), args.items, args.seed + index)
+        for index in range(args.sources)
+    ]
+    
+    metrics = get_metrics()
+    metrics.reset()
+    model = FakeGenerativeModel(args.gemini_latency, args.gemini_jitter, args.gemini_error_rate, args.seed)
+    summarizer = make_summarizer(model, retry_delay=min(0.1, args.gemini_latency))
+    summarizer.packing_enabled = not args.no_packing
+    stages = StageRecorder(args.trace_memory)
+    
+    with FeedStub(feeds, args.feed_latency) as stub:
+        specs = [
+            {
+                'name': f"{fixtures[index % len(fixtures)].stem}{index}",
+                'type': 'rss',
+                'url': f"{stub.base_url}/feed/{index}",
+                'max_articles': args.items,
+                'label': f"feed{index}",
+                'column': f"feed{index}",
+                'layout': 'article',
+            }
+            for index in range(args.sources)
+        ]
+        collectors = create_collectors(specs)
+        collected = stages.run(
+            'collect',
+            lambda: CollectionOrchestrator(collectors).run(),
+            items_of=lambda result: sum(len(items) for items in result.values())
+        )
+    
+    def dedup():
+        Deduplicator().run(collected)
+        return [item for items in collected.values() for item in items]
+    
+    stages.run('dedup', dedup)
+    
+    items_to_summarize = [
+        item
+        for items in collected.values()
+        for item in items
+        if item.needs_translation and not item.summary_jp
+    ]
+    stages.run('summarize', lambda: summarizer.summarize_batch(items_to_summarize))
+    
+    sections = [dict(spec, items=collected.get(spec['name'], [])) for spec in specs]
+    writers = create_writers(['markdown', 'jsonl'])
+    
+    def write():
+        for format_name, writer in writers.items():
+            with metrics.timer('write_seconds', format=format_name):
+                writer.write_sections(date=datetime.now(), sections=sections)
+        return [item for section in sections for item in section['items']]
+    
+    stages.run('write', write)
+    
+    latencies = {
+        'collect': samples(metrics, 'collect_seconds'),
+        'summarize': samples(metrics, 'gemini_request_seconds'),
+        'write': samples(metrics, 'write_seconds'),
+    }
+    
+    print(f"sources: {args.sources}, items/source: {args.items}, "
+          f"feed latency: {args.feed_latency * 1000:.0f} ms, "
+          f"gemini latency: {args.gemini_latency * 1000:.0f} ms, error rate: {args.gemini_error_rate:.0%}")
+    print(f"{'stage':10s} {'seconds':>9s} {'items':>7s} {'items/s':>10s} "
+          f"{'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'peak MB':>8s}")
+    for row in stages.rows:
+        stats = percentiles(latencies.get(row['stage'], []))
+        cells = [f"{stats[key] * 1000:8.1f}" if stats[key] is not None else f"{'-':>8s}" for key in ('p50', 'p95', 'p99')]
+        rate = row['items'] / row['seconds'] if row['seconds'] else 0
+        print(f"{row['stage']:10s} {row['seconds']:9.3f} {row['items']:7d} {rate:10,.0f} "
+              f"{' '.join(cells)} {peak_mb(row['peak_bytes'])}")
+    
+    total = sum(row['seconds'] for row in stages.rows)
+    summarized = sum(1 for item in items_to_summarize if item.summary_jp)
+    print(f"total: {total:.3f} s, gemini calls: {model.calls}, "
+          f"summarized: {summarized}/{len(items_to_summarize)}")
+    if max_rss_mb() is not None:
+        print(f"process max RSS: {max_rss_mb():.1f} MB")
+    print(f"output: {workdir}")
+
+
+if __name__ == '__main__':
+    main()
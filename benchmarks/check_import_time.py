@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+起動時のimport時間の確認
+
+`python -X importtime` で対象モジュールのimportを計測し、予算（ミリ秒）を超えた場合や
+遅延読み込みすべき重い依存関係（Gemini APIクライアントなど）が読み込まれた場合に
+終了コード1で終了する。cronやCIで起動時間の劣化を検知するために使う。
+    
+    python3 benchmarks/check_import_time.py [--budget-ms 150] [--module src.main] [--top 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+project_root = Path(__file__).parent.parent
+
+# 対象モジュールのimport時点で読み込まれてはならないモジュール（実際に使う処理の中でimportする）
+LAZY_MODULES = (
+    'google.generativeai',
+    'requests',
+    'asyncio',
+    'feedparser',
+    'bs4',
+    'lxml',
+    'pyarrow',
+    'numpy',
+    'scipy',
+)
+
+
+def measure(module: str) -> Tuple[List[Tuple[str, int, int]], int]:
+    """
+    新しいインタープリターで対象モジュールをimportし、-X importtimeの結果を取得
+    
+    Args:
+        module: 計測するモジュール名
+    
+    Returns:
+        Tuple: ([(モジュール名, 自身の時間μs, 累積時間μs), ...], 対象モジュールの累積時間μs)
+    """
+    env = dict(os.environ, PYTHONPATH=str(project_root))
+    # src.mainはimport時にログファイルを作成するため、一時ディレクトリで実行する
+    with tempfile.TemporaryDirectory() as workdir:
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+            cwd=workdir, env=env, capture_output=True, text=True
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} のimportに失敗しました:\n{result.stderr}")
+    
+    entries = []
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        name = name.strip()
+        entries.append((name, int(self_us), int(cumulative_us)))
+        if name == module:
+            total = int(cumulative_us)
+    return entries, total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='起動時のimport時間の確認')
+    parser.add_argument('--module', default='src.main', help='計測するモジュール')
+    parser.add_argument('--budget-ms', type=float, default=150, help='import時間の予算（ミリ秒）')
+    parser.add_argument('--repeat', type=int, default=3, help='計測回数（最小値で判定）')
+    parser.add_argument('--top', type=int, default=10, help='表示する時間のかかったモジュールの数')
+    args = parser.parse_args()
+    
+    # 初回はバイトコードのキャッシュ作成を含むため、最小値で判定する
+    runs = [measure(args.module) for _ in range(max(1, args.repeat))]
+    entries, total = min(runs, key=lambda run: run[1])
+    loaded = {name for name, _, _ in entries}
+    
+    print(f"{args.module}: {total / 1000:.1f} ms（予算 {args.budget_ms:.0f} ms）")
+    print(f"上位 {args.top} モジュール（自身のimport時間）:")
+    for name, self_us, cumulative_us in sorted(entries, key=lambda entry: entry[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:8.1f} ms  (累積 {cumulative_us / 1000:8.1f} ms)  {name}")
+    
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    if eager:
+        print(f"NG: 遅延読み込みすべきモジュールが読み込まれています: {', '.join(eager)}")
+        failed = True
+    if total / 1000 > args.budget_ms:
+        print(f"NG: import時間が予算を超えています（{total / 1000:.1f} ms > {args.budget_ms:.0f} ms）")
+        failed = True
+    
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -27,8 +27,58 @@ TWITTER_TARGETS = [
     'jasonlk',   # Jason Lemkin
 ]
 
+# Twitter RSS取得に使用するNitterインスタンス
+NITTER_INSTANCES = [
+    'https://nitter.net',
+    'https://nitter.it',
+    'https://nitter.pussthecat.org',
+]
+NITTER_TIMEOUT = 10              # Nitterへのリクエストのタイムアウト（秒）
+NITTER_RACE_INSTANCES = True     # 全インスタンスへ同時にリクエストし、最初に成功した結果を採用
+NITTER_MAX_PER_HOST = 4          # 1インスタンスあたりの同時リクエスト数の上限
+TWITTER_MAX_CONCURRENT_USERS = 8 # 同時に収集するユーザー数の上限
+
+# 収集ソース設定
+# type: 'nikkei' / 'twitter' / 'techcrunch' / 'rss'（汎用RSS、urlが必須）
+# 表示設定（label, column, layout, icon, background, fallback）は省略可能
+# interval: 常駐モードでの収集間隔（秒、省略時はDAEMON_DEFAULT_INTERVAL）
+SOURCES = [
+    {
+        'name': 'nikkei',
+        'type': 'nikkei',
+        'label': '🇯🇵 日経電子版テック面',
+        'column': '📰 日経',
+        'icon': '📄',
+        'background': '#f6f8fa',
+        'fallback': 'preview',
+    },
+    {
+        'name': 'twitter',
+        'type': 'twitter',
+        'label': '🐦 X（Twitter）',
+        'column': '🐦 Twitter',
+        'layout': 'tweet',
+    },
+    {
+        'name': 'techcrunch',
+        'type': 'techcrunch',
+        'label': '🌐 TechCrunch',
+        'column': '🌐 TechCrunch',
+        'icon': '🚀',
+        'background': '#fff5f5',
+        'fallback': 'pending',
+    },
+]
+
+# 追加のRSSフィード一覧ファイル（1行に「名前 URL [言語]」、#以降はコメント）
+FEEDS_FILE = os.getenv('FEEDS_FILE', str(PROJECT_ROOT / 'config' / 'feeds.txt'))
+
 # 出力設定
 OUTPUT_DIR = PROJECT_ROOT / 'daily_vibes'
+# 出力形式（カンマ区切り）: 'markdown' / 'jsonl' / 'parquet'（parquetはpyarrowが必要）
+OUTPUT_FORMATS = [
+    fmt.strip() for fmt in os.getenv('OUTPUT_FORMATS', 'markdown,jsonl').split(',') if fmt.strip()
+]
 
 # 収集設定
 MAX_ARTICLES_PER_SOURCE = 10  # 各ソースから取得する最大記事数
@@ -38,3 +88,107 @@ MAX_TWEETS_PER_USER = 5       # 各ユーザーから取得する最大ツイー
 GEMINI_MODEL = 'gemini-pro'
 GEMINI_MAX_TOKENS = 500
 GEMINI_TEMPERATURE = 0.7
+GEMINI_INPUT_TOKEN_BUDGET = 1000  # 1アイテムあたりの入力テキストの上限（概算トークン数、超過分は冒頭と重要な文に切り詰め）
+GEMINI_INPUT_LEAD_RATIO = 0.6     # 切り詰め時に冒頭から順に残す文に割り当てる予算の割合
+
+# 並列収集設定
+COLLECT_MAX_WORKERS = 8       # 同時に実行するコレクターの最大数
+COLLECT_SOURCE_TIMEOUT = 60   # 各ソースのタイムアウト（秒）
+COLLECT_DEADLINE = 120        # 収集全体の締め切り（秒）
+
+# Gemini API 並列実行・レート制限設定
+GEMINI_MAX_IN_FLIGHT = 4          # 同時に実行するAPI呼び出しの最大数
+GEMINI_REQUESTS_PER_MINUTE = 60   # APIクォータ（1分あたりのリクエスト数、0以下で無制限）
+GEMINI_BURST = 4                  # レート制限で許容するバースト数
+GEMINI_MAX_RETRIES = 3            # API呼び出しの最大試行回数
+GEMINI_RETRY_BASE_DELAY = 2       # リトライ待機時間の基準値（秒、指数的に増加）
+GEMINI_RETRY_MAX_DELAY = 30       # リトライ待機時間の上限（秒）
+
+# Gemini API 非同期実行設定
+GEMINI_ASYNC_ENABLED = os.getenv('GEMINI_ASYNC', '1').lower() in ('1', 'true', 'yes')  # asyncio版のクライアントで要約
+GEMINI_REQUEST_TIMEOUT = 60       # API呼び出し1回あたりのタイムアウト（秒）
+GEMINI_DEADLINE = float(os.getenv('GEMINI_DEADLINE', '600'))  # 要約全体の締め切り（秒、0以下で無制限、超過分は要約なしで出力）
+
+# パイプライン実行設定（収集が完了したソースから順に要約を始め、収集と要約の待ち時間を重ねる）
+PIPELINE_ENABLED = os.getenv('PIPELINE', '1').lower() in ('1', 'true', 'yes')
+PIPELINE_QUEUE_SIZE = 100         # 要約待ちのアイテム数の上限（超えると収集結果の受け取りを待機）
+PIPELINE_BATCH_SIZE = 50          # 1回の要約処理にまとめる最大アイテム数
+
+# キャッシュ・状態ファイルの保存先
+CACHE_DIR = PROJECT_ROOT / '.cache'
+
+# 要約キャッシュ設定
+SUMMARY_CACHE_ENABLED = True
+SUMMARY_CACHE_BYPASS = os.getenv('SUMMARY_CACHE_BYPASS', '').lower() in ('1', 'true', 'yes')  # キャッシュを読まずに再要約
+SUMMARY_CACHE_PATH = CACHE_DIR / 'summaries.sqlite3'
+SUMMARY_CACHE_TTL_DAYS = 14       # キャッシュの有効期限（日）
+SUMMARY_CACHE_MAX_ENTRIES = 5000  # 保持する最大件数（超過分は最終参照が古い順に削除）
+
+# Gemini API プロンプトパッキング設定（短いテキストを1リクエストにまとめて要約）
+GEMINI_PACKING_ENABLED = True
+GEMINI_PACK_TOKEN_BUDGET = 2000   # 1パックあたりの入力トークン数の上限（概算）
+GEMINI_PACK_MAX_ITEMS = 10        # 1パックあたりの最大アイテム数
+GEMINI_PACK_ITEM_MAX_TOKENS = 300 # この長さ（概算トークン数）以下のアイテムのみパック対象
+
+# フィード取得設定（ETag / Last-Modified による条件付きGET）
+FEED_CONDITIONAL_FETCH = True
+FEED_STATE_DIR = CACHE_DIR / 'feeds'  # URLごとの検証子と前回の収集結果の保存先
+FEED_TIMEOUT = 15                     # フィード取得のタイムアウト（秒）
+FEED_FAST_PARSE = True                # lxmlで先頭の必要な件数のみを解析（解析できないフィードはfeedparserで解析）
+
+# インクリメンタルモード設定（前回までに処理済みのアイテムは要約を再利用）
+INCREMENTAL_MODE = os.getenv('INCREMENTAL_MODE', '').lower() in ('1', 'true', 'yes')
+SEEN_INDEX_PATH = CACHE_DIR / 'seen_items.sqlite3'
+SEEN_INDEX_RETENTION_DAYS = 30    # 処理済みアイテムを保持する日数
+
+# 記事本文の取得設定（要約前にリンク先のページから本文を取り出し、概要の代わりに要約する）
+ENRICH_ENABLED = os.getenv('ENRICH_ARTICLES', '').lower() in ('1', 'true', 'yes')
+ENRICH_CACHE_DIR = CACHE_DIR / 'articles'  # URLごとに取り出した本文の保存先
+ENRICH_CACHE_TTL_DAYS = 7         # 保存した本文の有効期限（日）
+ENRICH_MAX_WORKERS = 8            # 同時に取得するページ数
+ENRICH_MAX_PER_DOMAIN = 2         # 1ドメインあたりの同時リクエスト数
+ENRICH_DOMAIN_DELAY = 0.5         # 同じドメインへのリクエストの最小間隔（秒）
+ENRICH_TIMEOUT = 10               # ページ取得のタイムアウト（秒）
+ENRICH_DEADLINE = 60              # 本文取得全体の締め切り（秒、超過分は概要のまま要約）
+ENRICH_MAX_BYTES = 2 * 1024 * 1024  # 取得するページの最大サイズ（バイト）
+ENRICH_MAX_CHARS = 6000           # 保存する本文の最大文字数
+
+# 重複・類似アイテムの統合設定（要約前に同じ話題のアイテムを1件にまとめる）
+DEDUP_ENABLED = True
+DEDUP_THRESHOLD = 0.7             # 類似とみなす推定Jaccard係数（タイトル + 概要の文字n-gram）
+DEDUP_NUM_PERM = 64               # MinHashシグネチャの長さ
+DEDUP_BANDS = 16                  # LSHのバンド数（DEDUP_NUM_PERMを割り切れること）
+DEDUP_SHINGLE_SIZE = 4            # 文字n-gramの長さ
+DEDUP_MIN_TEXT_LENGTH = 50        # これより短いテキストは類似判定せずURLの一致のみで判定
+
+# 記事履歴の保存設定（全ソースのアイテムを蓄積し、python -m src.storage.query で検索）
+ARTICLE_STORE_ENABLED = True
+ARTICLE_STORE_PATH = PROJECT_ROOT / 'data' / 'articles.sqlite3'
+
+# トレンド分析設定（語ごとの日次の出現数を蓄積し、python -m src.analytics.trends で急上昇した語を表示）
+TREND_ENABLED = True
+TREND_STORE_PATH = PROJECT_ROOT / 'data' / 'trends.sqlite3'
+TREND_WINDOW_DAYS = 28            # 急上昇の判定に使う基準期間（日）
+TREND_EWMA_SPAN = 7               # 基準期間の指数移動平均のスパン（日）
+TREND_MIN_COUNT = 3               # 対象日にこの件数以上のアイテムに出現した語のみ判定
+TREND_TOP = 10                    # 実行時にログに出力する語の数
+TREND_RETENTION_DAYS = 400        # 日ごとの出現数を保持する日数
+
+# HTTPクライアント設定（全コレクターで共有するコネクションプール）
+HTTP_USER_AGENT = 'it-trend-watcher/1.0 (+https://github.com/asukabase7/it_trend_watcher)'
+HTTP_POOL_CONNECTIONS = 16            # プールするホスト数
+HTTP_POOL_MAXSIZE = 8                 # 1ホストあたりの保持コネクション数
+HTTP_MAX_RETRIES = 2                  # 接続エラー・5xx・429時の最大リトライ回数
+HTTP_RETRY_BACKOFF = 0.5              # リトライ間隔の基準値（秒、指数的に増加）
+HTTP_MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # レスポンス本文の最大サイズ（バイト）
+
+# 計測設定（実行ごとにステージ・ソース別の処理時間や件数をJSONで出力）
+METRICS_ENABLED = True
+METRICS_DIR = PROJECT_ROOT / 'metrics'
+METRICS_RETENTION_DAYS = 14       # 実行レポート（JSON）を保持する日数（常駐モードでは収集のたびに出力される）
+# Prometheus（node_exporterのtextfile collector）用の出力先（空の場合は出力しない）
+METRICS_PROMETHEUS_TEXTFILE = os.getenv('METRICS_PROMETHEUS_TEXTFILE', '')
+
+# 常駐モード設定（python run.py --daemon でソースごとの間隔で収集を繰り返す）
+DAEMON_DEFAULT_INTERVAL = int(os.getenv('DAEMON_DEFAULT_INTERVAL', '900'))  # ソースごとの収集間隔のデフォルト値（秒）
+DAEMON_MIN_INTERVAL = 60          # 収集間隔の下限（秒、フィードへの過剰なアクセスを防ぐ）
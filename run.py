@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """
 実行スクリプト（エントリーポイント）
+
+    python3 run.py            # 1回だけ収集・要約・出力
+    python3 run.py --daemon   # 常駐モード（ソースごとの間隔で収集を繰り返す）
 """
 import sys
 from pathlib import Path
@@ -9,7 +12,9 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.main import main
-
 if __name__ == '__main__':
+    if '--daemon' in sys.argv[1:]:
+        from src.daemon import main
+    else:
+        from src.main import main
     sys.exit(main())
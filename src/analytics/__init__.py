@@ -0,0 +1,22 @@
+"""
+トレンド分析モジュール
+
+各クラス・関数は参照されたときに初めてimportする。
+"""
+import importlib
+
+_EXPORTS = {
+    'TrendStore': '.trends',
+    'RisingTerm': '.trends',
+    'tokenize': '.tokenizer',
+    'item_terms': '.tokenizer',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
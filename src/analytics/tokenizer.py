@@ -0,0 +1,76 @@
+"""
+トレンド集計用の語の抽出モジュール（英語は単語、日本語はカタカナ語と漢字のbigram）
+"""
+import re
+from typing import List, Set
+
+from src.collectors.language import strip_html
+from src.item import Item
+
+# 英数字の語（C++、C#、Node.js、GPT-4oなどの記号を含む語を1語として扱う）
+_WORD_RE = re.compile(r"[a-z][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+# カタカナの語（長音符を含む）
+_KATAKANA_RE = re.compile(r"[ァ-ヺー]{2,}")
+# 漢字の連続
+_KANJI_RE = re.compile(r"[一-鿿々]+")
+# URL（語として数えない）
+_URL_RE = re.compile(r"https?://\S+")
+
+# 集計しない英単語（機能語と、ニュースの見出しに頻出する一般語）
+STOPWORDS = frozenset("""
+a about after all also an and any are as at be been before but by can could did do does
+for from had has have he her his how i if in into is it its just more most new no not now
+of on one or our out over says said she so some than that the their them then there these
+they this to up us was we were what when which who will with would you your via vs get gets
+year years day days week today first last next make makes made amid inc co ltd
+""".split())
+
+# 語の最小文字数（英語）
+MIN_WORD_LENGTH = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    テキストから語を抽出
+    
+    英語は小文字化した単語（ストップワードと数字のみの語を除く）、日本語はカタカナ語と
+    漢字の連続のbigram（2文字以下の連続はそのまま）を語とする。形態素解析器に
+    依存せず、「生成AI」「半導体」のような複合語も部分の重なりとして数えられる。
+    
+    Args:
+        text: HTMLを含む可能性のあるテキスト
+    
+    Returns:
+        List[str]: 出現順の語のリスト（重複を含む）
+    """
+    if not text:
+        return []
+    
+    text = _URL_RE.sub(' ', strip_html(text)).lower()
+    
+    terms = [
+        word for word in _WORD_RE.findall(text)
+        if len(word) >= MIN_WORD_LENGTH and word not in STOPWORDS
+    ]
+    terms.extend(_KATAKANA_RE.findall(text))
+    for run in _KANJI_RE.findall(text):
+        if len(run) <= 2:
+            terms.append(run)
+        else:
+            terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def item_terms(item: Item) -> Set[str]:
+    """
+    アイテムのタイトルと概要（ツイートは本文）に含まれる語の集合
+    
+    1件のアイテムで同じ語が何度出現しても1回として数える（文書頻度）。
+    
+    Args:
+        item: アイテム
+    
+    Returns:
+        Set[str]: 語の集合
+    """
+    return set(tokenize(f"{item.title or ''} {item.summary or item.content or ''}"))
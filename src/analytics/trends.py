@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+トレンド集計モジュール（日ごとの語の出現数を蓄積し、急上昇した語を検出）
+
+日ごとの語の出現アイテム数（語 × 日の疎行列）をSQLiteに増分で蓄積する。
+新しいアイテムの語だけを加算するため、過去の日次ログを読み直す必要はない。
+急上昇の判定は、対象日の出現数を直前の期間（既定28日）の平均・標準偏差と比べた
+zスコアと、指数移動平均（EWMA）との差で行う。numpy / scipyがインストールされて
+いれば行列演算で計算し、なければ同じ式を純Pythonで計算する。
+
+使用例:
+    python -m src.analytics.trends --date 2026-10-18 --top 20
+    python -m src.analytics.trends --backfill   # 日次ログ（JSON Lines）から未集計の日を取り込む
+"""
+import argparse
+import json
+import logging
+import math
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Optional, Iterable
+
+from config.settings import (
+    OUTPUT_DIR,
+    TREND_STORE_PATH,
+    TREND_WINDOW_DAYS,
+    TREND_EWMA_SPAN,
+    TREND_MIN_COUNT,
+    TREND_RETENTION_DAYS
+)
+from src.analytics.tokenizer import item_terms
+from src.item import Item
+from src.storage.seen_index import SeenIndex
+
+logger = logging.getLogger(__name__)
+
+# zスコアの分母に加える値（基準期間に出現しなかった語で分母が0になるのを防ぎ、少数の出現を割り引く）
+_SIGMA_SMOOTHING = 1.0
+
+
+class RisingTerm:
+    """急上昇した語"""
+    
+    __slots__ = ('term', 'count', 'mean', 'zscore', 'ewma')
+    
+    def __init__(self, term: str, count: int, mean: float, zscore: float, ewma: float):
+        """
+        Args:
+            term: 語
+            count: 対象日の出現アイテム数
+            mean: 基準期間の1日あたりの平均出現アイテム数
+            zscore: 基準期間に対するzスコア
+            ewma: 基準期間の指数移動平均
+        """
+        self.term = term
+        self.count = count
+        self.mean = mean
+        self.zscore = zscore
+        self.ewma = ewma
+    
+    def to_dict(self) -> Dict:
+        """JSONに保存できる辞書"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _day_key(date) -> str:
+    """日付（datetimeまたは'YYYY-MM-DD'）を'YYYY-MM-DD'に揃える"""
+    if isinstance(date, datetime):
+        return date.strftime('%Y-%m-%d')
+    return str(date)[:10]
+
+
+def _ewma_weights(days: int, span: int) -> List[float]:
+    """基準期間の各日（古い順）に掛ける指数移動平均の重み（合計1）"""
+    alpha = 2.0 / (span + 1)
+    weights = [alpha * (1 - alpha) ** (days - 1 - j) for j in range(days)]
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+class TrendStore:
+    """語 × 日の出現アイテム数を蓄積し、急上昇した語を計算"""
+    
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: SQLiteファイルのパス
+        """
+        self.path = Path(path or TREND_STORE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            -- 日付を先頭にしたキー: 新しい日の追加は末尾への追記になり、期間での読み出しも連続する
+            CREATE TABLE IF NOT EXISTS term_counts (
+                day TEXT NOT NULL,
+                term TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (day, term)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS trend_days (
+                day TEXT PRIMARY KEY,
+                items INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS trend_items (
+                day TEXT NOT NULL,
+                key TEXT NOT NULL,
+                PRIMARY KEY (day, key)
+            ) WITHOUT ROWID;
+        """)
+        self._conn.commit()
+    
+    def add_items(self, date, items: Iterable[Item], source: str = '') -> int:
+        """
+        アイテムの語を対象日の出現数に加算（同じ日に集計済みのアイテムはスキップ）
+        
+        Args:
+            date: 対象日（datetimeまたは'YYYY-MM-DD'）
+            items: アイテムのリスト
+            source: ソース名（URLのないアイテムのキーに使用）
+        
+        Returns:
+            int: 新たに集計したアイテム数
+        """
+        day = _day_key(date)
+        counts: Dict[str, int] = {}
+        added = 0
+        
+        with self._conn:
+            for item in items:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO trend_items (day, key) VALUES (?, ?)",
+                    (day, SeenIndex.item_key(source, item))
+                )
+                if not cursor.rowcount:
+                    continue
+                added += 1
+                for term in item_terms(item):
+                    counts[term] = counts.get(term, 0) + 1
+            
+            if not added:
+                return 0
+            
+            self._conn.executemany("""
+                INSERT INTO term_counts (day, term, count) VALUES (?, ?, ?)
+                ON CONFLICT(day, term) DO UPDATE SET count = count + excluded.count
+            """, [(day, term, count) for term, count in counts.items()])
+            self._conn.execute("""
+                INSERT INTO trend_days (day, items) VALUES (?, ?)
+                ON CONFLICT(day) DO UPDATE SET items = items + excluded.items
+            """, (day, added))
+        
+        return added
+    
+    def update(self, date, collected: Dict[str, List[Item]]) -> int:
+        """
+        ソースごとの収集結果を対象日に加算し、保持期間を過ぎた集計を削除
+        
+        Args:
+            date: 対象日
+            collected: ソース名をキーとした収集結果
+        
+        Returns:
+            int: 新たに集計したアイテム数
+        """
+        added = sum(
+            self.add_items(date, items, source=source)
+            for source, items in collected.items()
+        )
+        self.prune(date)
+        return added
+    
+    def prune(self, date):
+        """保持期間を過ぎた出現数と、前日より前の集計済みアイテムのキーを削除"""
+        day = datetime.strptime(_day_key(date), '%Y-%m-%d')
+        cutoff = _day_key(day - timedelta(days=TREND_RETENTION_DAYS))
+        with self._conn:
+            self._conn.execute("DELETE FROM term_counts WHERE day < ?", (cutoff,))
+            self._conn.execute("DELETE FROM trend_days WHERE day < ?", (cutoff,))
+            # 日付をまたいで実行しても同じアイテムを二重に数えないよう、前日分は残す
+            self._conn.execute("DELETE FROM trend_items WHERE day < ?", (_day_key(day - timedelta(days=1)),))
+    
+    def backfill(self, log_dir: Optional[Path] = None) -> int:
+        """
+        日次ログ（log_YYYYMMDD.jsonl）のうち、まだ集計していない日を取り込む
+        
+        集計済みの日のファイルは読まないため、ログが1年分あっても新しい日の分だけで済む。
+        
+        Args:
+            log_dir: 日次ログのディレクトリ
+        
+        Returns:
+            int: 取り込んだ日数
+        """
+        known = {row[0] for row in self._conn.execute("SELECT day FROM trend_days")}
+        imported = 0
+        
+        for path in sorted(Path(log_dir or OUTPUT_DIR).glob('log_*.jsonl')):
+            stem = path.stem[len('log_'):]
+            try:
+                day = datetime.strptime(stem, '%Y%m%d').strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+            if day in known:
+                continue
+            
+            by_source: Dict[str, List[Item]] = {}
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    by_source.setdefault(record.get('source') or '', []).append(Item.from_dict(record))
+            
+            for source, items in by_source.items():
+                self.add_items(day, items, source=source)
+            imported += 1
+            logger.info(f"{path.name} を集計しました")
+        
+        return imported
+    
+    def _window(self, day: str, window: int):
+        """対象日の前のwindow日のうち、集計のある日の日付（古い順）"""
+        start = _day_key(datetime.strptime(day, '%Y-%m-%d') - timedelta(days=window))
+        return [
+            row[0] for row in self._conn.execute(
+                "SELECT day FROM trend_days WHERE day >= ? AND day < ? ORDER BY day", (start, day)
+            )
+        ]
+    
+    def rising_terms(self, date, window: Optional[int] = None, top: int = 20,
+                     min_count: Optional[int] = None) -> List[RisingTerm]:
+        """
+        対象日に急上昇した語を取得
+        
+        対象日の出現アイテム数がmin_count以上の語について、基準期間（対象日の前のwindow日のうち
+        集計のある日）の平均・標準偏差に対するzスコアを計算し、大きい順に返す。
+        
+        Args:
+            date: 対象日
+            window: 基準期間の日数
+            top: 最大件数
+            min_count: 対象日の最小出現アイテム数
+        
+        Returns:
+            List[RisingTerm]: zスコアの大きい順の語
+        """
+        day = _day_key(date)
+        window = window or TREND_WINDOW_DAYS
+        min_count = TREND_MIN_COUNT if min_count is None else min_count
+        
+        candidates = self._conn.execute(
+            "SELECT term, count FROM term_counts WHERE day = ? AND count >= ?", (day, min_count)
+        ).fetchall()
+        if not candidates:
+            return []
+        
+        days = self._window(day, window)
+        terms = [term for term, _ in candidates]
+        today = [count for _, count in candidates]
+        
+        # 基準期間の出現数（候補の語の行のみの疎行列: (語の番号, 日の番号, 出現数)）
+        term_index = {term: i for i, term in enumerate(terms)}
+        day_index = {d: j for j, d in enumerate(days)}
+        entries = []
+        if days:
+            self._conn.execute("CREATE TEMP TABLE IF NOT EXISTS trend_candidates (term TEXT PRIMARY KEY)")
+            self._conn.execute("DELETE FROM trend_candidates")
+            self._conn.executemany("INSERT INTO trend_candidates (term) VALUES (?)", [(term,) for term in terms])
+            entries = [
+                (term_index[term], day_index[d], count)
+                for term, d, count in self._conn.execute("""
+                    SELECT c.term, c.day, c.count FROM term_counts c
+                    JOIN trend_candidates t ON t.term = c.term
+                    WHERE c.day >= ? AND c.day < ?
+                """, (days[0], day))
+            ]
+        
+        scores = _score(today, entries, len(days))
+        ranked = sorted(
+            (RisingTerm(term, count, mean, zscore, ewma)
+             for term, count, (mean, zscore, ewma) in zip(terms, today, scores)),
+            key=lambda rising: (-rising.zscore, -rising.count, rising.term)
+        )
+        return ranked[:top]
+    
+    def close(self):
+        """データベース接続を閉じる"""
+        self._conn.close()
+
+
+def _score(today: List[int], entries: List[tuple], days: int) -> List[tuple]:
+    """
+    候補の語ごとに(平均, zスコア, EWMA)を計算
+    
+    Args:
+        today: 語ごとの対象日の出現数
+        entries: 基準期間の出現数（(語の番号, 日の番号, 出現数)のリスト、0の日は含まない）
+        days: 基準期間の日数
+    
+    Returns:
+        List[tuple]: 語ごとの(平均, zスコア, EWMA)
+    """
+    try:
+        import numpy
+        from scipy import sparse
+    except ImportError:
+        return _score_python(today, entries, days)
+    return _score_numpy(numpy, sparse, today, entries, days)
+
+
+def _score_numpy(np, sparse, today: List[int], entries: List[tuple], days: int) -> List[tuple]:
+    """_score()の行列演算による実装（語 × 日の疎行列）"""
+    x = np.asarray(today, dtype=np.float64)
+    if not days:
+        return [(0.0, float(value) / _SIGMA_SMOOTHING, 0.0) for value in x]
+    
+    rows, cols, values = zip(*entries) if entries else ((), (), ())
+    matrix = sparse.csr_matrix(
+        (np.asarray(values, dtype=np.float64), (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64))),
+        shape=(len(today), days)
+    )
+    mean = np.asarray(matrix.sum(axis=1)).ravel() / days
+    mean_sq = np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel() / days
+    std = np.sqrt(np.maximum(mean_sq - mean ** 2, 0.0))
+    zscore = (x - mean) / (std + _SIGMA_SMOOTHING)
+    ewma = matrix @ np.asarray(_ewma_weights(days, TREND_EWMA_SPAN))
+    return [tuple(map(float, values)) for values in zip(mean, zscore, ewma)]
+
+
+def _score_python(today: List[int], entries: List[tuple], days: int) -> List[tuple]:
+    """_score()の純Pythonによる実装（0でない要素のみを走査）"""
+    if not days:
+        return [(0.0, value / _SIGMA_SMOOTHING, 0.0) for value in today]
+    
+    weights = _ewma_weights(days, TREND_EWMA_SPAN)
+    sums = [0.0] * len(today)
+    squares = [0.0] * len(today)
+    ewmas = [0.0] * len(today)
+    for row, col, value in entries:
+        sums[row] += value
+        squares[row] += value * value
+        ewmas[row] += weights[col] * value
+    
+    scores = []
+    for value, total, square, ewma in zip(today, sums, squares, ewmas):
+        mean = total / days
+        std = math.sqrt(max(square / days - mean * mean, 0.0))
+        scores.append((mean, (value - mean) / (std + _SIGMA_SMOOTHING), ewma))
+    return scores
+
+
+def main(argv=None) -> int:
+    """対象日の急上昇した語を表示"""
+    parser = argparse.ArgumentParser(description='急上昇した語を表示')
+    parser.add_argument('--date', default=datetime.now().strftime('%Y-%m-%d'), help='対象日（YYYY-MM-DD、既定: 今日）')
+    parser.add_argument('--top', type=int, default=20, help='最大件数（既定: 20）')
+    parser.add_argument('--window', type=int, help=f'基準期間の日数（既定: {TREND_WINDOW_DAYS}）')
+    parser.add_argument('--min-count', type=int, help=f'対象日の最小出現アイテム数（既定: {TREND_MIN_COUNT}）')
+    parser.add_argument('--backfill', action='store_true', help='日次ログ（JSON Lines）から未集計の日を取り込む')
+    parser.add_argument('--db', help='データベースファイルのパス')
+    args = parser.parse_args(argv)
+    
+    store = TrendStore(args.db)
+    try:
+        if args.backfill:
+            print(f"{store.backfill()} 日分の日次ログを取り込みました")
+        rising = store.rising_terms(args.date, window=args.window, top=args.top, min_count=args.min_count)
+    finally:
+        store.close()
+    
+    for rank, term in enumerate(rising, 1):
+        print(f"{rank:3d}. {term.term:20s} {term.count:4d} 件（平均 {term.mean:5.1f}, z={term.zscore:5.2f}, EWMA {term.ewma:5.1f}）")
+    
+    print(f"\n{len(rising)} 語")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,27 @@
 """
 データ収集モジュール
+
+各コレクターは参照されたときに初めてimportする（設定されたソースのみ読み込むため）。
 """
+import importlib
+
+_EXPORTS = {
+    'NikkeiCollector': '.nikkei_collector',
+    'TwitterCollector': '.twitter_collector',
+    'TechCrunchCollector': '.techcrunch_collector',
+    'RssCollector': '.rss_collector',
+    'CollectionOrchestrator': '.orchestrator',
+    'Collector': '.registry',
+    'create_collectors': '.registry',
+    'load_source_specs': '.registry',
+    'register_collector_type': '.registry',
+}
+
+__all__ = list(_EXPORTS)
 
-from .nikkei_collector import NikkeiCollector
-from .twitter_collector import TwitterCollector
-from .techcrunch_collector import TechCrunchCollector
 
-__all__ = ['NikkeiCollector', 'TwitterCollector', 'TechCrunchCollector']
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
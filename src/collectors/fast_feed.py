@@ -0,0 +1,242 @@
+"""
+RSS / Atomフィードの高速解析モジュール（lxmlのiterparseで必要な項目のみ取り出す）
+
+feedparserはエントリーごとにFeedParserDictを組み立て、フィード全体を解析する。
+ここでは先頭から必要な件数のエントリーだけをストリーミングで読み、残りは解析しない。
+整形式でないフィードや判別できない形式はNoneを返し、呼び出し元でfeedparserに切り替える。
+"""
+import logging
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from html import escape
+from io import BytesIO
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# エントリーの要素名（名前空間を除いたローカル名）: RSS 2.0 / RSS 1.0は'item'、Atomは'entry'
+_ENTRY_TAGS = ('item', 'entry')
+
+# 公開日時の要素名（優先順）: RSS 2.0の'pubDate'、RSS 1.0の'dc:date'、Atomの'published' / 'updated'
+_DATE_TAGS = ('pubDate', 'date', 'published', 'updated')
+
+# 概要の要素名（優先順）: RSS の'description'、Atomの'summary'、本文の'content' / 'content:encoded'
+_SUMMARY_TAGS = ('description', 'summary', 'content', 'encoded')
+
+# 概要として採用する要素の名前空間: RSS 2.0（名前空間なし）、RSS 1.0 / 0.9、Atom 1.0 / 0.3、content:
+# （media:contentやmedia:descriptionなどの拡張要素は概要にしない）
+_SUMMARY_NAMESPACES = (
+    '',
+    'http://purl.org/rss/1.0/',
+    'http://my.netscape.com/rdf/simple/0.9/',
+    'http://www.w3.org/2005/Atom',
+    'http://purl.org/atom/ns#',
+    'http://purl.org/rss/1.0/modules/content/',
+)
+
+# 概要のHTMLから中身ごと除く要素（feedparserのサニタイズと同じく実行・埋め込みの要素は残さない）
+_UNSAFE_TAGS = (
+    'script', 'style', 'iframe', 'frame', 'frameset', 'object', 'embed', 'applet',
+    'noscript', 'form', 'base', 'link', 'meta',
+)
+
+# タグ・コメントの開始（「a < b」のような本文中の記号はマークアップとみなさない）
+_MARKUP_RE = re.compile(r'<[A-Za-z!/?]')
+
+# URLを値に持つ属性（javascript:などのスキームを除く）
+_URL_ATTRIBUTES = ('href', 'src', 'action', 'formaction', 'background', 'poster')
+
+
+class FeedEntry:
+    """フィードのエントリー1件（コレクターが使う項目のみ）"""
+    
+    __slots__ = ('title', 'link', 'summary', 'published', 'published_text')
+    
+    def __init__(self, title: Optional[str] = None, link: Optional[str] = None,
+                 summary: Optional[str] = None, published: Optional[datetime] = None,
+                 published_text: Optional[str] = None):
+        """
+        Args:
+            title: タイトル（要素がない場合None）
+            link: リンク先URL
+            summary: 概要（要素がない場合None）
+            published: 公開日時（UTCのnaive datetime、解析できない場合None）
+            published_text: 公開日時の元の文字列
+        """
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.published = published
+        self.published_text = published_text
+
+
+def _localname(tag) -> str:
+    """'{名前空間}ローカル名'形式のタグからローカル名を取り出す（コメントなどは空文字列）"""
+    if not isinstance(tag, str):
+        return ''
+    return tag.rsplit('}', 1)[-1]
+
+
+def _namespace(tag) -> str:
+    """'{名前空間}ローカル名'形式のタグから名前空間を取り出す（名前空間なしは空文字列）"""
+    if not isinstance(tag, str) or not tag.startswith('{'):
+        return ''
+    return tag[1:].split('}', 1)[0]
+
+
+def sanitize_html(text: str) -> str:
+    """
+    概要のHTMLから危険な要素と属性を除く
+    
+    feedparserのサニタイズに合わせ、スクリプト・スタイル・埋め込みの要素を中身ごと除き、
+    イベントハンドラー（on*）・style属性と、javascript:などのURLを除く。
+    
+    Args:
+        text: 概要（HTMLを含む可能性がある）
+    
+    Returns:
+        str: サニタイズした概要（マークアップを含まない場合はそのまま）
+    """
+    if not _MARKUP_RE.search(text):
+        return text
+    
+    import lxml.html
+    from lxml import etree
+    
+    try:
+        root = lxml.html.fragment_fromstring(text, create_parent='div')
+    except (etree.ParserError, ValueError):
+        return escape(text, quote=False)
+    
+    etree.strip_elements(root, *_UNSAFE_TAGS, with_tail=False)
+    # コメント・処理命令（条件付きコメントのスクリプトなど）も除く
+    etree.strip_elements(root, etree.Comment, etree.ProcessingInstruction, with_tail=False)
+    for element in root.iter():
+        for name in list(element.attrib):
+            lowered = name.lower()
+            if lowered.startswith('on') or lowered == 'style':
+                del element.attrib[name]
+            elif lowered in _URL_ATTRIBUTES:
+                scheme = ''.join(element.attrib[name].split()).lower().split(':', 1)
+                if len(scheme) == 2 and scheme[0] not in ('http', 'https', 'mailto'):
+                    del element.attrib[name]
+    
+    return escape(root.text or '', quote=False) + ''.join(
+        etree.tostring(child, encoding='unicode', method='html') for child in root
+    )
+
+
+def parse_date(text: str) -> Optional[datetime]:
+    """
+    RFC 822（RSS 2.0）またはISO 8601（Atom、RSS 1.0）の日時をUTCのnaive datetimeに変換
+    
+    feedparserのpublished_parsedと同じくUTCに揃える。
+    
+    Args:
+        text: 日時の文字列
+    
+    Returns:
+        datetime: 公開日時（解析できない場合None）
+    """
+    text = text.strip()
+    if not text:
+        return None
+    
+    try:
+        if text[:4].isdigit():
+            value = datetime.fromisoformat(text[:-1] + '+00:00' if text.endswith('Z') else text)
+        else:
+            value = parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if value is None:
+        return None
+    
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _entry_from_element(element) -> FeedEntry:
+    """エントリーの要素から必要な項目を取り出す"""
+    fields = {}
+    link = None
+    
+    for child in element:
+        name = _localname(child.tag)
+        if not name:
+            continue
+        
+        if name == 'link':
+            # Atomはhref属性（rel="alternate"または省略）、RSSは要素のテキスト
+            href = child.get('href')
+            if href is not None:
+                if link is None and child.get('rel', 'alternate') == 'alternate':
+                    link = href
+            elif link is None and child.text:
+                link = child.text.strip()
+        elif name in _SUMMARY_TAGS and _namespace(child.tag) not in _SUMMARY_NAMESPACES:
+            continue
+        elif name not in fields:
+            # type="xhtml"のAtomの要素は子要素を持つため、テキストを連結する
+            fields[name] = ''.join(child.itertext()) if len(child) else (child.text or '')
+    
+    summary = next((fields[name] for name in _SUMMARY_TAGS if name in fields), None)
+    published_text = next((fields[name] for name in _DATE_TAGS if name in fields), None)
+    
+    title = fields.get('title')
+    
+    return FeedEntry(
+        title=title.strip() if title is not None else None,
+        link=link,
+        summary=sanitize_html(summary) if summary else summary,
+        published=parse_date(published_text) if published_text else None,
+        published_text=published_text
+    )
+
+
+def parse_entries(content: bytes, limit: Optional[int] = None) -> Optional[List[FeedEntry]]:
+    """
+    フィードの先頭からlimit件のエントリーを解析
+    
+    limit件に達した時点で解析をやめる。読み終えた要素は解放するため、
+    フィード全体の大きさに関係なくメモリ使用量は一定に保たれる。
+    
+    Args:
+        content: フィードの本文
+        limit: 取得する最大エントリー数（省略時は全件）
+    
+    Returns:
+        List[FeedEntry]: エントリーのリスト（整形式でない、またはエントリーが見つからない場合None）
+    """
+    # lxmlは読み込みに時間がかかるため、解析が必要になった時点でimportする
+    from lxml import etree
+    
+    entries = []
+    if limit is not None and limit <= 0:
+        return entries
+    
+    try:
+        # 外部エンティティ・ネットワークアクセスは無効化する
+        for _, element in etree.iterparse(
+            BytesIO(content), events=('end',),
+            resolve_entities=False, no_network=True, huge_tree=False
+        ):
+            if _localname(element.tag) not in _ENTRY_TAGS:
+                continue
+            
+            entries.append(_entry_from_element(element))
+            if limit is not None and len(entries) >= limit:
+                break
+            
+            # 処理済みのエントリーを解放
+            element.clear()
+            parent = element.getparent()
+            while parent is not None and element.getprevious() is not None:
+                del parent[0]
+    except etree.XMLSyntaxError as e:
+        logger.debug(f"フィードが整形式ではありません: {e}")
+        return None
+    
+    return entries or None
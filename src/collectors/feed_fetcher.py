@@ -0,0 +1,199 @@
+"""
+条件付きGET（ETag / Last-Modified）によるフィード取得モジュール
+"""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from config.settings import (
+    FEED_CONDITIONAL_FETCH,
+    FEED_STATE_DIR,
+    FEED_TIMEOUT
+)
+from src.collectors.http_client import get_http_client
+from src.item import Item, coerce_items
+
+logger = logging.getLogger(__name__)
+
+
+class FeedResponse:
+    """フィード取得結果"""
+    
+    def __init__(self, url: str, status_code: int, content: bytes = b'',
+                 etag: Optional[str] = None, last_modified: Optional[str] = None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+    
+    @property
+    def not_modified(self) -> bool:
+        """前回の取得から変更がない（304）場合True"""
+        return self.status_code == 304
+    
+    @property
+    def ok(self) -> bool:
+        """本文を取得できた場合True"""
+        return self.status_code == 200
+
+
+def _encode_value(value):
+    """JSONに保存できない値（datetime、Item）を変換"""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, Item):
+        return value.to_dict()
+    raise TypeError(f"JSONに変換できない型です: {type(value).__name__}")
+
+
+def _decode_value(obj: Dict):
+    """_encode_value()で変換した値を復元"""
+    if '__datetime__' in obj:
+        return datetime.fromisoformat(obj['__datetime__'])
+    return obj
+
+
+class FeedFetcher:
+    """
+    フィードURLごとにETag / Last-Modifiedと前回の収集結果を保存し、条件付きGETで取得
+    
+    サーバーが304を返した場合は本文の解析をスキップし、保存済みの収集結果を再利用する。
+    """
+    
+    def __init__(self, state_dir: Optional[Path] = None, timeout: Optional[float] = None,
+                 conditional: Optional[bool] = None):
+        """
+        Args:
+            state_dir: 検証子と収集結果の保存先ディレクトリ
+            timeout: リクエストのタイムアウト（秒）
+            conditional: 条件付きGETを行うか
+        """
+        self.state_dir = Path(state_dir or FEED_STATE_DIR)
+        self.timeout = timeout or FEED_TIMEOUT
+        self.conditional = FEED_CONDITIONAL_FETCH if conditional is None else conditional
+        self.client = get_http_client()
+    
+    def _state_path(self, url: str) -> Path:
+        """URLに対応する状態ファイルのパス"""
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.state_dir / f"{digest}.json"
+    
+    def _load_state(self, url: str) -> Optional[Dict]:
+        """保存済みの状態を読み込み（存在しない・壊れている場合None）"""
+        path = self._state_path(url)
+        if not path.exists():
+            return None
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f, object_hook=_decode_value)
+        except Exception as e:
+            logger.warning(f"フィード状態ファイルの読み込みに失敗: {path}: {e}")
+            return None
+        
+        return state if state.get('url') == url else None
+    
+    def request_headers(self, url: str, conditional: Optional[bool] = None) -> Dict[str, str]:
+        """
+        リクエストヘッダーを構築（保存済みの検証子があれば条件付きGET用のヘッダーを付与）
+        
+        Args:
+            url: フィードURL
+            conditional: 条件付きGETを行うか（省略時はインスタンスの設定）
+        
+        Returns:
+            Dict[str, str]: リクエストヘッダー
+        """
+        headers = {}
+        
+        use_conditional = self.conditional if conditional is None else conditional
+        if use_conditional:
+            state = self._load_state(url)
+            # 収集結果を再利用できない状態で304を受け取っても意味がないため、結果がある場合のみ
+            if state and state.get('items') is not None:
+                if state.get('etag'):
+                    headers['If-None-Match'] = state['etag']
+                if state.get('last_modified'):
+                    headers['If-Modified-Since'] = state['last_modified']
+        
+        return headers
+    
+    def fetch(self, url: str, conditional: Optional[bool] = None) -> FeedResponse:
+        """
+        フィードを取得
+        
+        Args:
+            url: フィードURL
+            conditional: 条件付きGETを行うか（省略時はインスタンスの設定）
+        
+        Returns:
+            FeedResponse: 取得結果（304の場合contentは空）
+        
+        Raises:
+            requests.RequestException: 通信に失敗した場合
+        """
+        response = self.client.get(url, headers=self.request_headers(url, conditional), timeout=self.timeout)
+        
+        if response.status_code == 200:
+            content = self.client.read_body(response)
+        else:
+            content = b''
+            response.close()
+        
+        return FeedResponse(
+            url=url,
+            status_code=response.status_code,
+            content=content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+    
+    def load_items(self, url: str) -> Optional[List[Item]]:
+        """
+        前回保存した収集結果を取得（304応答時に使用）
+        
+        Args:
+            url: フィードURL
+        
+        Returns:
+            List[Item]: 収集結果（保存されていない場合None）
+        """
+        state = self._load_state(url)
+        if not state or state.get('items') is None:
+            return None
+        return coerce_items(state['items'])
+    
+    def save(self, response: FeedResponse, items: List[Item]):
+        """
+        検証子と収集結果を保存
+        
+        Args:
+            response: fetch()の取得結果（200応答）
+            items: フィードから生成した収集結果
+        """
+        if not self.conditional or not response.ok:
+            return
+        if not response.etag and not response.last_modified:
+            return
+        
+        state = {
+            'url': response.url,
+            'etag': response.etag,
+            'last_modified': response.last_modified,
+            'items': items,
+        }
+        
+        path = self._state_path(response.url)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, default=_encode_value)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"フィード状態ファイルの保存に失敗: {path}: {e}")
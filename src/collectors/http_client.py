@@ -0,0 +1,151 @@
+"""
+共有HTTPクライアントモジュール（コネクションプール・リトライ・サイズ制限付き）
+"""
+import logging
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.settings import (
+    HTTP_USER_AGENT,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_RETRY_BACKOFF,
+    HTTP_MAX_RESPONSE_BYTES
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseTooLargeError(requests.RequestException):
+    """レスポンス本文がサイズ上限を超えた"""
+
+
+def _accept_encoding() -> str:
+    """デコード可能な圧縮形式を列挙（brotliはライブラリがある場合のみ）"""
+    encodings = ['gzip', 'deflate']
+    try:
+        import brotli  # noqa: F401
+        encodings.append('br')
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append('br')
+        except ImportError:
+            pass
+    return ', '.join(encodings)
+
+
+class HttpClient:
+    """ホストごとのコネクションを再利用するHTTPクライアント"""
+    
+    CHUNK_SIZE = 64 * 1024
+    
+    def __init__(self, pool_connections: Optional[int] = None,
+                 pool_maxsize: Optional[int] = None,
+                 max_retries: Optional[int] = None,
+                 retry_backoff: Optional[float] = None,
+                 max_response_bytes: Optional[int] = None):
+        """
+        Args:
+            pool_connections: プールするホスト数
+            pool_maxsize: 1ホストあたりの保持コネクション数
+            max_retries: 接続エラー・5xx・429時の最大リトライ回数
+            retry_backoff: リトライ間隔の基準値（秒）
+            max_response_bytes: レスポンス本文の最大サイズ（バイト）
+        """
+        self.max_response_bytes = max_response_bytes or HTTP_MAX_RESPONSE_BYTES
+        
+        retry = Retry(
+            total=HTTP_MAX_RETRIES if max_retries is None else max_retries,
+            backoff_factor=HTTP_RETRY_BACKOFF if retry_backoff is None else retry_backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections or HTTP_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or HTTP_POOL_MAXSIZE,
+            max_retries=retry
+        )
+        
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': HTTP_USER_AGENT,
+            'Accept-Encoding': _accept_encoding(),
+            'Connection': 'keep-alive',
+        })
+    
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+            timeout: Optional[float] = None) -> requests.Response:
+        """
+        GETリクエストを送信（本文は未読のまま返す）
+        
+        本文はread_body()で読み出すこと。読み出さない場合はresponse.close()で
+        コネクションをプールに戻す。
+        
+        Args:
+            url: リクエスト先URL
+            headers: 追加のリクエストヘッダー
+            timeout: タイムアウト（秒）
+        
+        Returns:
+            requests.Response: レスポンス
+        
+        Raises:
+            requests.RequestException: 通信に失敗した場合
+        """
+        return self.session.get(url, headers=headers, timeout=timeout, stream=True)
+    
+    def read_body(self, response: requests.Response, max_bytes: Optional[int] = None) -> bytes:
+        """
+        サイズ上限を確認しながらレスポンス本文を読み出し、レスポンスを閉じる
+        
+        Args:
+            response: get()のレスポンス
+            max_bytes: 本文の最大サイズ（省略時はインスタンスの設定）
+        
+        Returns:
+            bytes: 本文（圧縮は展開済み）
+        
+        Raises:
+            ResponseTooLargeError: 本文がサイズ上限を超えた場合
+        """
+        limit = max_bytes or self.max_response_bytes
+        
+        try:
+            content_length = response.headers.get('Content-Length')
+            if content_length and content_length.isdigit() and int(content_length) > limit:
+                raise ResponseTooLargeError(f"レスポンスが大きすぎます: {response.url} ({content_length} バイト)")
+            
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                received += len(chunk)
+                if received > limit:
+                    raise ResponseTooLargeError(f"レスポンスが大きすぎます: {response.url} ({limit} バイト超)")
+                chunks.append(chunk)
+            
+            return b''.join(chunks)
+        finally:
+            response.close()
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """プロセス内で共有するHttpClientを取得"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
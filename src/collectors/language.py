@@ -0,0 +1,141 @@
+"""
+言語判定モジュール（コレクター共通）
+"""
+import re
+from functools import lru_cache
+from html import unescape
+from typing import Tuple
+
+# HTMLタグとコメント
+_TAG_RE = re.compile(r'<!--.*?-->|<[^>]*>', re.DOTALL)
+
+# ASCIIのうち英字以外（bytes.translateで削除して英字数を数える）
+_ASCII_NON_LETTERS = bytes(b for b in range(128) if not chr(b).isalpha())
+
+# 先頭のこの文字数だけで判定を試みる
+SAMPLE_SIZE = 512
+# 先頭の判定を採用するのに必要な文字（isalpha）の数
+MIN_SAMPLE_LETTERS = 64
+# 先頭の英字の割合が閾値からこれ以上離れていれば結果は明らかとみなす
+CLEAR_MARGIN = 0.25
+
+
+def strip_html(text: str) -> str:
+    """
+    HTMLタグを除去し、文字参照を展開
+    
+    Args:
+        text: HTMLを含む可能性のあるテキスト
+    
+    Returns:
+        str: タグを除いたテキスト
+    """
+    if not text:
+        return ''
+    if '<' in text:
+        text = _TAG_RE.sub(' ', text)
+    if '&' in text:
+        text = unescape(text)
+    return text
+
+
+@lru_cache(maxsize=1)
+def _non_ascii_symbol_re():
+    """
+    非ASCII文字のうち文字（isalpha）ではないものにマッチする正規表現を生成
+    
+    BMPはstr.isalpha()から文字クラスを組み立て、BMP外（主に絵文字）は記号として扱う。
+    初回の呼び出し時に一度だけ生成する。
+    """
+    ranges = []
+    start = None
+    for code in range(0x80, 0x10000):
+        if not chr(code).isalpha():
+            if start is None:
+                start = code
+        elif start is not None:
+            ranges.append((start, code - 1))
+            start = None
+    if start is not None:
+        ranges.append((start, 0xFFFF))
+    ranges.append((0x10000, 0x10FFFF))
+    
+    char_class = ''.join(
+        re.escape(chr(first)) if first == last else f"{re.escape(chr(first))}-{re.escape(chr(last))}"
+        for first, last in ranges
+    )
+    return re.compile(f"[{char_class}]")
+
+
+def count_letters(text: str) -> Tuple[int, int]:
+    """
+    英字の数と文字（isalpha）の数を数える
+    
+    1文字ずつPythonで走査せず、ASCII部分はbytes.translate、
+    非ASCII部分は記号類の正規表現で数える。
+    
+    Args:
+        text: 対象テキスト
+    
+    Returns:
+        Tuple[int, int]: (英字の数, 文字の数)
+    """
+    ascii_bytes = text.encode('ascii', 'ignore')
+    english_chars = len(ascii_bytes.translate(None, _ASCII_NON_LETTERS))
+    
+    non_ascii_chars = len(text) - len(ascii_bytes)
+    if non_ascii_chars:
+        non_ascii_chars -= len(_non_ascii_symbol_re().findall(text))
+    
+    return english_chars, english_chars + non_ascii_chars
+
+
+def is_english(text: str, threshold: float = 0.5, html: bool = True) -> bool:
+    """
+    テキストが英語かどうかを判定（文字のうち英字が占める割合で判定）
+    
+    長いテキストは先頭だけを数え、割合が閾値から十分に離れていればそこで打ち切る。
+    
+    Args:
+        text: 判定するテキスト
+        threshold: 英語と判定する英字の割合（この値を超えたら英語）
+        html: TrueのときHTMLタグを除去してから判定
+    
+    Returns:
+        bool: 英語の場合True、日本語などの場合False
+    """
+    if not text:
+        return False
+    if html:
+        text = strip_html(text)
+    
+    if len(text) > SAMPLE_SIZE:
+        english_chars, total_chars = count_letters(text[:SAMPLE_SIZE])
+        if total_chars >= MIN_SAMPLE_LETTERS:
+            ratio = english_chars / total_chars
+            if abs(ratio - threshold) >= CLEAR_MARGIN:
+                return ratio > threshold
+    
+    english_chars, total_chars = count_letters(text)
+    if total_chars == 0:
+        return False
+    
+    return (english_chars / total_chars) > threshold
+
+
+def needs_translation(text: str, language: str = 'auto') -> bool:
+    """
+    コンテンツに要約（日本語化）が必要か判定
+    
+    Args:
+        text: 判定に使うテキスト（タイトル・概要・本文など）
+        language: 'en'（常に要約）、'ja'（要約しない）、'auto'（テキストから判定）
+    
+    Returns:
+        bool: 要約が必要な場合True
+    """
+    if language == 'en':
+        return True
+    if language == 'ja':
+        return False
+    return is_english(text)
@@ -0,0 +1,140 @@
+"""
+複数コレクターの並列実行モジュール
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from threading import Lock
+from typing import List, Dict, Optional, Iterator, Tuple
+
+from config.settings import (
+    COLLECT_MAX_WORKERS,
+    COLLECT_SOURCE_TIMEOUT,
+    COLLECT_DEADLINE
+)
+from src.metrics import get_metrics
+from src.item import Item, coerce_items
+
+logger = logging.getLogger(__name__)
+
+
+class CollectionOrchestrator:
+    """複数のコレクターをスレッドプールで同時に実行"""
+    
+    # 未完了ソースの状態を確認する間隔（秒）
+    POLL_INTERVAL = 0.5
+    
+    def __init__(self, collectors: Dict[str, object],
+                 max_workers: Optional[int] = None,
+                 source_timeout: Optional[float] = None,
+                 deadline: Optional[float] = None):
+        """
+        Args:
+            collectors: ソース名をキー、collect()を持つコレクターを値とする辞書
+            max_workers: 同時実行するコレクターの最大数
+            source_timeout: 各ソースのタイムアウト（秒、ソースの開始時点から計測）
+            deadline: 収集全体の締め切り（秒、run()の開始時点から計測）
+        """
+        self.collectors = collectors
+        self.max_workers = max_workers or COLLECT_MAX_WORKERS
+        self.source_timeout = source_timeout or COLLECT_SOURCE_TIMEOUT
+        self.deadline = deadline or COLLECT_DEADLINE
+        self._started_at: Dict[str, float] = {}
+        self._lock = Lock()
+        self.metrics = get_metrics()
+    
+    def _run_collector(self, name: str, collector) -> List[Item]:
+        """ワーカースレッドで1つのコレクターを実行"""
+        with self._lock:
+            self._started_at[name] = time.monotonic()
+        with self.metrics.timer('collect_seconds', source=name):
+            items = coerce_items(collector.collect())
+        self.metrics.inc('collect_items_total', len(items), source=name)
+        return items
+    
+    def run(self) -> Dict[str, List[Item]]:
+        """
+        全コレクターを同時に実行し、ソースごとの結果を返す
+        
+        タイムアウトまたは締め切りを過ぎたソース、例外で失敗したソースは
+        空リストとして扱い、他のソースの結果には影響させない。
+        
+        Returns:
+            Dict[str, List[Item]]: ソース名をキーとした収集結果
+        """
+        results: Dict[str, List[Item]] = {name: [] for name in self.collectors}
+        results.update(self.iter_results())
+        return results
+    
+    def iter_results(self) -> Iterator[Tuple[str, List[Item]]]:
+        """
+        全コレクターを同時に実行し、収集が完了したソースから順に結果を返す
+        
+        失敗・タイムアウトしたソースは返さない（run()では空リストになる）。
+        
+        Yields:
+            Tuple[str, List[Item]]: (ソース名, 収集結果)
+        """
+        if not self.collectors:
+            return
+        
+        self._started_at = {}
+        start = time.monotonic()
+        deadline_at = start + self.deadline
+        
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(self.collectors)),
+            thread_name_prefix='collector'
+        )
+        futures = {
+            executor.submit(self._run_collector, name, collector): name
+            for name, collector in self.collectors.items()
+        }
+        pending = set(futures)
+        
+        try:
+            while pending:
+                now = time.monotonic()
+                if now >= deadline_at:
+                    for future in pending:
+                        future.cancel()
+                        logger.warning(f"収集全体の締め切り（{self.deadline}秒）を超過したためスキップ: {futures[future]}")
+                        self.metrics.inc('collect_timeouts_total', source=futures[future])
+                    break
+                
+                done, pending = wait(
+                    pending,
+                    timeout=min(self.POLL_INTERVAL, deadline_at - now),
+                    return_when=FIRST_COMPLETED
+                )
+                
+                for future in done:
+                    name = futures[future]
+                    try:
+                        items = future.result() or []
+                    except Exception as e:
+                        logger.error(f"{name} の収集中にエラーが発生: {e}")
+                        self.metrics.inc('collect_errors_total', source=name)
+                        continue
+                    elapsed = time.monotonic() - self._started_at.get(name, start)
+                    logger.info(f"{name} の収集が完了しました（{len(items)} 件, {elapsed:.1f}秒）")
+                    yield name, items
+                
+                # ソースごとのタイムアウトを確認（開始前のソースは対象外）
+                now = time.monotonic()
+                with self._lock:
+                    started_at = dict(self._started_at)
+                for future in list(pending):
+                    name = futures[future]
+                    if name in started_at and now - started_at[name] >= self.source_timeout:
+                        logger.warning(f"{name} の収集がタイムアウトしました（{self.source_timeout}秒）")
+                        self.metrics.inc('collect_timeouts_total', source=name)
+                        pending.discard(future)
+        finally:
+            # 開始前のコレクターは実行せず、実行中のスレッドは待たずに戻る（結果は破棄される）
+            # （Python 3.8ではshutdown()のcancel_futuresを使えないため個別にキャンセルする）
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+        
+        logger.info(f"全ソースの収集を {time.monotonic() - start:.1f}秒 で終了しました")
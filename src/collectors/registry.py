@@ -0,0 +1,161 @@
+"""
+コレクターの登録・生成モジュール（設定から収集ソースを組み立てる）
+"""
+import importlib
+import logging
+from pathlib import Path
+from typing import List, Dict, Optional, Protocol
+
+from config.settings import SOURCES, FEEDS_FILE
+from src.item import Item
+
+logger = logging.getLogger(__name__)
+
+
+class Collector(Protocol):
+    """コレクターが満たすインターフェース"""
+    
+    name: str
+    
+    def collect(self) -> List[Item]:
+        """アイテムのリストを収集（辞書のリストも可、オーケストレーターでItemに変換する）"""
+        ...
+
+
+# ソース種別 -> "モジュール:クラス"（設定に含まれる種別のみ、生成時にimportする）
+COLLECTOR_TYPES: Dict[str, str] = {
+    'nikkei': 'src.collectors.nikkei_collector:NikkeiCollector',
+    'twitter': 'src.collectors.twitter_collector:TwitterCollector',
+    'techcrunch': 'src.collectors.techcrunch_collector:TechCrunchCollector',
+    'rss': 'src.collectors.rss_collector:RssCollector',
+}
+
+# 出力時の表示設定のデフォルト値
+DISPLAY_DEFAULTS = {
+    'layout': 'article',       # 'article'（記事カード）または 'tweet'（ユーザーごとのツイート）
+    'icon': '📄',
+    'background': '#f6f8fa',
+    'fallback': 'preview',     # 要約がない場合: 'preview'（概要を表示）または 'pending'
+}
+
+# ソース設定のうち、コレクターの引数ではなく表示に使うキー
+DISPLAY_KEYS = ('label', 'column') + tuple(DISPLAY_DEFAULTS)
+
+# ソース設定のうち、常駐モードのスケジュールに使うキー
+SCHEDULE_KEYS = ('interval',)
+
+
+def register_collector_type(type_name: str, target: str):
+    """
+    ソース種別を登録
+    
+    Args:
+        type_name: 設定の'type'に指定する種別名
+        target: "モジュール:クラス" 形式のコレクタークラス
+    """
+    COLLECTOR_TYPES[type_name] = target
+
+
+def _load_class(type_name: str):
+    """ソース種別に対応するコレクタークラスをimport"""
+    if type_name not in COLLECTOR_TYPES:
+        raise ValueError(f"未知のソース種別です: {type_name}")
+    
+    module_name, class_name = COLLECTOR_TYPES[type_name].split(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def load_feeds_file(path: Optional[str] = None) -> List[Dict]:
+    """
+    RSSフィード一覧ファイルを読み込み、汎用RSSソースの設定に変換
+    
+    Args:
+        path: ファイルパス（1行に「名前 URL [言語]」）
+    
+    Returns:
+        List[Dict]: ソース設定のリスト（ファイルがない場合は空）
+    """
+    feeds_path = Path(path or FEEDS_FILE)
+    if not feeds_path.is_file():
+        return []
+    
+    specs = []
+    with open(feeds_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            
+            fields = line.split()
+            if len(fields) < 2:
+                logger.warning(f"フィード一覧の {line_no} 行目を解析できません: {line}")
+                continue
+            
+            spec = {'name': fields[0], 'type': 'rss', 'url': fields[1]}
+            if len(fields) >= 3:
+                spec['language'] = fields[2]
+            specs.append(spec)
+    
+    return specs
+
+
+def load_source_specs() -> List[Dict]:
+    """
+    SOURCES設定とフィード一覧ファイルからソース設定を読み込み
+    
+    Returns:
+        List[Dict]: 表示設定のデフォルト値を補ったソース設定のリスト
+    """
+    specs = []
+    names = set()
+    
+    for spec in list(SOURCES) + load_feeds_file():
+        name = spec['name']
+        if name in names:
+            logger.warning(f"ソース名が重複しているためスキップ: {name}")
+            continue
+        names.add(name)
+        
+        merged = dict(DISPLAY_DEFAULTS)
+        merged.update({'label': name, 'column': name})
+        merged.update(spec)
+        specs.append(merged)
+    
+    return specs
+
+
+def create_collector(spec: Dict) -> Collector:
+    """
+    ソース設定からコレクターを生成
+    
+    Args:
+        spec: ソース設定（'name'と'type'は必須、それ以外はコレクターの引数）
+    
+    Returns:
+        Collector: コレクター
+    """
+    collector_class = _load_class(spec['type'])
+    kwargs = {
+        key: value for key, value in spec.items()
+        if key not in ('type',) + DISPLAY_KEYS + SCHEDULE_KEYS
+    }
+    return collector_class(**kwargs)
+
+
+def create_collectors(specs: List[Dict]) -> Dict[str, Collector]:
+    """
+    ソース設定のリストからコレクターを生成（生成に失敗したソースはスキップ）
+    
+    Args:
+        specs: load_source_specs()のソース設定リスト
+    
+    Returns:
+        Dict[str, Collector]: ソース名をキーとしたコレクター（設定の順序）
+    """
+    collectors = {}
+    for spec in specs:
+        try:
+            collectors[spec['name']] = create_collector(spec)
+        except Exception as e:
+            logger.error(f"コレクター {spec.get('name')} の生成に失敗: {e}")
+    return collectors
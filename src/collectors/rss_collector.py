@@ -0,0 +1,156 @@
+"""
+汎用RSSフィード記事収集モジュール
+"""
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from config.settings import MAX_ARTICLES_PER_SOURCE, FEED_FAST_PARSE
+from src.collectors.fast_feed import FeedEntry, parse_entries
+from src.collectors.feed_fetcher import FeedFetcher
+from src.collectors.language import needs_translation
+from src.item import Item
+from src.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class RssCollector:
+    """任意のRSS / Atomフィードから記事を収集"""
+    
+    def __init__(self, name: str, url: str, source: Optional[str] = None,
+                 language: str = 'auto', max_articles: Optional[int] = None,
+                 fast_parse: Optional[bool] = None):
+        """
+        Args:
+            name: ソース名（設定・ログ・出力で使用する識別子）
+            url: フィードURL
+            source: 記事の'source'に設定する表示名（省略時はname）
+            language: 'en'（常に要約）、'ja'（要約しない）、'auto'（本文から判定）
+            max_articles: 取得する最大記事数
+            fast_parse: lxmlで必要な件数のみを解析するか（省略時はFEED_FAST_PARSE）
+        """
+        self.name = name
+        self.rss_url = url
+        self.source = source or name
+        self.language = language
+        self.max_articles = max_articles or MAX_ARTICLES_PER_SOURCE
+        self.fast_parse = FEED_FAST_PARSE if fast_parse is None else fast_parse
+        self.fetcher = FeedFetcher()
+        self.metrics = get_metrics()
+    
+    def _needs_translation(self, title: str, summary: str) -> bool:
+        """記事に要約（日本語化）が必要か判定（タイトルと概要から言語を判定）"""
+        return needs_translation(title + ' ' + summary, self.language)
+    
+    def _parse_with_feedparser(self, content: bytes) -> List[FeedEntry]:
+        """
+        feedparserでフィードを解析（整形式でないフィードにも対応）
+        
+        Args:
+            content: フィードの本文
+        
+        Returns:
+            List[FeedEntry]: 先頭max_articles件のエントリー
+        """
+        # feedparserは読み込みに時間がかかるため、解析が必要になった時点でimportする
+        import feedparser
+        feed = feedparser.parse(content)
+        
+        if feed.bozo:
+            logger.warning(f"RSSフィードの解析エラー: {feed.bozo_exception}")
+        
+        entries = []
+        for entry in feed.entries[:self.max_articles]:
+            published = None
+            if entry.get('published_parsed'):
+                published = datetime(*entry.published_parsed[:6])
+            entries.append(FeedEntry(
+                title=entry.get('title'),
+                link=entry.get('link'),
+                summary=entry.get('summary', entry.get('description')),
+                published=published,
+                published_text=entry.get('published')
+            ))
+        return entries
+    
+    def collect(self) -> List[Item]:
+        """
+        RSSフィードから記事を収集
+        
+        Returns:
+            List[Item]: 記事情報のリスト
+                - title: タイトル
+                - url: URL
+                - published: 公開日時（datetime）
+                - summary: 概要
+                - needs_translation: 要約が必要か（英語記事の場合True）
+                - source: 表示名
+        """
+        articles = []
+        
+        try:
+            logger.info(f"{self.source} RSSフィードを取得中: {self.rss_url}")
+            response = self.fetcher.fetch(self.rss_url)
+            
+            if response.not_modified:
+                # 前回から更新がなければ解析せずに前回の収集結果を返す
+                cached_articles = self.fetcher.load_items(self.rss_url)
+                if cached_articles is not None:
+                    logger.info(f"{self.source} RSSフィードは前回から更新されていません（{len(cached_articles)} 件を再利用）")
+                    return cached_articles
+                response = self.fetcher.fetch(self.rss_url, conditional=False)
+            
+            if not response.ok:
+                logger.error(f"{self.source} RSSフィードの取得に失敗しました（ステータス {response.status_code}）")
+                return articles
+            
+            entries = None
+            if self.fast_parse:
+                # 必要な件数のみをlxmlで解析（解析できないフィードはfeedparserで解析し直す）
+                entries = parse_entries(response.content, self.max_articles)
+                if entries is None:
+                    logger.info(f"{self.source} RSSフィードを高速解析できないため、feedparserで解析します")
+                    self.metrics.inc('feed_parse_fallbacks_total', source=self.name)
+            if entries is None:
+                entries = self._parse_with_feedparser(response.content)
+            
+            for entry in entries:
+                try:
+                    # 公開日時（解析できない場合は文字列からパースを試みる）
+                    published = entry.published
+                    if published is None and entry.published_text:
+                        try:
+                            from dateutil import parser as date_parser
+                            published = date_parser.parse(entry.published_text)
+                        except:
+                            published = None
+                    if published is None:
+                        published = datetime.now()
+                    
+                    title = entry.title if entry.title is not None else 'No Title'
+                    summary = entry.summary or ''
+                    
+                    article = Item(
+                        title=title,
+                        url=entry.link or '',
+                        published=published,
+                        summary=summary,
+                        needs_translation=self._needs_translation(title, summary),
+                        source=self.source
+                    )
+                    
+                    articles.append(article)
+                
+                except Exception as e:
+                    logger.error(f"記事の処理中にエラー: {e}")
+                    continue
+            
+            self.fetcher.save(response, articles)
+            
+            logger.info(f"{self.source}から {len(articles)} 件の記事を収集しました")
+        
+        except Exception as e:
+            logger.error(f"{self.source}の収集中にエラーが発生: {e}")
+        
+        return articles
@@ -1,18 +1,26 @@
 """
 X（Twitter）投稿収集モジュール
 """
-import requests
 import logging
-import sys
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+from urllib.parse import urlparse
 
-# プロジェクトルートをパスに追加
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-from config.settings import TWITTER_TARGETS, MAX_TWEETS_PER_USER
+from config.settings import (
+    TWITTER_TARGETS,
+    MAX_TWEETS_PER_USER,
+    NITTER_INSTANCES,
+    NITTER_TIMEOUT,
+    NITTER_RACE_INSTANCES,
+    NITTER_MAX_PER_HOST,
+    TWITTER_MAX_CONCURRENT_USERS
+)
+from src.collectors.feed_fetcher import FeedFetcher, FeedResponse
+from src.collectors.http_client import get_http_client
+from src.collectors.language import needs_translation
+from src.item import Item
 
 logger = logging.getLogger(__name__)
 
@@ -20,114 +28,262 @@ logger = logging.getLogger(__name__)
 class TwitterCollector:
     """X（Twitter）から最新投稿を収集"""
     
-    def __init__(self):
-        self.targets = TWITTER_TARGETS
+    def __init__(self, name: str = 'twitter', targets: Optional[List[str]] = None,
+                 language: str = 'en'):
+        """
+        Args:
+            name: ソース名
+            targets: 収集対象のユーザー名リスト（省略時はTWITTER_TARGETS）
+            language: 'en'（常に要約）、'ja'（要約しない）、'auto'（本文から判定）
+        """
+        self.name = name
+        self.targets = targets if targets is not None else TWITTER_TARGETS
+        self.language = language
         self.max_tweets = MAX_TWEETS_PER_USER
+        self.nitter_instances = list(NITTER_INSTANCES)
+        self.timeout = NITTER_TIMEOUT
+        self.race_instances = NITTER_RACE_INSTANCES
+        self.max_concurrent_users = TWITTER_MAX_CONCURRENT_USERS
+        self.fetcher = FeedFetcher(timeout=NITTER_TIMEOUT)
+        self.client = get_http_client()
+        # ホストごとの同時リクエスト数を制限するセマフォ
+        self._host_slots = {
+            urlparse(instance).netloc: threading.BoundedSemaphore(NITTER_MAX_PER_HOST)
+            for instance in self.nitter_instances
+        }
     
-    def _get_tweets_via_rss(self, username: str) -> List[Dict]:
+    def _parse_entries(self, entries, username: str) -> List[Item]:
         """
-        RSSフィード経由でツイートを取得（無料方法）
+        RSSエントリーをツイート情報に変換
         
         Args:
+            entries: feedparserのエントリーリスト
             username: Twitterユーザー名
-            
+        
         Returns:
-            List[Dict]: ツイート情報のリスト
+            List[Item]: ツイート情報のリスト
         """
         tweets = []
         
-        # Nitterインスタンス経由でRSSを取得
-        # 複数のNitterインスタンスを試行
-        nitter_instances = [
-            'https://nitter.net',
-            'https://nitter.it',
-            'https://nitter.pussthecat.org',
-        ]
-        
-        for instance in nitter_instances:
+        for entry in entries[:self.max_tweets]:
             try:
-                rss_url = f"{instance}/{username}/rss"
-                logger.info(f"Nitter経由でRSSを取得中: {rss_url}")
+                # 公開日時のパース
+                published = None
+                if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                    published = datetime(*entry.published_parsed[:6])
+                elif hasattr(entry, 'published'):
+                    try:
+                        from dateutil import parser as date_parser
+                        published = date_parser.parse(entry.published)
+                    except:
+                        published = datetime.now()
+                else:
+                    published = datetime.now()
                 
-                response = requests.get(rss_url, timeout=10)
-                if response.status_code == 200:
-                    import feedparser
-                    feed = feedparser.parse(response.content)
-                    
-                    if feed.bozo:
-                        logger.warning(f"RSSフィードの解析エラー: {feed.bozo_exception}")
-                        continue
-                    
-                    entries = feed.entries[:self.max_tweets]
-                    
-                    for entry in entries:
-                        try:
-                            # 公開日時のパース
-                            published = None
-                            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                                published = datetime(*entry.published_parsed[:6])
-                            elif hasattr(entry, 'published'):
-                                try:
-                                    from dateutil import parser as date_parser
-                                    published = date_parser.parse(entry.published)
-                                except:
-                                    published = datetime.now()
-                            else:
-                                published = datetime.now()
-                            
-                            # ツイート本文を取得（RSSのタイトルまたは説明から）
-                            content = entry.get('title', entry.get('description', ''))
-                            
-                            # URLを取得
-                            url = entry.get('link', f"https://twitter.com/{username}/status/unknown")
-                            
-                            tweet = {
-                                'username': username,
-                                'content': content,
-                                'url': url,
-                                'published': published,
-                                'needs_translation': True,  # Twitterは英語が多いので要約が必要
-                                'source': 'Twitter'
-                            }
-                            
-                            tweets.append(tweet)
-                            
-                        except Exception as e:
-                            logger.error(f"ツイートの処理中にエラー: {e}")
-                            continue
-                    
-                    logger.info(f"{username} から {len(tweets)} 件のツイートを取得しました")
-                    break  # 成功したらループを抜ける
-                    
+                # ツイート本文を取得（RSSのタイトルまたは説明から）
+                content = entry.get('title', entry.get('description', ''))
+                
+                # URLを取得
+                url = entry.get('link', f"https://twitter.com/{username}/status/unknown")
+                
+                tweet = Item(
+                    username=username,
+                    content=content,
+                    url=url,
+                    published=published,
+                    needs_translation=needs_translation(content, self.language),  # Twitterは英語が多いので既定では常に要約
+                    source='Twitter'
+                )
+                
+                tweets.append(tweet)
+            
             except Exception as e:
-                logger.warning(f"Nitterインスタンス {instance} での取得に失敗: {e}")
+                logger.error(f"ツイートの処理中にエラー: {e}")
                 continue
         
         return tweets
     
-    def collect(self) -> List[Dict]:
+    def _fetch_from_instance(self, instance: str, username: str,
+                             cancelled: Optional[threading.Event] = None,
+                             responses: Optional[Dict] = None) -> Optional[List[Item]]:
+        """
+        1つのNitterインスタンスからRSSを取得してツイート情報に変換
+        
+        Args:
+            instance: NitterインスタンスのURL
+            username: Twitterユーザー名
+            cancelled: セットされたら処理を中止するイベント（レース時）
+            responses: 実行中のレスポンスを登録する辞書（レース時に敗者を閉じるため）
+        
+        Returns:
+            List[Item]: ツイート情報のリスト（失敗した場合None）
+        """
+        import feedparser
+        
+        rss_url = f"{instance}/{username}/rss"
+        slot = self._host_slots.get(urlparse(instance).netloc)
+        
+        if slot:
+            slot.acquire()
+        try:
+            if cancelled is not None and cancelled.is_set():
+                return None
+            
+            logger.info(f"Nitter経由でRSSを取得中: {rss_url}")
+            response = self.client.get(
+                rss_url,
+                headers=self.fetcher.request_headers(rss_url),
+                timeout=self.timeout
+            )
+            if responses is not None:
+                responses[instance] = response
+            
+            try:
+                if response.status_code == 304:
+                    # 前回から更新がなければ解析せずに前回の結果を返す
+                    cached_tweets = self.fetcher.load_items(rss_url)
+                    if cached_tweets is not None:
+                        logger.info(f"{rss_url} は前回から更新されていません（{len(cached_tweets)} 件を再利用）")
+                    return cached_tweets
+                
+                if response.status_code != 200:
+                    logger.warning(f"Nitterインスタンス {instance} がステータス {response.status_code} を返しました")
+                    return None
+                
+                feed_response = FeedResponse(
+                    url=rss_url,
+                    status_code=response.status_code,
+                    content=self.client.read_body(response),
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+            finally:
+                response.close()
+            
+            if cancelled is not None and cancelled.is_set():
+                return None
+            
+            feed = feedparser.parse(feed_response.content)
+            if feed.bozo:
+                logger.warning(f"RSSフィードの解析エラー: {feed.bozo_exception}")
+                return None
+            
+            tweets = self._parse_entries(feed.entries, username)
+            self.fetcher.save(feed_response, tweets)
+            return tweets
+        
+        except Exception as e:
+            if cancelled is None or not cancelled.is_set():
+                logger.warning(f"Nitterインスタンス {instance} での取得に失敗: {e}")
+            return None
+        finally:
+            if slot:
+                slot.release()
+    
+    def _race_instances(self, username: str):
+        """
+        全Nitterインスタンスへ同時にリクエストし、最初に有効なフィードを返したものを採用
+        
+        勝者が決まった時点で残りのリクエストはキャンセルし、実行中の接続は閉じる。
+        
+        Args:
+            username: Twitterユーザー名
+        
+        Returns:
+            List[Item]: ツイート情報のリスト（全インスタンスが失敗した場合None）
+        """
+        cancelled = threading.Event()
+        responses: Dict = {}
+        executor = ThreadPoolExecutor(
+            max_workers=len(self.nitter_instances),
+            thread_name_prefix=f"nitter-{username}"
+        )
+        futures = {
+            executor.submit(self._fetch_from_instance, instance, username, cancelled, responses): instance
+            for instance in self.nitter_instances
+        }
+        
+        try:
+            for future in as_completed(futures):
+                tweets = future.result()
+                if tweets is not None:
+                    logger.info(f"@{username}: {futures[future]} のレスポンスを採用しました")
+                    return tweets
+            return None
+        finally:
+            # 敗者のリクエストをキャンセル
+            cancelled.set()
+            for future in futures:
+                future.cancel()
+            for response in list(responses.values()):
+                try:
+                    response.close()
+                except Exception:
+                    pass
+            executor.shutdown(wait=False)
+    
+    def _get_tweets_via_rss(self, username: str) -> List[Item]:
+        """
+        RSSフィード経由でツイートを取得（無料方法）
+        
+        Args:
+            username: Twitterユーザー名
+        
+        Returns:
+            List[Item]: ツイート情報のリスト
+        """
+        # Nitterインスタンス経由でRSSを取得
+        if self.race_instances:
+            tweets = self._race_instances(username)
+        else:
+            # 複数のNitterインスタンスを順番に試行
+            tweets = None
+            for instance in self.nitter_instances:
+                tweets = self._fetch_from_instance(instance, username)
+                if tweets is not None:
+                    break  # 成功したらループを抜ける
+        
+        if tweets is None:
+            logger.warning(f"@{username}: 全てのNitterインスタンスで取得に失敗しました")
+            return []
+        
+        logger.info(f"{username} から {len(tweets)} 件のツイートを取得しました")
+        return tweets
+    
+    def _collect_user(self, username: str) -> List[Item]:
+        """1ユーザー分のツイートを収集（エラー時は空リスト）"""
+        try:
+            logger.info(f"Twitterユーザー @{username} のツイートを収集中...")
+            return self._get_tweets_via_rss(username)
+        except Exception as e:
+            logger.error(f"@{username} の収集中にエラーが発生: {e}")
+            return []
+    
+    def collect(self) -> List[Item]:
         """
         対象ユーザーから最新ツイートを収集
         
+        ユーザーごとの取得は並列に行い、結果は設定の順序で返す。
+        
         Returns:
-            List[Dict]: ツイート情報のリスト
+            List[Item]: ツイート情報のリスト
                 - username: ユーザー名
                 - content: ツイート内容
                 - url: ツイートURL
                 - published: 投稿日時（datetime）
-                - needs_translation: 要約が必要か（常にTrue）
+                - needs_translation: 要約が必要か（既定では常にTrue）
         """
         all_tweets = []
         
-        for username in self.targets:
-            try:
-                logger.info(f"Twitterユーザー @{username} のツイートを収集中...")
-                tweets = self._get_tweets_via_rss(username)
+        if not self.targets:
+            return all_tweets
+        
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrent_users, len(self.targets)),
+            thread_name_prefix='twitter-user'
+        ) as executor:
+            for tweets in executor.map(self._collect_user, self.targets):
                 all_tweets.extend(tweets)
-                
-            except Exception as e:
-                logger.error(f"@{username} の収集中にエラーが発生: {e}")
-                continue
         
         logger.info(f"合計 {len(all_tweets)} 件のツイートを収集しました")
         return all_tweets
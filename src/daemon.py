@@ -0,0 +1,196 @@
+"""
+常駐モード（ソースごとの間隔で収集を繰り返し、新しいアイテムを随時出力）
+
+コレクター・要約処理（Geminiクライアント）・ライター・HTTPクライアントの接続を
+実行のたびに作り直さず保持する。SIGTERM / SIGINT を受け取ると実行中の処理を
+終えてから終了する。
+    
+    python3 run.py --daemon
+    python3 -m src.daemon
+"""
+import logging
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import List, Dict, Optional
+
+from src.main import create_summarizer, process_collected
+from src.collectors import CollectionOrchestrator, create_collectors, load_source_specs
+from src.writers import create_writers
+from src.storage import SeenIndex
+from src.metrics import get_metrics, write_run_report
+from config.settings import (
+    OUTPUT_FORMATS,
+    METRICS_ENABLED,
+    DAEMON_DEFAULT_INTERVAL,
+    DAEMON_MIN_INTERVAL
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler:
+    """ソースごとの収集間隔で、期限が来たソースを収集してパイプラインに流す"""
+    
+    def __init__(self, specs: Optional[List[Dict]] = None,
+                 default_interval: Optional[float] = None,
+                 min_interval: Optional[float] = None):
+        """
+        Args:
+            specs: ソース設定のリスト（省略時はload_source_specs()）
+            default_interval: 'interval'を指定していないソースの収集間隔（秒）
+            min_interval: 収集間隔の下限（秒）
+        """
+        self.specs = specs if specs is not None else load_source_specs()
+        default_interval = default_interval or DAEMON_DEFAULT_INTERVAL
+        min_interval = DAEMON_MIN_INTERVAL if min_interval is None else min_interval
+        
+        self.collectors = create_collectors(self.specs)
+        self.intervals = {
+            spec['name']: max(float(spec.get('interval') or default_interval), min_interval)
+            for spec in self.specs
+            if spec['name'] in self.collectors
+        }
+        # 起動直後に全ソースを収集する
+        self.next_run = {name: 0.0 for name in self.intervals}
+        
+        self.summarizer = create_summarizer()
+        self.writers = create_writers(OUTPUT_FORMATS)
+        self.metrics = get_metrics()
+        
+        self._seen_index: Optional[SeenIndex] = None
+        self._seen_index_date = None
+        self._stop = threading.Event()
+    
+    def stop(self):
+        """実行中の処理が終わり次第、run()を終了させる"""
+        self._stop.set()
+    
+    def _handle_signal(self, signum, frame):
+        """SIGTERM / SIGINT のハンドラー（2回目はすぐに中断）"""
+        if self._stop.is_set():
+            raise KeyboardInterrupt
+        logger.info(f"シグナル {signal.Signals(signum).name} を受信しました。実行中の処理を終えてから終了します")
+        self.stop()
+    
+    def install_signal_handlers(self):
+        """SIGTERM / SIGINT で停止するようにハンドラーを登録（メインスレッドからのみ呼べる）"""
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+    
+    def _seen_index_for(self, today: datetime) -> SeenIndex:
+        """処理済みアイテムのインデックス（日付が変わったら開き直して保持期間を過ぎた分を削除）"""
+        if self._seen_index is None or self._seen_index_date != today.date():
+            if self._seen_index:
+                self._seen_index.close()
+            self._seen_index = SeenIndex()
+            self._seen_index_date = today.date()
+        return self._seen_index
+    
+    def due_sources(self, now: float) -> List[str]:
+        """収集の期限が来たソース名のリスト（設定の順序）"""
+        return [name for name, next_run in self.next_run.items() if next_run <= now]
+    
+    def tick(self, due: List[str]) -> str:
+        """
+        期限が来たソースを収集し、新しいアイテムがあればパイプラインに流す
+        
+        期限が来ていないソースは空の収集結果として扱い、同日の記録済みアイテムから
+        日次ログを組み立てる。
+        
+        Args:
+            due: 収集するソース名のリスト
+        
+        Returns:
+            str: 実行結果（'ok' / 'idle' / 'error'）
+        """
+        self.metrics.reset()
+        status = 'error'
+        
+        try:
+            orchestrator = CollectionOrchestrator({name: self.collectors[name] for name in due})
+            with self.metrics.timer('stage_seconds', stage='collect'):
+                fetched = orchestrator.run()
+            
+            today = datetime.now()
+            seen_index = self._seen_index_for(today)
+            collected = {spec['name']: fetched.get(spec['name'], []) for spec in self.specs}
+            
+            new_count = sum(
+                seen_index.count_unseen(source, items)
+                for source, items in collected.items()
+            )
+            logger.info(f"収集: {', '.join(due)}（新しいアイテム {new_count} 件）")
+            if not new_count:
+                status = 'idle'
+                return status
+            
+            output_paths = process_collected(
+                self.specs, collected, today,
+                summarizer=self.summarizer,
+                writers=self.writers,
+                seen_index=seen_index
+            )
+            for output_path in output_paths:
+                logger.info(f"出力ファイル: {output_path}")
+            status = 'ok'
+            return status
+        
+        except Exception as e:
+            # 1回の失敗で常駐プロセスを止めない（次の期限で再実行）
+            logger.error(f"処理中にエラーが発生しました: {e}", exc_info=True)
+            return status
+        
+        finally:
+            if METRICS_ENABLED and status != 'idle':
+                write_run_report(status)
+    
+    def run(self) -> int:
+        """
+        停止されるまで、期限が来たソースの収集を繰り返す
+        
+        Returns:
+            int: 終了コード
+        """
+        if not self.collectors:
+            logger.error("収集できるソースがありません")
+            return 1
+        
+        intervals = ', '.join(f"{name}={interval:.0f}秒" for name, interval in self.intervals.items())
+        logger.info(f"常駐モードを開始します（収集間隔: {intervals}）")
+        
+        try:
+            while not self._stop.is_set():
+                now = time.monotonic()
+                due = self.due_sources(now)
+                if due:
+                    for name in due:
+                        self.next_run[name] = now + self.intervals[name]
+                    self.tick(due)
+                    continue
+                
+                # 次の期限まで待機（停止されたらすぐに戻る）
+                self._stop.wait(max(0.0, min(self.next_run.values()) - time.monotonic()))
+        except KeyboardInterrupt:
+            logger.info("処理がユーザーによって中断されました")
+            return 1
+        finally:
+            if self._seen_index:
+                self._seen_index.close()
+                self._seen_index = None
+        
+        logger.info("常駐モードを終了しました")
+        return 0
+
+
+def main() -> int:
+    """常駐モードのエントリーポイント"""
+    scheduler = Scheduler()
+    scheduler.install_signal_handlers()
+    return scheduler.run()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+収集アイテムのモデル（コレクター・要約処理・ライターで共通）
+"""
+from datetime import datetime
+from typing import List, Dict, Optional, Iterable, Union
+
+
+class Item:
+    """
+    記事またはツイート1件
+    
+    __slots__で属性を固定し、アイテムごとの辞書を持たないようにしている。
+    記事はtitle / summary、ツイートはusername / contentを持つ。
+    """
+    
+    __slots__ = (
+        'source',
+        'title',
+        'url',
+        'published',
+        'summary',
+        'content',
+        'body',
+        'username',
+        'needs_translation',
+        'summary_jp',
+        'duplicates',
+    )
+    
+    def __init__(self, source: Optional[str] = None, title: Optional[str] = None, url: str = '',
+                 published: Optional[datetime] = None, summary: Optional[str] = None,
+                 content: Optional[str] = None, username: Optional[str] = None,
+                 needs_translation: bool = False, summary_jp: Optional[str] = None,
+                 duplicates: Optional[List[Dict]] = None, body: Optional[str] = None):
+        """
+        Args:
+            source: 表示名
+            title: タイトル（記事のみ）
+            url: URL
+            published: 公開日時
+            summary: 概要（記事のみ）
+            content: 本文（ツイートのみ）
+            username: ユーザー名（ツイートのみ）
+            needs_translation: 要約（日本語化）が必要か
+            summary_jp: 日本語要約
+            duplicates: 統合した重複・類似アイテム（{'source', 'title', 'url'}のリスト）
+            body: リンク先のページから取り出した本文（記事のみ、本文の取得が有効な場合）
+        """
+        self.source = source
+        self.title = title
+        self.url = url
+        self.published = published
+        self.summary = summary
+        self.content = content
+        self.username = username
+        self.needs_translation = needs_translation
+        self.summary_jp = summary_jp
+        self.duplicates = duplicates
+        self.body = body
+    
+    @property
+    def text(self) -> str:
+        """要約対象のテキスト（ツイートは本文、記事は取得した本文・概要・タイトルの順）"""
+        if self.content is not None:
+            return self.content
+        if self.body:
+            return self.body
+        if self.summary is not None:
+            return self.summary
+        return self.title or ''
+    
+    def to_dict(self) -> Dict:
+        """値が設定されている属性の辞書（JSONへの保存用）"""
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if getattr(self, name) is not None
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Item':
+        """
+        辞書からアイテムを生成
+        
+        Args:
+            data: to_dict()の結果、またはコレクターが返したアイテムの辞書（未知のキーは無視）
+        
+        Returns:
+            Item: アイテム
+        """
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+    
+    def __repr__(self) -> str:
+        label = self.title if self.content is None else self.content[:40]
+        return f"Item(source={self.source!r}, url={self.url!r}, {label!r})"
+
+
+def coerce_items(items: Optional[Iterable[Union[Item, Dict]]]) -> List[Item]:
+    """
+    アイテムのリストをItemに揃える（辞書を返す独自のコレクターや、旧形式の呼び出し元用）
+    
+    Args:
+        items: Itemまたは辞書のリスト
+    
+    Returns:
+        List[Item]: Itemのリスト（Itemはそのまま）
+    """
+    return [
+        item if isinstance(item, Item) else Item.from_dict(item)
+        for item in items or []
+    ]
@@ -7,14 +7,32 @@ import sys
 import logging
 from datetime import datetime
 from pathlib import Path
+from typing import List, Dict, Optional
 
-# プロジェクトルートをパスに追加
+# プロジェクトルートをパスに追加（src/main.pyを直接実行した場合のみ必要）
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-from src.collectors import NikkeiCollector, TwitterCollector, TechCrunchCollector
-from src.processors import GeminiSummarizer
-from src.writers import MarkdownWriter
+from src.collectors import CollectionOrchestrator, create_collectors, load_source_specs
+from src.processors import GeminiSummarizer, Deduplicator
+from src.writers import create_writers
+from src.storage import SeenIndex, ArticleStore
+from src.metrics import get_metrics, write_run_report
+from src.item import Item
+from src.analytics import TrendStore
+from src.pipeline import SummaryPipeline
+from config.settings import (
+    INCREMENTAL_MODE,
+    OUTPUT_FORMATS,
+    ARTICLE_STORE_ENABLED,
+    DEDUP_ENABLED,
+    METRICS_ENABLED,
+    TREND_ENABLED,
+    TREND_TOP,
+    ENRICH_ENABLED,
+    PIPELINE_ENABLED
+)
 
 # ロギング設定
 logging.basicConfig(
@@ -29,125 +47,231 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def create_summarizer() -> Optional[GeminiSummarizer]:
+    """要約処理を生成（APIキーが設定されていない場合はNone）"""
+    try:
+        return GeminiSummarizer()
+    except ValueError as e:
+        logger.error(f"Gemini APIキーが設定されていません: {e}")
+        logger.info("要約処理をスキップします。記事は要約なしで出力されます。")
+        return None
+
+
+def process_collected(specs: List[Dict], collected: Dict[str, List[Item]], today: datetime,
+                      summarizer: Optional[GeminiSummarizer], writers: Dict[str, object],
+                      seen_index: Optional[SeenIndex] = None) -> List[Path]:
+    """
+    収集結果を重複統合・要約・保存し、出力ファイルを生成
+    
+    Args:
+        specs: ソース設定のリスト（出力のセクション順）
+        collected: ソース名をキーとした収集結果（その場で更新）
+        today: 実行日
+        summarizer: 要約処理（Noneの場合は要約しない）
+        writers: 形式名をキーとしたライター
+        seen_index: 処理済みアイテムのインデックス（指定時は要約を再利用し、同日の過去の実行分と合わせて出力）
+    
+    Returns:
+        List[Path]: 生成したファイルのパス
+    """
+    metrics = get_metrics()
+    
+    # インクリメンタルモード: 処理済みのアイテムは保存済みの要約を再利用し、同日の過去の実行分と合わせる
+    if seen_index:
+        seen_count = sum(
+            seen_index.apply(source, items)
+            for source, items in collected.items()
+        )
+        logger.info(f"インクリメンタルモード: 処理済み {seen_count} 件の要約を再利用します")
+        seen_index.merge_collected(collected, today)
+    
+    # ソースをまたいだ重複・類似アイテムを1件にまとめる（要約・出力は代表のみ）
+    duplicates = {}
+    if DEDUP_ENABLED:
+        with metrics.timer('stage_seconds', stage='dedup'):
+            duplicates = Deduplicator().run(collected)
+        metrics.inc('dedup_removed_items_total', sum(len(items) for items in duplicates.values()))
+    
+    # 2. 要約処理（英語コンテンツのみ）
+    logger.info("\n[Step 2] 要約処理を開始...")
+    
+    # 要約が必要なアイテムを抽出（ツイートは本文、記事は概要またはタイトルを要約）
+    items_to_summarize = [
+        item
+        for items in collected.values()
+        for item in items
+        if item.needs_translation and not item.summary_jp
+    ]
+    
+    logger.info(f"要約対象: {len(items_to_summarize)} 件")
+    metrics.inc('summarize_items_total', len(items_to_summarize))
+    
+    if ENRICH_ENABLED and summarizer:
+        # 記事のリンク先から本文を取得（失敗・締め切り超過の記事は概要で要約する）
+        # （HTTPクライアントの読み込みに時間がかかるため、本文を取得する場合のみimportする）
+        from src.processors import ArticleFetcher
+        try:
+            with metrics.timer('stage_seconds', stage='enrich'):
+                ArticleFetcher().run(items_to_summarize)
+        except Exception as e:
+            logger.error(f"記事本文の取得に失敗: {e}")
+    
+    # 要約を実行（要約は各アイテムにその場で格納される、APIキーがない場合は要約なしで進む）
+    if summarizer:
+        with metrics.timer('stage_seconds', stage='summarize'):
+            summarizer.summarize_batch(items_to_summarize)
+    
+    logger.info("✓ 要約処理が完了しました")
+    
+    return finalize_collected(specs, collected, today, writers, seen_index, duplicates)
+
+
+def finalize_collected(specs: List[Dict], collected: Dict[str, List[Item]], today: datetime,
+                       writers: Dict[str, object], seen_index: Optional[SeenIndex] = None,
+                       duplicates: Optional[Dict[str, List[Item]]] = None) -> List[Path]:
+    """
+    要約済みの収集結果を記録・保存し、出力ファイルを生成
+    
+    Args:
+        specs: ソース設定のリスト（出力のセクション順）
+        collected: ソース名をキーとした収集結果（seen_index指定時は同日の過去の実行分と合わせ済み）
+        today: 実行日
+        writers: 形式名をキーとしたライター
+        seen_index: 処理済みアイテムのインデックス（指定時は今回のアイテムを処理済みとして記録）
+        duplicates: ソース名をキーとした重複統合で除いたアイテム（処理済みとして記録し、出力しない）
+    
+    Returns:
+        List[Path]: 生成したファイルのパス
+    """
+    metrics = get_metrics()
+    
+    if seen_index:
+        # 今回のアイテムを記録（除いた重複も記録し、次回以降は新しいアイテムとして数えない）
+        for source, items in collected.items():
+            seen_index.record(source, items, today)
+        for source, items in (duplicates or {}).items():
+            seen_index.record(source, items, today, duplicate=True)
+    
+    if ARTICLE_STORE_ENABLED:
+        # 記事履歴に保存（履歴の検索用、失敗しても出力は続ける）
+        try:
+            with metrics.timer('stage_seconds', stage='store'):
+                store = ArticleStore()
+                stored_count = sum(
+                    store.upsert(source, items)
+                    for source, items in collected.items()
+                )
+                store.close()
+            logger.info(f"✓ 記事履歴に {stored_count} 件を保存しました")
+        except Exception as e:
+            logger.error(f"記事履歴の保存に失敗: {e}")
+    
+    if TREND_ENABLED:
+        # 語ごとの日次の出現数を更新し、急上昇した語をログに出力（失敗しても出力は続ける）
+        try:
+            with metrics.timer('stage_seconds', stage='trends'):
+                trends = TrendStore()
+                trend_count = trends.update(today, collected)
+                rising = trends.rising_terms(today, top=TREND_TOP)
+                trends.close()
+            metrics.inc('trend_items_total', trend_count)
+            if rising:
+                logger.info("✓ 急上昇した語: " + ', '.join(f"{term.term}（{term.count}件）" for term in rising))
+        except Exception as e:
+            logger.error(f"トレンドの集計に失敗: {e}")
+    
+    # 3. 出力ファイル生成（設定された形式ごとに同じデータを出力）
+    logger.info("\n[Step 3] 出力ファイルを生成...")
+    
+    sections = [
+        dict(spec, items=collected.get(spec['name'], []))
+        for spec in specs
+    ]
+    output_paths = []
+    for format_name, writer in writers.items():
+        with metrics.timer('write_seconds', format=format_name):
+            output_path = writer.write_sections(date=today, sections=sections)
+        output_paths.append(output_path)
+        logger.info(f"✓ {format_name}ファイルを生成しました: {output_path}")
+    
+    return output_paths
+
+
+def log_collected(specs: List[Dict], collected: Dict[str, List[Item]]):
+    """ソースごとの収集件数をログに出力"""
+    for spec in specs:
+        logger.info(f"✓ {spec['label']}: {len(collected.get(spec['name'], []))} 件")
+
+
 def main():
     """メイン処理"""
     logger.info("=" * 60)
     logger.info("ITトレンド・ウォッチャー & バイブス・コレクター を開始します")
     logger.info("=" * 60)
     
+    metrics = get_metrics()
+    status = 'error'
+    
     try:
         # 1. データ収集
         logger.info("\n[Step 1] データ収集を開始...")
         
-        nikkei_collector = NikkeiCollector()
-        twitter_collector = TwitterCollector()
-        techcrunch_collector = TechCrunchCollector()
-        
-        nikkei_articles = nikkei_collector.collect()
-        logger.info(f"✓ 日経電子版: {len(nikkei_articles)} 件")
-        
-        twitter_tweets = twitter_collector.collect()
-        logger.info(f"✓ Twitter: {len(twitter_tweets)} 件")
-        
-        techcrunch_articles = techcrunch_collector.collect()
-        logger.info(f"✓ TechCrunch: {len(techcrunch_articles)} 件")
-        
-        # 2. 要約処理（英語コンテンツのみ）
-        logger.info("\n[Step 2] 要約処理を開始...")
+        # 設定されたソースのコレクターを生成し、全ソースを並列に収集
+        # （ソースごとのタイムアウトと全体の締め切り付き）
+        specs = load_source_specs()
+        orchestrator = CollectionOrchestrator(create_collectors(specs))
+        summarizer = create_summarizer()
+        writers = create_writers(OUTPUT_FORMATS)
         
+        seen_index = SeenIndex() if INCREMENTAL_MODE else None
         try:
-            summarizer = GeminiSummarizer()
-        except ValueError as e:
-            logger.error(f"Gemini APIキーが設定されていません: {e}")
-            logger.info("要約処理をスキップします。記事は要約なしで出力されます。")
-            summarizer = None
-        
-        # 要約が必要なアイテムを抽出
-        items_to_summarize = []
-        
-        # 日経記事
-        for idx, article in enumerate(nikkei_articles):
-            if article.get('needs_translation'):
-                items_to_summarize.append({
-                    'type': 'nikkei',
-                    'index': idx,
-                    'text': article.get('summary', article.get('title', '')),
-                    'title': article.get('title', '')
-                })
-        
-        # Twitterツイート
-        for idx, tweet in enumerate(twitter_tweets):
-            if tweet.get('needs_translation'):
-                items_to_summarize.append({
-                    'type': 'twitter',
-                    'index': idx,
-                    'text': tweet.get('content', ''),
-                    'title': ''
-                })
-        
-        # TechCrunch記事
-        for idx, article in enumerate(techcrunch_articles):
-            if article.get('needs_translation'):
-                items_to_summarize.append({
-                    'type': 'techcrunch',
-                    'index': idx,
-                    'text': article.get('summary', article.get('title', '')),
-                    'title': article.get('title', '')
-                })
-        
-        logger.info(f"要約対象: {len(items_to_summarize)} 件")
-        
-        # 要約を実行
-        if summarizer:
-            summarized_items = summarizer.summarize_batch(items_to_summarize)
-        else:
-            # APIキーがない場合は要約なしで進む
-            summarized_items = items_to_summarize
-        
-        # 要約結果を元のデータに反映
-        for item in summarized_items:
-            summary_jp = item.get('summary_jp')
-            item_type = item.get('type')
-            index = item.get('index')
-            
-            if item_type == 'nikkei' and summary_jp:
-                nikkei_articles[index]['summary_jp'] = summary_jp
-            elif item_type == 'twitter' and summary_jp:
-                twitter_tweets[index]['summary_jp'] = summary_jp
-            elif item_type == 'techcrunch' and summary_jp:
-                techcrunch_articles[index]['summary_jp'] = summary_jp
-        
-        logger.info("✓ 要約処理が完了しました")
-        
-        # 3. Markdownファイル生成
-        logger.info("\n[Step 3] Markdownファイルを生成...")
-        
-        writer = MarkdownWriter()
-        today = datetime.now()
-        output_path = writer.write(
-            date=today,
-            nikkei_articles=nikkei_articles,
-            twitter_tweets=twitter_tweets,
-            techcrunch_articles=techcrunch_articles
-        )
-        
-        logger.info(f"✓ Markdownファイルを生成しました: {output_path}")
+            if PIPELINE_ENABLED:
+                # 2. 収集が完了したソースから順に要約（英語コンテンツのみ）
+                logger.info("[Step 2] 収集が完了したソースから順に要約します")
+                today = datetime.now()
+                pipeline = SummaryPipeline(summarizer, seen_index)
+                collected = pipeline.run(orchestrator, today)
+                log_collected(specs, collected)
+                output_paths = finalize_collected(
+                    specs, collected, today, writers, seen_index, pipeline.duplicates
+                )
+            else:
+                with metrics.timer('stage_seconds', stage='collect'):
+                    collected = orchestrator.run()
+                log_collected(specs, collected)
+                output_paths = process_collected(
+                    specs, collected, datetime.now(),
+                    summarizer=summarizer,
+                    writers=writers,
+                    seen_index=seen_index
+                )
+        finally:
+            if seen_index:
+                seen_index.close()
         
         # 完了メッセージ
         logger.info("\n" + "=" * 60)
         logger.info("処理が正常に完了しました！")
-        logger.info(f"出力ファイル: {output_path}")
+        for output_path in output_paths:
+            logger.info(f"出力ファイル: {output_path}")
         logger.info("=" * 60)
         
+        status = 'ok'
         return 0
-        
+    
     except KeyboardInterrupt:
         logger.info("\n処理がユーザーによって中断されました")
+        status = 'interrupted'
         return 1
-        
+    
     except Exception as e:
         logger.error(f"\nエラーが発生しました: {e}", exc_info=True)
         return 1
+    
+    finally:
+        # 実行レポート（ステージ・ソースごとの処理時間、API呼び出し回数など）を出力
+        if METRICS_ENABLED:
+            write_run_report(status)
 
 
 if __name__ == '__main__':
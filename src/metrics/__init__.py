@@ -0,0 +1,8 @@
+"""
+計測モジュール（処理時間・件数の記録と実行レポートの出力）
+"""
+
+from .registry import MetricsRegistry, get_metrics
+from .report import write_run_report
+
+__all__ = ['MetricsRegistry', 'get_metrics', 'write_run_report']
@@ -0,0 +1,199 @@
+"""
+カウンター・ヒストグラム・タイマーを記録するモジュール（スレッドセーフ）
+"""
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# ヒストグラムのバケット境界（秒）
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# パーセンタイル計算用に保持する観測値の最大数（超過分は計算に含めない）
+MAX_SAMPLES = 10000
+
+# (メトリクス名, ((ラベル名, 値), ...))
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _key(name: str, labels: Dict[str, object]) -> MetricKey:
+    """メトリクス名とラベルから集計キーを生成"""
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+class Histogram:
+    """観測値の件数・合計・最小・最大とバケットごとの件数"""
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.samples: List[float] = []
+    
+    def observe(self, value: float):
+        """観測値を追加"""
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(value)
+    
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        保持している観測値のパーセンタイル（最近傍法）
+        
+        Args:
+            q: 0〜100
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+    
+    def to_dict(self) -> Dict:
+        """JSONレポート用の要約"""
+        return {
+            'count': self.count,
+            'sum': round(self.sum, 6),
+            'min': self.min,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+
+class MetricsRegistry:
+    """1回の実行分のメトリクスを保持"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[MetricKey, float] = {}
+        self.histograms: Dict[MetricKey, Histogram] = {}
+        # メトリクス名ごとのバケット境界（秒以外の単位の観測値用、reset()では消去しない）
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+        self.started_at = time.time()
+    
+    def register_buckets(self, name: str, buckets: Tuple[float, ...]):
+        """
+        ヒストグラムのバケット境界を設定（既定は秒単位のDEFAULT_BUCKETS）
+        
+        Args:
+            name: メトリクス名（例: gemini_item_input_tokens）
+            buckets: バケット境界（昇順）
+        """
+        with self._lock:
+            self._buckets[name] = tuple(buckets)
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        """
+        カウンターを加算
+        
+        Args:
+            name: メトリクス名（例: gemini_retries_total）
+            value: 加算する値
+            **labels: ラベル（例: source='techcrunch'）
+        """
+        key = _key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+    
+    def observe(self, name: str, value: float, **labels):
+        """
+        ヒストグラムに観測値を追加
+        
+        Args:
+            name: メトリクス名（例: gemini_request_seconds）
+            value: 観測値
+            **labels: ラベル
+        """
+        key = _key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self._buckets.get(name, DEFAULT_BUCKETS))
+            histogram.observe(value)
+    
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """
+        withブロックの処理時間（秒）をヒストグラムに記録（例外が発生した場合も記録）
+        
+        Args:
+            name: メトリクス名（例: collect_seconds）
+            **labels: ラベル
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+    
+    def snapshot(self) -> Dict:
+        """
+        現在の値をJSONに変換できる形式で取得
+        
+        Returns:
+            Dict: {'counters': [...], 'histograms': [...]}（各要素はname, labelsと値）
+        """
+        with self._lock:
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(self.counters.items())
+            ]
+            histograms = [
+                dict({'name': name, 'labels': dict(labels)}, **histogram.to_dict())
+                for (name, labels), histogram in sorted(self.histograms.items(), key=lambda entry: entry[0])
+            ]
+        return {'counters': counters, 'histograms': histograms}
+    
+    def export(self) -> Tuple[Dict[MetricKey, float], Dict[MetricKey, Dict]]:
+        """
+        出力用に現在の値をコピーして取得
+        
+        Returns:
+            Tuple: (カウンター, ヒストグラム)。ヒストグラムは
+                buckets / bucket_counts / count / sum をキーとする辞書
+        """
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = {
+                key: {
+                    'buckets': histogram.buckets,
+                    'bucket_counts': list(histogram.bucket_counts),
+                    'count': histogram.count,
+                    'sum': histogram.sum,
+                }
+                for key, histogram in self.histograms.items()
+            }
+        return counters, histograms
+    
+    def reset(self):
+        """全メトリクスを消去（常駐実行で実行ごとに集計し直す場合など）"""
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.started_at = time.time()
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """プロセス内で共有するMetricsRegistryを取得"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+        return _registry
@@ -0,0 +1,160 @@
+"""
+実行ごとのメトリクスをファイルに出力するモジュール（JSON / Prometheus textfile）
+"""
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+from config.settings import METRICS_DIR, METRICS_PROMETHEUS_TEXTFILE, METRICS_RETENTION_DAYS
+from src.metrics.registry import MetricsRegistry, get_metrics
+from src.writers.atomic_file import atomic_open
+
+logger = logging.getLogger(__name__)
+
+# Prometheusのメトリクス名の接頭辞
+PROMETHEUS_PREFIX = 'it_trend_watcher_'
+
+
+def _format_labels(labels: Dict[str, str], extra: Optional[Dict[str, str]] = None) -> str:
+    """Prometheusのラベル表記（{key="value",...}）"""
+    merged = dict(labels, **(extra or {}))
+    if not merged:
+        return ''
+    escaped = (
+        f'{key}="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for key, value in sorted(merged.items())
+    )
+    return '{' + ','.join(escaped) + '}'
+
+
+def render_prometheus(registry: MetricsRegistry, status: str, duration: float) -> str:
+    """
+    メトリクスをPrometheusのテキスト形式に変換（node_exporterのtextfile collector用）
+    
+    Args:
+        registry: メトリクス
+        status: 実行結果
+        duration: 実行時間（秒）
+    
+    Returns:
+        str: テキスト形式のメトリクス
+    """
+    lines = []
+    typed = set()
+    counters, histograms = registry.export()
+    
+    for (name, labels), value in sorted(counters.items()):
+        metric = PROMETHEUS_PREFIX + name
+        if metric not in typed:
+            lines.append(f"# TYPE {metric} counter")
+            typed.add(metric)
+        lines.append(f"{metric}{_format_labels(dict(labels))} {value}")
+    
+    for (name, labels), histogram in sorted(histograms.items(), key=lambda entry: entry[0]):
+        metric = PROMETHEUS_PREFIX + name
+        if metric not in typed:
+            lines.append(f"# TYPE {metric} histogram")
+            typed.add(metric)
+        label_dict = dict(labels)
+        cumulative = 0
+        for bound, count in zip(histogram['buckets'], histogram['bucket_counts']):
+            cumulative += count
+            lines.append(f"{metric}_bucket{_format_labels(label_dict, {'le': repr(bound)})} {cumulative}")
+        lines.append(f"{metric}_bucket{_format_labels(label_dict, {'le': '+Inf'})} {histogram['count']}")
+        lines.append(f"{metric}_sum{_format_labels(label_dict)} {histogram['sum']}")
+        lines.append(f"{metric}_count{_format_labels(label_dict)} {histogram['count']}")
+    
+    gauges = (
+        ('last_run_timestamp_seconds', time.time()),
+        ('last_run_duration_seconds', duration),
+        ('last_run_success', 1 if status == 'ok' else 0),
+    )
+    for name, value in gauges:
+        metric = PROMETHEUS_PREFIX + name
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric} {value}")
+    
+    return '\n'.join(lines) + '\n'
+
+
+def prune_reports(metrics_dir: Path, retention_days: Optional[int] = None) -> int:
+    """
+    保持期間を過ぎた実行レポート（run_*.json）を削除
+    
+    Args:
+        metrics_dir: 実行レポートのディレクトリ
+        retention_days: 保持する日数（省略時はMETRICS_RETENTION_DAYS）
+    
+    Returns:
+        int: 削除したファイル数
+    """
+    retention_days = METRICS_RETENTION_DAYS if retention_days is None else retention_days
+    cutoff = time.time() - retention_days * 86400
+    removed = 0
+    for path in metrics_dir.glob('run_*.json'):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            # 同時に実行中の別プロセスが削除した場合など
+            continue
+    return removed
+
+
+def write_run_report(status: str = 'ok', registry: Optional[MetricsRegistry] = None,
+                     metrics_dir: Optional[Path] = None,
+                     prometheus_textfile: Optional[str] = None) -> Optional[Path]:
+    """
+    実行レポート（JSON）と、設定されていればPrometheusのtextfileを出力
+    
+    出力に失敗しても本処理は失敗させない。保持期間を過ぎた実行レポートは削除する。
+    
+    Args:
+        status: 実行結果（'ok' / 'error' / 'interrupted'）
+        registry: メトリクス（省略時は共有のレジストリ）
+        metrics_dir: JSONの出力先ディレクトリ
+        prometheus_textfile: textfileのパス（空の場合は出力しない）
+    
+    Returns:
+        Path: JSONファイルのパス（失敗した場合None）
+    """
+    registry = registry or get_metrics()
+    metrics_dir = Path(metrics_dir or METRICS_DIR)
+    textfile = METRICS_PROMETHEUS_TEXTFILE if prometheus_textfile is None else prometheus_textfile
+    
+    finished_at = time.time()
+    report = {
+        'started_at': datetime.fromtimestamp(registry.started_at).isoformat(timespec='seconds'),
+        'finished_at': datetime.fromtimestamp(finished_at).isoformat(timespec='seconds'),
+        'duration_seconds': round(finished_at - registry.started_at, 3),
+        'status': status,
+    }
+    report.update(registry.snapshot())
+    
+    try:
+        metrics_dir.mkdir(parents=True, exist_ok=True)
+        filepath = metrics_dir / f"run_{datetime.fromtimestamp(registry.started_at).strftime('%Y%m%d_%H%M%S')}.json"
+        with atomic_open(filepath) as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        logger.info(f"実行レポートを出力しました: {filepath}")
+    except Exception as e:
+        logger.error(f"実行レポートの出力に失敗: {e}")
+        return None
+    
+    try:
+        prune_reports(metrics_dir)
+    except OSError as e:
+        logger.warning(f"古い実行レポートの削除に失敗: {e}")
+    
+    if textfile:
+        try:
+            with atomic_open(Path(textfile)) as f:
+                f.write(render_prometheus(registry, status, report['duration_seconds']))
+        except Exception as e:
+            logger.error(f"Prometheus textfileの出力に失敗: {e}")
+    
+    return filepath
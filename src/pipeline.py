@@ -0,0 +1,223 @@
+"""
+収集と要約のパイプライン実行（収集が完了したソースから順に要約を始める）
+
+全ソースの収集を待ってから要約する代わりに、ソースの収集が完了するたびに要約対象の
+アイテムを有界キューに入れ、要約スレッドがキューにたまった分をまとめて要約する。
+収集（フィードの取得）と要約（Gemini APIの応答待ち）の待ち時間が重なるため、
+実行時間は各段階の合計ではなく最も遅い段階に近づく。
+"""
+import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
+
+from config.settings import (
+    PIPELINE_QUEUE_SIZE,
+    PIPELINE_BATCH_SIZE,
+    DEDUP_ENABLED,
+    ENRICH_ENABLED
+)
+from src.collectors import CollectionOrchestrator
+from src.item import Item
+from src.metrics import get_metrics
+from src.processors import GeminiSummarizer, Deduplicator
+from src.storage import SeenIndex
+
+logger = logging.getLogger(__name__)
+
+# 要約スレッドに入力の終わりを伝える番兵
+_DONE = object()
+
+
+class SummaryPipeline:
+    """コレクター → 要約スレッドを有界キューでつなぎ、収集と要約を同時に進める"""
+    
+    def __init__(self, summarizer: Optional[GeminiSummarizer],
+                 seen_index: Optional[SeenIndex] = None,
+                 queue_size: Optional[int] = None,
+                 batch_size: Optional[int] = None):
+        """
+        Args:
+            summarizer: 要約処理（Noneの場合は要約しない）
+            seen_index: 処理済みアイテムのインデックス（指定時は保存済みの要約を再利用）
+            queue_size: 要約待ちのアイテム数の上限（超えると収集結果の受け取りを待機）
+            batch_size: 1回の要約処理にまとめる最大アイテム数
+        """
+        self.summarizer = summarizer
+        self.seen_index = seen_index
+        self.batch_size = batch_size or PIPELINE_BATCH_SIZE
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size or PIPELINE_QUEUE_SIZE)
+        self.deduplicator = Deduplicator() if DEDUP_ENABLED else None
+        self.fetcher = None
+        if ENRICH_ENABLED and summarizer:
+            # HTTPクライアントの読み込みに時間がかかるため、本文を取得する場合のみimportする
+            from src.processors import ArticleFetcher
+            self.fetcher = ArticleFetcher()
+        self.metrics = get_metrics()
+        
+        # 投入済みの全アイテム（後から届いたアイテムとの重複判定用）
+        self._entries: List[Tuple[str, Item]] = []
+        # 同日の過去の実行で記録したアイテム（アイテムキーをキーとする。要約前の重複判定用）
+        self._day_entries: Dict[str, Tuple[str, Item]] = {}
+        # 最後の重複統合で除いたアイテム（ソース名をキー、処理済みとして記録する場合に使う）
+        self.duplicates: Dict[str, List[Item]] = {}
+        self._submitted = 0
+        self._started_at = 0.0
+        self._error: Optional[BaseException] = None
+        self._thread: Optional[threading.Thread] = None
+        self._cancelled = threading.Event()
+    
+    def run(self, orchestrator: CollectionOrchestrator,
+            today: Optional[datetime] = None) -> Dict[str, List[Item]]:
+        """
+        全ソースを収集しながら要約し、重複を統合した収集結果を返す
+        
+        Args:
+            orchestrator: 収集を実行するオーケストレーター
+            today: 実行日（seen_index指定時は同日の過去の実行分と合わせてから重複を統合）
+        
+        Returns:
+            Dict[str, List[Item]]: ソース名をキーとした収集結果（要約済み）
+        """
+        collected: Dict[str, List[Item]] = {name: [] for name in orchestrator.collectors}
+        today = today or datetime.now()
+        
+        if self.seen_index and self.deduplicator:
+            # 同日の過去の実行分と重複するアイテムを要約しないよう、先に読み込んでおく
+            # （最後の重複統合で除かれるため、非パイプライン実行と同じくAPIを呼ばない）
+            for source in collected:
+                for item in self.seen_index.merge_for_date(source, [], today):
+                    self._day_entries[self.seen_index.item_key(source, item)] = (source, item)
+        
+        self._started_at = time.monotonic()
+        if self.summarizer:
+            # Ctrl-Cで中断した場合に実行中の要約を待たずに終了できるよう、デーモンスレッドで実行
+            self._thread = threading.Thread(target=self._worker, name='summarize', daemon=True)
+            self._thread.start()
+        
+        results = orchestrator.iter_results()
+        try:
+            with self.metrics.timer('stage_seconds', stage='collect'):
+                for source, items in results:
+                    collected[source] = items
+                    self._submit(source, items)
+            
+            logger.info(f"要約対象: {self._submitted} 件")
+            self.metrics.inc('summarize_items_total', self._submitted)
+            
+            if self._thread:
+                self.queue.put(_DONE)
+                self._thread.join()
+        except KeyboardInterrupt:
+            # Ctrl-Cはメインスレッドにしか届かないため、要約スレッドに中断を伝えて待たずに戻る
+            self.cancel()
+            raise
+        finally:
+            # 開始前のコレクターをキャンセル（中断時はジェネレーターが途中で止まるため明示的に閉じる）
+            results.close()
+        
+        if self._thread:
+            if self._error:
+                raise self._error
+            logger.info("✓ 要約処理が完了しました")
+        
+        if self.seen_index:
+            self.seen_index.merge_collected(collected, today)
+        
+        # ソースをまたいだ重複・類似アイテムを1件にまとめる（要約済みのアイテムが代表になる）
+        if self.deduplicator:
+            with self.metrics.timer('stage_seconds', stage='dedup'):
+                self.duplicates = self.deduplicator.run(collected)
+            self.metrics.inc('dedup_removed_items_total', sum(len(items) for items in self.duplicates.values()))
+        
+        return collected
+    
+    def cancel(self):
+        """要約スレッドに中断を伝え、実行中の本文取得・要約を打ち切る（別スレッドから呼び出せる）"""
+        self._cancelled.set()
+        if self.fetcher:
+            self.fetcher.cancel()
+        if self.summarizer:
+            self.summarizer.cancel()
+    
+    def _submit(self, source: str, items: List[Item]):
+        """
+        収集が完了したソースのアイテムのうち、要約が必要なものをキューに入れる
+        
+        既に投入したアイテム・同日の過去の実行で記録したアイテムと重複・類似する
+        アイテムは、最後の重複統合で除かれるため要約しない。
+        """
+        if self.seen_index:
+            seen_count = self.seen_index.apply(source, items)
+            logger.info(f"インクリメンタルモード: {source} の処理済み {seen_count} 件の要約を再利用します")
+        
+        new_entries = [(source, item) for item in items]
+        if self.deduplicator:
+            # 今回のアイテムと同じキーの記録は今回の収集結果で置き換わるため比較しない
+            keys = {self.seen_index.item_key(source, item) for item in items} if self.seen_index else set()
+            earlier = [entry for key, entry in self._day_entries.items() if key not in keys]
+            with self.metrics.timer('stage_seconds', stage='dedup'):
+                novel = self.deduplicator.novel(earlier + self._entries, new_entries)
+            candidates = [items[idx] for idx in novel]
+        else:
+            candidates = items
+        self._entries.extend(new_entries)
+        
+        if not self.summarizer:
+            return
+        
+        for item in candidates:
+            if item.needs_translation and not item.summary_jp:
+                # 要約スレッドが追いつくまで待機する（メモリ使用量を一定に保つ）
+                self.queue.put(item)
+                self._submitted += 1
+    
+    def _worker(self):
+        """要約スレッド: キューにたまったアイテムをまとめて要約"""
+        done = False
+        while not done:
+            batch = [self.queue.get()]
+            if batch[0] is _DONE:
+                break
+            
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+            
+            # 失敗・中断した後もキューを空にし続け、収集側が待機したままにならないようにする
+            if self._error is None and not self._cancelled.is_set():
+                try:
+                    self._summarize(batch)
+                except Exception as e:
+                    self._error = e
+    
+    def _summarize(self, batch: List[Item]):
+        """1回分のアイテムの本文を取得して要約（締め切りはパイプラインの開始時点から計測）"""
+        deadline = self.summarizer.deadline
+        if deadline:
+            deadline -= time.monotonic() - self._started_at
+            if deadline <= 0:
+                logger.warning(f"要約の締め切りを超過したため {len(batch)} 件を要約なしで出力します")
+                self.metrics.inc('gemini_deadline_skipped_total', len(batch))
+                return
+        
+        logger.info(f"{len(batch)} 件の要約を開始します")
+        
+        if self.fetcher:
+            # 記事のリンク先から本文を取得（失敗・締め切り超過の記事は概要で要約する）
+            try:
+                with self.metrics.timer('stage_seconds', stage='enrich'):
+                    self.fetcher.run(batch)
+            except Exception as e:
+                logger.error(f"記事本文の取得に失敗: {e}")
+        
+        with self.metrics.timer('stage_seconds', stage='summarize'):
+            self.summarizer.summarize_batch(batch, deadline=deadline)
@@ -1,7 +1,21 @@
 """
 データ処理モジュール
+
+Gemini APIのクライアントなど読み込みに時間がかかる依存関係を含むため、各クラスは参照されたときに初めてimportする。
 """
+import importlib
+
+_EXPORTS = {
+    'GeminiSummarizer': '.gemini_summarizer',
+    'Deduplicator': '.deduplicator',
+    'ArticleFetcher': '.article_fetcher',
+}
+
+__all__ = list(_EXPORTS)
 
-from .gemini_summarizer import GeminiSummarizer
 
-__all__ = ['GeminiSummarizer']
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
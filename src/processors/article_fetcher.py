@@ -0,0 +1,286 @@
+"""
+記事本文の取得モジュール（リンク先のページから本文を取り出して要約の入力にする）
+"""
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import List, Dict, Optional
+from urllib.parse import urlsplit
+
+from config.settings import (
+    ENRICH_CACHE_DIR,
+    ENRICH_CACHE_TTL_DAYS,
+    ENRICH_MAX_WORKERS,
+    ENRICH_MAX_PER_DOMAIN,
+    ENRICH_DOMAIN_DELAY,
+    ENRICH_TIMEOUT,
+    ENRICH_DEADLINE,
+    ENRICH_MAX_BYTES,
+    ENRICH_MAX_CHARS
+)
+from src.collectors.http_client import get_http_client, ResponseTooLargeError
+from src.item import Item
+from src.metrics import get_metrics
+from src.writers.atomic_file import atomic_open
+
+logger = logging.getLogger(__name__)
+
+# 本文の候補から除く要素（ナビゲーション・広告・スクリプトなど）
+_BOILERPLATE_TAGS = (
+    'script', 'style', 'noscript', 'template', 'svg', 'iframe', 'form', 'button',
+    'nav', 'header', 'footer', 'aside', 'figure', 'figcaption',
+)
+
+# 本文として採用する段落の最小文字数（メニューやクレジット表記などの短い行を除く）
+MIN_PARAGRAPH_CHARS = 40
+
+
+def _paragraph_text(element) -> str:
+    """段落のテキスト（空白を1つにまとめる）"""
+    return ' '.join(''.join(element.itertext()).split())
+
+
+def extract_main_text(html: bytes, max_chars: Optional[int] = None) -> str:
+    """
+    HTMLから記事の本文を取り出す
+    
+    BeautifulSoupの木を作らず、lxmlで解析して定型部分の要素を除き、
+    <article>（なければ段落の文字数が最も多い親要素）の段落を連結する。
+    
+    Args:
+        html: ページのHTML
+        max_chars: 最大文字数
+    
+    Returns:
+        str: 本文（見つからない場合は空文字列）
+    """
+    # lxmlは読み込みに時間がかかるため、解析が必要になった時点でimportする
+    import lxml.html
+    from lxml import etree
+    
+    max_chars = max_chars or ENRICH_MAX_CHARS
+    try:
+        root = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return ''
+    
+    etree.strip_elements(root, *_BOILERPLATE_TAGS, with_tail=False)
+    
+    container = next(iter(root.xpath('//article | //*[@itemprop="articleBody"]')), None)
+    if container is None:
+        # 段落の文字数を親要素ごとに合計し、最も多い要素を本文とみなす
+        scores: Dict = {}
+        for paragraph in root.iter('p'):
+            parent = paragraph.getparent()
+            if parent is not None:
+                scores[parent] = scores.get(parent, 0) + len(_paragraph_text(paragraph))
+        if not scores:
+            return ''
+        container = max(scores, key=scores.get)
+    
+    paragraphs = []
+    length = 0
+    for paragraph in container.iter('p'):
+        text = _paragraph_text(paragraph)
+        if len(text) < MIN_PARAGRAPH_CHARS:
+            continue
+        paragraphs.append(text)
+        length += len(text) + 1
+        if length >= max_chars:
+            break
+    
+    return '\n'.join(paragraphs)[:max_chars]
+
+
+class ArticleFetcher:
+    """記事のリンク先を並列に取得して本文を取り出し、URLごとにディスクに保存"""
+    
+    def __init__(self, cache_dir: Optional[Path] = None,
+                 max_workers: Optional[int] = None,
+                 max_per_domain: Optional[int] = None,
+                 domain_delay: Optional[float] = None,
+                 timeout: Optional[float] = None,
+                 deadline: Optional[float] = None,
+                 max_bytes: Optional[int] = None):
+        """
+        Args:
+            cache_dir: 取り出した本文の保存先ディレクトリ
+            max_workers: 同時に取得するページ数
+            max_per_domain: 1ドメインあたりの同時リクエスト数
+            domain_delay: 同じドメインへのリクエストの最小間隔（秒）
+            timeout: ページ取得のタイムアウト（秒）
+            deadline: 本文取得全体の締め切り（秒、run()の開始時点から計測）
+            max_bytes: 取得するページの最大サイズ（バイト）
+        """
+        self.cache_dir = Path(cache_dir or ENRICH_CACHE_DIR)
+        self.max_workers = max_workers or ENRICH_MAX_WORKERS
+        self.max_per_domain = max_per_domain or ENRICH_MAX_PER_DOMAIN
+        self.domain_delay = ENRICH_DOMAIN_DELAY if domain_delay is None else domain_delay
+        self.timeout = timeout or ENRICH_TIMEOUT
+        self.deadline = deadline or ENRICH_DEADLINE
+        self.max_bytes = max_bytes or ENRICH_MAX_BYTES
+        self.ttl_seconds = ENRICH_CACHE_TTL_DAYS * 86400
+        self.client = get_http_client()
+        self.metrics = get_metrics()
+        
+        self._lock = threading.Lock()
+        self._domain_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._domain_next_at: Dict[str, float] = {}
+        # cancel()で中断された場合にセット（以降のページは取得しない）
+        self._cancelled = threading.Event()
+    
+    def cancel(self):
+        """
+        実行中のrun()を中断（別スレッドから呼び出せる、パイプライン実行でCtrl-Cを受けた場合など）
+        
+        開始前の取得は行わず、取得中のページはタイムアウトまでに終わる。
+        """
+        self._cancelled.set()
+    
+    def _cache_path(self, url: str) -> Path:
+        """URLに対応する保存先のパス"""
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.txt"
+    
+    def _load_cached(self, url: str) -> Optional[str]:
+        """保存済みの本文を取得（ない、または期限切れの場合None）"""
+        path = self._cache_path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            return path.read_text(encoding='utf-8')
+        except OSError:
+            return None
+    
+    def _store_cached(self, url: str, text: str):
+        """取り出した本文を保存（空の本文も保存し、期限まで再取得しない）"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with atomic_open(self._cache_path(url)) as f:
+                f.write(text)
+        except OSError as e:
+            logger.warning(f"記事本文の保存に失敗: {url}: {e}")
+    
+    def _acquire_domain(self, domain: str) -> threading.BoundedSemaphore:
+        """ドメインの同時リクエスト枠を確保し、前回のリクエストから最小間隔が空くまで待機"""
+        with self._lock:
+            slot = self._domain_slots.setdefault(domain, threading.BoundedSemaphore(self.max_per_domain))
+        slot.acquire()
+        
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._domain_next_at.get(domain, now))
+            self._domain_next_at[domain] = start_at + self.domain_delay
+        if start_at > now:
+            time.sleep(start_at - now)
+        return slot
+    
+    def _fetch_text(self, url: str) -> Optional[str]:
+        """
+        ページを取得して本文を取り出す
+        
+        Returns:
+            str: 本文（HTML以外・取得失敗の場合None）
+        """
+        slot = self._acquire_domain(urlsplit(url).netloc.lower())
+        try:
+            with self.metrics.timer('enrich_fetch_seconds'):
+                response = self.client.get(url, timeout=self.timeout)
+                if response.status_code != 200:
+                    response.close()
+                    logger.warning(f"記事ページの取得に失敗しました（ステータス {response.status_code}）: {url}")
+                    self.metrics.inc('enrich_errors_total', error=f"http_{response.status_code}")
+                    return None
+                content_type = response.headers.get('Content-Type', '')
+                if 'html' not in content_type:
+                    response.close()
+                    self.metrics.inc('enrich_errors_total', error='not_html')
+                    return None
+                html = self.client.read_body(response, max_bytes=self.max_bytes)
+        except ResponseTooLargeError as e:
+            logger.warning(f"{e}")
+            self.metrics.inc('enrich_errors_total', error='too_large')
+            return None
+        except Exception as e:
+            logger.warning(f"記事ページの取得中にエラーが発生: {url}: {e}")
+            self.metrics.inc('enrich_errors_total', error=type(e).__name__)
+            return None
+        finally:
+            slot.release()
+        
+        return extract_main_text(html)
+    
+    def _load_text(self, url: str) -> Optional[str]:
+        """
+        1件の本文を取得（保存済みの本文があれば取得しない）
+        
+        アイテムは更新せず、本文の格納は呼び出し元のスレッドで行う。
+        
+        Returns:
+            str: 本文（取得失敗・中断の場合None）
+        """
+        if self._cancelled.is_set():
+            return None
+        text = self._load_cached(url)
+        if text is not None:
+            self.metrics.inc('enrich_cache_lookups_total', result='hit')
+            return text
+        
+        self.metrics.inc('enrich_cache_lookups_total', result='miss')
+        text = self._fetch_text(url)
+        if text is not None:
+            self._store_cached(url, text)
+        return text
+    
+    def run(self, items: List[Item]) -> int:
+        """
+        記事の本文を取得してbodyに格納（その場で更新）
+        
+        ツイートとURLのない記事は対象外。締め切りを過ぎた分は本文なし
+        （概要での要約）のまま戻る。
+        
+        Args:
+            items: 要約対象のアイテムリスト
+        
+        Returns:
+            int: 本文を格納したアイテム数
+        """
+        targets = [
+            item for item in items
+            if item.content is None and not item.body and item.url.startswith(('http://', 'https://'))
+        ]
+        if not targets:
+            return 0
+        
+        start = time.monotonic()
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(targets)),
+            thread_name_prefix='article'
+        )
+        futures = {executor.submit(self._load_text, item.url): item for item in targets}
+        try:
+            done, pending = wait(futures, timeout=self.deadline)
+        finally:
+            # 開始前の取得はキャンセルし、締め切りを過ぎた取得は待たずに戻る
+            # （取得中のスレッドは本文をキャッシュに保存するが、アイテムには格納しない）
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+        
+        if pending:
+            logger.warning(f"本文取得の締め切り（{self.deadline}秒）を超過したため {len(pending)} 件をスキップしました")
+            self.metrics.inc('enrich_timeouts_total', len(pending))
+        
+        # 締め切りまでに完了した分だけを、このスレッドでアイテムに格納する
+        enriched = 0
+        for future in done:
+            if future.cancelled() or future.exception():
+                continue
+            text = future.result()
+            if text:
+                futures[future].body = text
+                enriched += 1
+        logger.info(f"記事本文を {enriched} 件取得しました（対象 {len(targets)} 件, {time.monotonic() - start:.1f}秒）")
+        return enriched
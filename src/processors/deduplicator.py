@@ -0,0 +1,295 @@
+"""
+重複・類似アイテムの統合モジュール（ソースをまたいだ同一記事・同一話題の検出）
+"""
+import logging
+import re
+import zlib
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from config.settings import (
+    DEDUP_THRESHOLD,
+    DEDUP_NUM_PERM,
+    DEDUP_BANDS,
+    DEDUP_SHINGLE_SIZE,
+    DEDUP_MIN_TEXT_LENGTH
+)
+from src.collectors.language import strip_html
+from src.item import Item
+
+logger = logging.getLogger(__name__)
+
+# URLから除去するトラッキング用のクエリパラメータ
+_TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'mc_cid', 'mc_eid', 'ref', 'ref_src', 'guccounter'}
+_TRACKING_PREFIXES = ('utm_',)
+
+# ハッシュ値を攪拌する乗数（32ビットの黄金比）
+_GOLDEN_RATIO_32 = 0x9E3779B1
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_URL_IN_TEXT_RE = re.compile(r'https?://\S+')
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    同じ記事を指すURLが一致するように正規化
+    
+    スキームとホストの小文字化、www.・フラグメント・トラッキング用パラメータ・
+    末尾のスラッシュの除去、クエリパラメータの並べ替えを行う。
+    
+    Args:
+        url: URL
+    
+    Returns:
+        str: 正規化したURL（解析できない場合は元の文字列）
+    """
+    if not url:
+        return ''
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    scheme = 'https' if parts.scheme in ('http', 'https') else parts.scheme.lower()
+    path = parts.path.rstrip('/') or '/'
+    
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def _item_text(item: Item) -> str:
+    """類似度の比較に使うテキスト（タイトル + 概要または本文）"""
+    body = item.summary or item.content or ''
+    text = strip_html(f"{item.title or ''} {body}")
+    text = _URL_IN_TEXT_RE.sub(' ', text)
+    return _WHITESPACE_RE.sub(' ', text).strip().lower()
+
+
+class Deduplicator:
+    """URLの正規化による完全一致と、MinHash + LSHによる類似アイテムをクラスタリング"""
+    
+    def __init__(self, threshold: Optional[float] = None,
+                 num_perm: Optional[int] = None,
+                 bands: Optional[int] = None,
+                 shingle_size: Optional[int] = None,
+                 min_text_length: Optional[int] = None):
+        """
+        Args:
+            threshold: 類似アイテムとみなす推定Jaccard係数
+            num_perm: MinHashシグネチャの長さ
+            bands: LSHのバンド数（num_permを割り切れること）
+            shingle_size: 文字n-gramの長さ（日本語・英語共通）
+            min_text_length: 類似判定の対象とするテキストの最小文字数
+        """
+        self.threshold = DEDUP_THRESHOLD if threshold is None else threshold
+        self.num_perm = num_perm or DEDUP_NUM_PERM
+        self.bands = bands or DEDUP_BANDS
+        self.shingle_size = shingle_size or DEDUP_SHINGLE_SIZE
+        self.min_text_length = DEDUP_MIN_TEXT_LENGTH if min_text_length is None else min_text_length
+        
+        if self.num_perm % self.bands:
+            raise ValueError(f"num_perm（{self.num_perm}）はbands（{self.bands}）で割り切れる必要があります")
+        self.rows = self.num_perm // self.bands
+        
+        # 同じインスタンスで何度もクラスタリングする場合（パイプライン実行）にシグネチャを再計算しない
+        self._signatures: Dict[str, Optional[Tuple[int, ...]]] = {}
+    
+    def _signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """
+        テキストのMinHashシグネチャ（類似判定には短すぎるテキストはNone）
+        
+        ハッシュ関数をnum_perm個使う代わりに、n-gramのハッシュを1回だけ計算して
+        num_perm個のビンに振り分け、ビンごとの最小値をとる（one permutation hashing）。
+        空のビンは次の空でないビンの値で埋める。計算量はn-gramの数に比例する。
+        """
+        n = self.shingle_size
+        if len(text) < max(n, self.min_text_length):
+            return None
+        
+        k = self.num_perm
+        bins = [None] * k
+        for i in range(len(text) - n + 1):
+            h = (zlib.crc32(text[i:i + n].encode('utf-8')) * _GOLDEN_RATIO_32) & 0xFFFFFFFF
+            b = (h * k) >> 32
+            if bins[b] is None or h < bins[b]:
+                bins[b] = h
+        
+        # 空のビンは後方の空でないビンの値を距離に応じてずらして借りる
+        signature = []
+        for b in range(k):
+            offset = 0
+            value = bins[b]
+            while value is None:
+                offset += 1
+                value = bins[(b + offset) % k]
+            signature.append(value + (offset << 32))
+        return tuple(signature)
+    
+    def _cached_signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """計算済みのシグネチャを再利用する_signature()"""
+        if text not in self._signatures:
+            self._signatures[text] = self._signature(text)
+        return self._signatures[text]
+    
+    def _similarity(self, sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+        """シグネチャから推定したJaccard係数"""
+        return sum(1 for h1, h2 in zip(sig1, sig2) if h1 == h2) / self.num_perm
+    
+    def cluster(self, entries: List[Tuple[str, Item]]) -> List[List[int]]:
+        """
+        アイテムをクラスタリング
+        
+        全ペアを比較せず、LSHで同じバケットに入った候補ペアのみ類似度を確認する。
+        
+        Args:
+            entries: (ソース名, アイテム)のリスト
+        
+        Returns:
+            List[List[int]]: 2件以上のクラスタごとのentriesのインデックス
+        """
+        parent = list(range(len(entries)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        def union(i: int, j: int):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        # 完全一致: 正規化したURL
+        by_url = {}
+        for idx, (_, item) in enumerate(entries):
+            url = canonicalize_url(item.url)
+            if not url or url.endswith('/status/unknown'):
+                continue
+            if url in by_url:
+                union(by_url[url], idx)
+            else:
+                by_url[url] = idx
+        
+        # 類似: MinHashのバンドごとのバケット
+        signatures = [self._cached_signature(_item_text(item)) for _, item in entries]
+        buckets = {}
+        for idx, signature in enumerate(signatures):
+            if signature is None:
+                continue
+            for band in range(self.bands):
+                key = (band, signature[band * self.rows:(band + 1) * self.rows])
+                buckets.setdefault(key, []).append(idx)
+        
+        checked = set()
+        for members in buckets.values():
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    if (i, j) in checked:
+                        continue
+                    checked.add((i, j))
+                    if find(i) != find(j) and self._similarity(signatures[i], signatures[j]) >= self.threshold:
+                        union(i, j)
+        
+        clusters = {}
+        for idx in range(len(entries)):
+            clusters.setdefault(find(idx), []).append(idx)
+        return [members for members in clusters.values() if len(members) > 1]
+    
+    @staticmethod
+    def _representative(entries: List[Tuple[str, Item]], members: List[int]) -> int:
+        """
+        クラスタの代表を選ぶ
+        
+        要約が不要なアイテム（日本語記事・要約済みのアイテム）を優先してAPI呼び出しを避け、
+        次に本文の長いアイテム、最後に収集順で選ぶ。
+        """
+        def rank(idx: int):
+            item = entries[idx][1]
+            text = item.summary or item.content or ''
+            return (bool(item.needs_translation and not item.summary_jp), -len(text), idx)
+        return min(members, key=rank)
+    
+    def novel(self, seen: List[Tuple[str, Item]], new: List[Tuple[str, Item]]) -> List[int]:
+        """
+        新しく届いたアイテムのうち、既出のアイテムと重複しないもののインデックス
+        
+        新しいアイテム同士が重複する場合は代表の1件のみを返す。収集の完了したソースから
+        順に要約する場合に、後で統合されるアイテムの要約を避けるために使う。
+        
+        Args:
+            seen: 既出の(ソース名, アイテム)のリスト
+            new: 新しく届いた(ソース名, アイテム)のリスト
+        
+        Returns:
+            List[int]: newのインデックス（昇順）
+        """
+        entries = seen + new
+        offset = len(seen)
+        
+        dropped = set()
+        for members in self.cluster(entries):
+            if members[0] < offset:
+                # 既出のアイテムと同じクラスタ（membersは昇順）
+                dropped.update(members)
+                continue
+            keep = self._representative(entries, members)
+            dropped.update(idx for idx in members if idx != keep)
+        
+        return [idx - offset for idx in range(offset, len(entries)) if idx not in dropped]
+    
+    def run(self, collected: Dict[str, List[Item]]) -> Dict[str, List[Item]]:
+        """
+        重複・類似アイテムを代表の1件に統合（その場で更新）
+        
+        代表以外のアイテムは収集結果から除き、代表の'duplicates'に
+        {'source', 'title', 'url'}として記録する。同日の過去の実行分から戻した代表が
+        既に記録しているURLは追加しない。
+        
+        Args:
+            collected: ソース名をキーとした収集結果
+        
+        Returns:
+            Dict[str, List[Item]]: ソース名をキーとした除いたアイテム（処理済みとして記録する場合に使う）
+        """
+        entries = [
+            (source, item)
+            for source, items in collected.items()
+            for item in items
+        ]
+        
+        removed = set()
+        removed_items: Dict[str, List[Item]] = {}
+        for members in self.cluster(entries):
+            keep = self._representative(entries, members)
+            representative = entries[keep][1]
+            if representative.duplicates is None:
+                representative.duplicates = []
+            duplicates = representative.duplicates
+            known_urls = {duplicate.get('url') for duplicate in duplicates}
+            for idx in members:
+                if idx == keep:
+                    continue
+                source, item = entries[idx]
+                if item.url not in known_urls:
+                    known_urls.add(item.url)
+                    duplicates.append({
+                        'source': source,
+                        'title': item.title or (item.content or '')[:80],
+                        'url': item.url,
+                    })
+                removed.add(id(item))
+                removed_items.setdefault(source, []).append(item)
+        
+        if removed:
+            for source, items in collected.items():
+                collected[source] = [item for item in items if id(item) not in removed]
+        
+        logger.info(f"重複・類似アイテムを {len(removed)} 件統合しました（{len(entries)} 件中）")
+        return removed_items
@@ -1,26 +1,64 @@
 """
 Gemini APIを使用した要約処理モジュール
 """
+import json
 import logging
-import time
-import sys
-from pathlib import Path
-from typing import Optional
-import google.generativeai as genai
-
-# プロジェクトルートをパスに追加
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List
 
 from config.settings import (
     GEMINI_API_KEY,
     GEMINI_MODEL,
     GEMINI_MAX_TOKENS,
-    GEMINI_TEMPERATURE
+    GEMINI_TEMPERATURE,
+    GEMINI_INPUT_TOKEN_BUDGET,
+    GEMINI_MAX_IN_FLIGHT,
+    GEMINI_REQUESTS_PER_MINUTE,
+    GEMINI_BURST,
+    GEMINI_MAX_RETRIES,
+    GEMINI_RETRY_BASE_DELAY,
+    GEMINI_RETRY_MAX_DELAY,
+    GEMINI_ASYNC_ENABLED,
+    GEMINI_REQUEST_TIMEOUT,
+    GEMINI_DEADLINE,
+    GEMINI_PACKING_ENABLED,
+    GEMINI_PACK_TOKEN_BUDGET,
+    GEMINI_PACK_MAX_ITEMS,
+    GEMINI_PACK_ITEM_MAX_TOKENS,
+    SUMMARY_CACHE_ENABLED
 )
+from src.processors.prompt_budget import PreparedText, estimate_tokens, prepare_text
+from src.processors.rate_limiter import TokenBucket
+from src.storage.summary_cache import SummaryCache
+from src.metrics import get_metrics
+from src.item import Item
 
 logger = logging.getLogger(__name__)
 
+# アイテムごとの入力トークン数のヒストグラムのバケット境界（概算トークン数）
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000)
+
+
+class _ItemRequest:
+    """1アイテムの要約リクエスト（整形・切り詰めとプロンプトの構築はアイテムごとに1回だけ行う）"""
+    
+    __slots__ = ('item', 'title', 'prepared', 'prompt')
+    
+    def __init__(self, item: Item, title: str, prepared: PreparedText, prompt: str):
+        """
+        Args:
+            item: 要約対象のアイテム
+            title: タイトル（ない場合は空文字列）
+            prepared: 整形・切り詰め後の入力テキスト
+            prompt: 1アイテム用のプロンプト（キャッシュキーにも使う）
+        """
+        self.item = item
+        self.title = title
+        self.prepared = prepared
+        self.prompt = prompt
+
 
 class GeminiSummarizer:
     """Gemini APIを使用して英語コンテンツを日本語要約"""
@@ -29,10 +67,75 @@ class GeminiSummarizer:
         if not GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEYが設定されていません。.envファイルを確認してください。")
         
+        # google.generativeaiは読み込みに時間がかかるため、要約を行う場合のみimportする
+        import google.generativeai as genai
+        
         genai.configure(api_key=GEMINI_API_KEY)
+        self._genai = genai
         self.model = genai.GenerativeModel(GEMINI_MODEL)
-        self.max_retries = 3
-        self.retry_delay = 2  # 秒
+        self.max_retries = GEMINI_MAX_RETRIES
+        self.retry_delay = GEMINI_RETRY_BASE_DELAY  # 秒
+        self.max_retry_delay = GEMINI_RETRY_MAX_DELAY
+        self.max_in_flight = max(1, GEMINI_MAX_IN_FLIGHT)
+        self.rate_limiter = TokenBucket(GEMINI_REQUESTS_PER_MINUTE, GEMINI_BURST)
+        self.cache = SummaryCache() if SUMMARY_CACHE_ENABLED else None
+        self.packing_enabled = GEMINI_PACKING_ENABLED
+        self.pack_token_budget = GEMINI_PACK_TOKEN_BUDGET
+        self.pack_max_items = GEMINI_PACK_MAX_ITEMS
+        self.pack_item_max_tokens = GEMINI_PACK_ITEM_MAX_TOKENS
+        self.input_token_budget = GEMINI_INPUT_TOKEN_BUDGET
+        self.async_enabled = GEMINI_ASYNC_ENABLED
+        self.request_timeout = GEMINI_REQUEST_TIMEOUT
+        self.deadline = GEMINI_DEADLINE if GEMINI_DEADLINE > 0 else None
+        self.metrics = get_metrics()
+        self.metrics.register_buckets('gemini_item_input_tokens', TOKEN_BUCKETS)
+        
+        # summarize_batch()1回あたりの送信トークン数（概算）・リクエスト数（スレッド版では複数スレッドから加算）
+        self._sent_tokens = 0
+        self._sent_requests = 0
+        self._sent_lock = threading.Lock()
+        
+        # 非同期クライアントはイベントループに結び付くため、ループを実行のたびに作り直さず使い回す
+        self._loop: Optional['asyncio.AbstractEventLoop'] = None
+        # cancel()で中断された場合にセット（以降のAPI呼び出しは行わない）
+        self._cancelled = threading.Event()
+    
+    def cancel(self):
+        """
+        実行中のsummarize_batch()を中断（別スレッドから呼び出せる）
+        
+        Ctrl-Cは要約を実行していないメインスレッドにしか届かないため、パイプライン実行で
+        中断された場合に使う。非同期版は実行中のタスクをキャンセルし、スレッド版は
+        まだ開始していないAPI呼び出しを行わない。中断後のインスタンスでは要約しない。
+        """
+        self._cancelled.set()
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            try:
+                loop.call_soon_threadsafe(self._cancel_tasks, loop)
+            except RuntimeError:
+                # 呼び出しの間にループが閉じられた場合
+                pass
+    
+    @staticmethod
+    def _cancel_tasks(loop: 'asyncio.AbstractEventLoop'):
+        """ループ上の全タスクをキャンセル（ループのスレッドで実行）"""
+        import asyncio
+        
+        for task in asyncio.all_tasks(loop):
+            task.cancel()
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        リトライ前の待機時間を計算（フルジッター付き指数バックオフ）
+        
+        Args:
+            attempt: 失敗した試行の番号（0始まり）
+        
+        Returns:
+            float: 待機時間（秒）
+        """
+        return random.uniform(0, min(self.max_retry_delay, self.retry_delay * (2 ** attempt)))
     
     def summarize(self, text: str, title: Optional[str] = None) -> Optional[str]:
         """
@@ -41,86 +144,535 @@ class GeminiSummarizer:
         Args:
             text: 要約するテキスト
             title: タイトル（オプション、コンテキストとして使用）
-            
+        
         Returns:
             str: 要約結果（エラーの場合None）
         """
-        if not text or not text.strip():
+        prepared = self._input_text(text, title)
+        if not prepared.text:
             logger.warning("要約するテキストが空です")
             return None
         
-        # プロンプトの構築
+        # 同じプロンプト・生成設定の要約はキャッシュから返す
+        prompt = self._build_prompt(prepared.text, title)
+        cached = self._get_cached(prompt, title)
+        if cached is not None:
+            logger.debug("要約をキャッシュから取得しました")
+            return cached
+        
+        self._record_item_tokens(prepared, title)
+        summary = self._generate(prompt)
+        self._store_cached(prompt, title, summary)
+        return summary
+    
+    def _input_text(self, text: Optional[str], title: Optional[str] = None) -> PreparedText:
+        """マークアップを除き、入力トークンの予算内に切り詰めたテキスト"""
+        return prepare_text(text or '', title or '', self.input_token_budget)
+    
+    def _record_item_tokens(self, prepared: PreparedText, title: Optional[str]):
+        """APIに送信するアイテムの入力トークン数（概算）を記録"""
+        self.metrics.observe('gemini_item_input_tokens', prepared.tokens)
+        if prepared.truncated:
+            self.metrics.inc('gemini_input_truncated_total')
+            logger.debug(f"入力を {prepared.original_tokens} → {prepared.tokens} トークンに切り詰めました: {title}")
+        else:
+            logger.debug(f"入力トークン数: {prepared.tokens}: {title}")
+    
+    def _record_request_tokens(self, prompt: str):
+        """送信するプロンプトのトークン数（概算）を記録"""
+        tokens = estimate_tokens(prompt)
+        self.metrics.inc('gemini_input_tokens_total', tokens)
+        with self._sent_lock:
+            self._sent_tokens += tokens
+            self._sent_requests += 1
+    
+    def _prepare_request(self, item: Item) -> Optional[_ItemRequest]:
+        """
+        アイテムの入力テキストを整形し、1アイテム用のプロンプトを構築
+        
+        Returns:
+            _ItemRequest: 要約リクエスト（テキストが空の場合はsummary_jpをNoneにしてNone）
+        """
+        title = item.title or ''
+        prepared = self._input_text(item.text, title)
+        if not prepared.text:
+            logger.warning("要約対象のテキストが見つかりません")
+            item.summary_jp = None
+            return None
+        return _ItemRequest(item, title, prepared, self._build_prompt(prepared.text, title))
+    
+    def _build_prompt(self, text: str, title: Optional[str] = None) -> str:
+        """1アイテム用のプロンプトを構築（textは_input_text()で整形・切り詰め済みのテキスト）"""
         context = f"タイトル: {title}\n\n" if title else ""
-        prompt = f"""以下の英語のテキストを、3行のプロエンジニア風日本語で要約してください。
+        return f"""以下の英語のテキストを、3行のプロエンジニア風日本語で要約してください。
 技術的な内容を正確に伝えつつ、簡潔で読みやすい形式にしてください。
 
 {context}テキスト:
 {text}
 
 要約（3行のプロエンジニア風日本語）:"""
+    
+    def _get_cached(self, prompt: str, title: Optional[str]) -> Optional[str]:
+        """1アイテム用プロンプトに対応するキャッシュ済み要約を取得"""
+        if not self.cache:
+            return None
+        key = SummaryCache.make_key(prompt, title, GEMINI_MODEL, GEMINI_TEMPERATURE, GEMINI_MAX_TOKENS)
+        cached = self.cache.get(key)
+        self.metrics.inc('summary_cache_lookups_total', result='hit' if cached is not None else 'miss')
+        return cached
+    
+    def _store_cached(self, prompt: str, title: Optional[str], summary: Optional[str]):
+        """1アイテム用プロンプトに対応する要約をキャッシュに保存"""
+        if not self.cache or not summary:
+            return
+        key = SummaryCache.make_key(prompt, title, GEMINI_MODEL, GEMINI_TEMPERATURE, GEMINI_MAX_TOKENS)
+        self.cache.set(key, summary)
+    
+    def _generate(self, prompt: str, max_output_tokens: Optional[int] = None) -> Optional[str]:
+        """
+        リトライ付きでGemini APIを呼び出し、応答テキストを返す
+        
+        Args:
+            prompt: 送信するプロンプト
+            max_output_tokens: 最大出力トークン数（省略時はGEMINI_MAX_TOKENS）
         
+        Returns:
+            str: 応答テキスト（エラーの場合None）
+        """
         # リトライロジック付きでAPI呼び出し
         for attempt in range(self.max_retries):
+            if self._cancelled.is_set():
+                return None
             try:
+                # APIクォータを超えないようにトークンを取得
+                with self.metrics.timer('gemini_rate_limit_wait_seconds'):
+                    self.rate_limiter.acquire()
                 logger.debug(f"Gemini API呼び出し中（試行 {attempt + 1}/{self.max_retries}）...")
                 
-                response = self.model.generate_content(
-                    prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        max_output_tokens=GEMINI_MAX_TOKENS,
-                        temperature=GEMINI_TEMPERATURE,
+                self.metrics.inc('gemini_requests_total')
+                self._record_request_tokens(prompt)
+                with self.metrics.timer('gemini_request_seconds'):
+                    response = self.model.generate_content(
+                        prompt,
+                        generation_config=self._generation_config(max_output_tokens),
+                        request_options={'timeout': self.request_timeout}
                     )
-                )
                 
-                if response and response.text:
-                    summary = response.text.strip()
-                    logger.debug("要約が正常に生成されました")
-                    return summary
-                else:
-                    logger.warning("Gemini APIからの応答が空でした")
-                    return None
-                    
+                return self._response_text(response)
+            
             except Exception as e:
                 logger.error(f"Gemini API呼び出しエラー（試行 {attempt + 1}/{self.max_retries}）: {e}")
+                self.metrics.inc('gemini_errors_total', error=type(e).__name__)
                 
                 if attempt < self.max_retries - 1:
                     # リトライ前に待機
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    self.metrics.inc('gemini_retries_total')
+                    # 中断された場合は待機を打ち切る
+                    self._cancelled.wait(self._backoff_delay(attempt))
                 else:
                     logger.error("最大リトライ回数に達しました")
+                    self.metrics.inc('gemini_failures_total')
                     return None
         
         return None
     
-    def summarize_batch(self, items: list) -> list:
+    async def _generate_async(self, prompt: str, max_output_tokens: Optional[int] = None) -> Optional[str]:
+        """
+        _generate()の非同期版（リトライの待機中もイベントループをブロックしない）
+        
+        応答が呼び出しごとのタイムアウト内に返らない場合はキャンセルしてリトライする。
+        
+        Args:
+            prompt: 送信するプロンプト
+            max_output_tokens: 最大出力トークン数（省略時はGEMINI_MAX_TOKENS）
+        
+        Returns:
+            str: 応答テキスト（エラーの場合None）
+        """
+        import asyncio
+        
+        for attempt in range(self.max_retries):
+            if self._cancelled.is_set():
+                return None
+            try:
+                with self.metrics.timer('gemini_rate_limit_wait_seconds'):
+                    await self.rate_limiter.acquire_async()
+                logger.debug(f"Gemini API呼び出し中（試行 {attempt + 1}/{self.max_retries}）...")
+                
+                self.metrics.inc('gemini_requests_total')
+                self._record_request_tokens(prompt)
+                with self.metrics.timer('gemini_request_seconds'):
+                    response = await asyncio.wait_for(
+                        self.model.generate_content_async(
+                            prompt,
+                            generation_config=self._generation_config(max_output_tokens)
+                        ),
+                        timeout=self.request_timeout
+                    )
+                
+                return self._response_text(response)
+            
+            except asyncio.TimeoutError:
+                # wait_for()のタイムアウトはメッセージが空のため、エラー内容を補う
+                logger.error(f"Gemini API呼び出しがタイムアウトしました（試行 {attempt + 1}/{self.max_retries}, {self.request_timeout}秒）")
+                self.metrics.inc('gemini_errors_total', error='TimeoutError')
+            except Exception as e:
+                logger.error(f"Gemini API呼び出しエラー（試行 {attempt + 1}/{self.max_retries}）: {e}")
+                self.metrics.inc('gemini_errors_total', error=type(e).__name__)
+            
+            if attempt < self.max_retries - 1:
+                self.metrics.inc('gemini_retries_total')
+                await asyncio.sleep(self._backoff_delay(attempt))
+            else:
+                logger.error("最大リトライ回数に達しました")
+                self.metrics.inc('gemini_failures_total')
+        
+        return None
+    
+    def _generation_config(self, max_output_tokens: Optional[int] = None):
+        """生成設定（最大出力トークン数の省略時はGEMINI_MAX_TOKENS）"""
+        return self._genai.types.GenerationConfig(
+            max_output_tokens=max_output_tokens or GEMINI_MAX_TOKENS,
+            temperature=GEMINI_TEMPERATURE,
+        )
+    
+    def _response_text(self, response) -> Optional[str]:
+        """応答のテキスト（空の場合None）"""
+        # 実際の課金対象のトークン数（応答に含まれる場合のみ）
+        usage = getattr(response, 'usage_metadata', None)
+        if usage:
+            self.metrics.inc('gemini_usage_input_tokens_total', getattr(usage, 'prompt_token_count', 0) or 0)
+            self.metrics.inc('gemini_usage_output_tokens_total', getattr(usage, 'candidates_token_count', 0) or 0)
+        
+        if response and response.text:
+            logger.debug("要約が正常に生成されました")
+            return response.text.strip()
+        
+        logger.warning("Gemini APIからの応答が空でした")
+        self.metrics.inc('gemini_empty_responses_total')
+        return None
+    
+    def _summarize_item(self, item: Item) -> Item:
+        """1アイテムを要約し、結果を'summary_jp'に格納"""
+        text = item.text
+        title = item.title or ''
+        
+        if not text:
+            logger.warning("要約対象のテキストが見つかりません")
+            item.summary_jp = None
+            return item
+        
+        item.summary_jp = self.summarize(text, title)
+        return item
+    
+    async def _summarize_item_async(self, item: Item) -> Item:
+        """_summarize_item()の非同期版"""
+        request = self._prepare_request(item)
+        if request is None:
+            return item
+        
+        cached = self._get_cached(request.prompt, request.title)
+        if cached is not None:
+            item.summary_jp = cached
+            return item
+        
+        self._record_item_tokens(request.prepared, request.title)
+        await self._summarize_uncached_async(request)
+        return item
+    
+    def _summarize_uncached(self, request: _ItemRequest):
+        """キャッシュを参照せずに1アイテムを要約し、結果をキャッシュに保存"""
+        request.item.summary_jp = self._generate(request.prompt)
+        self._store_cached(request.prompt, request.title, request.item.summary_jp)
+    
+    async def _summarize_uncached_async(self, request: _ItemRequest):
+        """_summarize_uncached()の非同期版"""
+        request.item.summary_jp = await self._generate_async(request.prompt)
+        self._store_cached(request.prompt, request.title, request.item.summary_jp)
+    
+    def _build_pack_prompt(self, pack: List[_ItemRequest]) -> str:
+        """複数アイテムを1リクエストにまとめるプロンプトを構築"""
+        blocks = []
+        for number, request in enumerate(pack, 1):
+            context = f"タイトル: {request.title}\n" if request.title else ""
+            blocks.append(f"[{number}]\n{context}テキスト:\n{request.prepared.text}")
+        
+        joined = '\n\n'.join(blocks)
+        return f"""以下の{len(pack)}件の英語のテキストを、それぞれ3行のプロエンジニア風日本語で要約してください。
+技術的な内容を正確に伝えつつ、簡潔で読みやすい形式にしてください。
+
+出力は次の形式のJSON配列のみとし、全ての番号を含めてください:
+[{{"id": 1, "summary": "要約"}}, {{"id": 2, "summary": "要約"}}]
+
+{joined}
+
+JSON:"""
+    
+    @staticmethod
+    def _parse_pack_response(text: str, count: int) -> Optional[List[str]]:
         """
-        複数のアイテムをバッチで要約
+        パック要約の応答をアイテムごとの要約に分解
+        
+        Args:
+            text: Gemini APIの応答テキスト
+            count: パック内のアイテム数
+        
+        Returns:
+            List[str]: 番号順の要約リスト（形式が不正・欠落がある場合None）
+        """
+        if not text:
+            return None
+        
+        # コードブロックなどの前後の文字列を除いてJSON配列部分のみを取り出す
+        start = text.find('[')
+        end = text.rfind(']')
+        if start < 0 or end <= start:
+            return None
+        
+        try:
+            entries = json.loads(text[start:end + 1])
+        except ValueError:
+            return None
+        
+        summaries = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            summary = entry.get('summary')
+            try:
+                number = int(entry.get('id'))
+            except (TypeError, ValueError):
+                continue
+            if isinstance(summary, str) and summary.strip():
+                summaries[number] = summary.strip()
+        
+        if any(number not in summaries for number in range(1, count + 1)):
+            return None
+        
+        return [summaries[number] for number in range(1, count + 1)]
+    
+    def _summarize_pack(self, pack: List[_ItemRequest]) -> List[_ItemRequest]:
+        """
+        複数アイテムを1リクエストで要約（解析に失敗した場合はアイテムごとに要約）
+        
+        キャッシュの確認は_build_work_units()で済ませているため、ここでは行わない。
+        
+        Args:
+            pack: 要約リクエストのリスト
+        
+        Returns:
+            List[_ItemRequest]: 各アイテムのsummary_jpを格納したリクエストのリスト
+        """
+        if len(pack) == 1:
+            self._summarize_uncached(pack[0])
+            return pack
+        
+        response = self._generate(
+            self._build_pack_prompt(pack),
+            max_output_tokens=GEMINI_MAX_TOKENS * len(pack)
+        )
+        summaries = self._parse_pack_response(response, len(pack))
+        
+        if summaries is None:
+            logger.warning(f"パック要約の解析に失敗したため、{len(pack)} 件を個別に要約します")
+            self.metrics.inc('gemini_pack_fallbacks_total')
+            for request in pack:
+                self._summarize_uncached(request)
+            return pack
+        
+        self._apply_pack_summaries(pack, summaries)
+        return pack
+    
+    async def _summarize_pack_async(self, pack: List[_ItemRequest]) -> List[_ItemRequest]:
+        """_summarize_pack()の非同期版"""
+        if len(pack) == 1:
+            await self._summarize_uncached_async(pack[0])
+            return pack
+        
+        response = await self._generate_async(
+            self._build_pack_prompt(pack),
+            max_output_tokens=GEMINI_MAX_TOKENS * len(pack)
+        )
+        summaries = self._parse_pack_response(response, len(pack))
+        
+        if summaries is None:
+            logger.warning(f"パック要約の解析に失敗したため、{len(pack)} 件を個別に要約します")
+            self.metrics.inc('gemini_pack_fallbacks_total')
+            for request in pack:
+                await self._summarize_uncached_async(request)
+            return pack
+        
+        self._apply_pack_summaries(pack, summaries)
+        return pack
+    
+    def _apply_pack_summaries(self, pack: List[_ItemRequest], summaries: List[str]):
+        """パック要約の結果を各アイテムに格納してキャッシュに保存"""
+        for request, summary in zip(pack, summaries):
+            request.item.summary_jp = summary
+            # 個別要約と同じキーで保存し、次回以降はパックせずにキャッシュから返せるようにする
+            self._store_cached(request.prompt, request.title, summary)
+    
+    def _build_work_units(self, items: List[Item]) -> List[List[_ItemRequest]]:
+        """
+        要約対象のアイテムをリクエスト単位にまとめる
+        
+        空テキストとキャッシュ済みのアイテムはその場で結果を格納し、
+        短いアイテムはトークン予算内でパックにまとめる。入力テキストの整形と
+        プロンプトの構築はここで1回だけ行い、リクエストに保持して以降の処理で使う。
         
         Args:
             items: 要約対象のアイテムリスト
-                各アイテムは辞書で、'text'と'title'（オプション）を含む
         
         Returns:
-            list: 要約結果を含むアイテムリスト
+            List[List[_ItemRequest]]: リクエストごとの要約リクエストのリスト
         """
-        results = []
+        units = []
+        pack = []
+        pack_tokens = 0
         
         for item in items:
-            text = item.get('text', item.get('content', item.get('summary', '')))
-            title = item.get('title', '')
+            request = self._prepare_request(item)
+            if request is None:
+                continue
             
-            if not text:
-                logger.warning("要約対象のテキストが見つかりません")
-                item['summary_jp'] = None
-                results.append(item)
+            cached = self._get_cached(request.prompt, request.title)
+            if cached is not None:
+                item.summary_jp = cached
                 continue
             
-            summary = self.summarize(text, title)
-            item['summary_jp'] = summary
+            self._record_item_tokens(request.prepared, request.title)
+            tokens = request.prepared.tokens + estimate_tokens(request.title)
+            if tokens > self.pack_item_max_tokens:
+                units.append([request])
+                continue
             
-            # APIレート制限を考慮して少し待機
-            time.sleep(0.5)
+            if pack and (pack_tokens + tokens > self.pack_token_budget or len(pack) >= self.pack_max_items):
+                units.append(pack)
+                pack = []
+                pack_tokens = 0
             
-            results.append(item)
+            pack.append(request)
+            pack_tokens += tokens
+        
+        if pack:
+            units.append(pack)
+        
+        return units
+    
+    def summarize_batch(self, items: List[Item], deadline: Optional[float] = None) -> List[Item]:
+        """
+        複数のアイテムを並列に要約
+        
+        同時実行数はmax_in_flight、リクエスト頻度はトークンバケットで制限する。
+        パッキングが有効な場合、短いアイテムは複数件を1リクエストにまとめる。
+        
+        Args:
+            items: 要約対象のアイテムリスト（要約はsummary_jpにその場で格納）
+            deadline: 締め切り（秒、省略時はGEMINI_DEADLINE、非同期版のみ）
+        
+        Returns:
+            List[Item]: 入力と同じアイテムリスト
+        """
+        if not items:
+            return []
+        
+        with self._sent_lock:
+            self._sent_tokens = 0
+            self._sent_requests = 0
+        
+        if self.packing_enabled:
+            units = self._build_work_units(items)
+            logger.info(f"要約リクエスト数: {len(units)} 件（対象 {len(items)} 件）")
+        else:
+            units = items
+        
+        if units and self.async_enabled:
+            worker = self._summarize_pack_async if self.packing_enabled else self._summarize_item_async
+            self._run_async(self._summarize_units_async(units, worker, deadline or self.deadline))
+        elif units:
+            worker = self._summarize_pack if self.packing_enabled else self._summarize_item
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_in_flight, len(units)),
+                thread_name_prefix='gemini'
+            ) as executor:
+                list(executor.map(worker, units))
         
-        return results
+        if self.cache:
+            self.cache.log_stats()
+        
+        if self._sent_requests:
+            logger.info(f"入力トークン数（概算）: {self._sent_tokens} トークン（{self._sent_requests} リクエスト, "
+                        f"平均 {self._sent_tokens // self._sent_requests} トークン/リクエスト）")
+        
+        # 結果は各アイテムに直接格納されるため、入力の順序がそのまま保たれる
+        return items
+    
+    async def _summarize_units_async(self, units: list, worker, deadline: Optional[float] = None):
+        """
+        リクエスト単位ごとにタスクを作成して並行に要約
+        
+        同時実行数はmax_in_flightで制限し、締め切りを過ぎた時点で未完了のタスクは
+        キャンセルする（そのアイテムは要約なしのまま出力される）。
+        
+        Args:
+            units: リクエスト単位（パックまたはアイテム）のリスト
+            worker: 1単位を要約するコルーチン関数
+            deadline: 締め切り（秒、Noneで無制限）
+        """
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        
+        async def run(unit):
+            async with semaphore:
+                await worker(unit)
+        
+        tasks = [asyncio.ensure_future(run(unit)) for unit in units]
+        try:
+            done, pending = await asyncio.wait(tasks, timeout=deadline)
+        finally:
+            # 締め切り超過・中断のいずれの場合も実行中のAPI呼び出しを確実にキャンセルする
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if pending:
+            skipped = sum(
+                len(unit) if isinstance(unit, list) else 1
+                for unit, task in zip(units, tasks)
+                if task in pending
+            )
+            logger.warning(f"要約の締め切り（{deadline:g}秒）を超過したため {skipped} 件を要約なしで出力します")
+            self.metrics.inc('gemini_deadline_skipped_total', skipped)
+        
+        for task in done:
+            # スレッド版と同様に、要約処理中の予期しない例外は呼び出し元に伝える
+            task.result()
+    
+    def _run_async(self, coro):
+        """
+        コルーチンをこのインスタンスのイベントループで実行
+        
+        Ctrl-Cで中断された場合は、残りのタスクをキャンセルして終了を待ってから
+        KeyboardInterruptを送出する（API呼び出しの完了を待たずにすぐ戻る）。
+        cancel()で中断された場合は結果を待たずに戻る。
+        """
+        # asyncioは読み込みに時間がかかるため、非同期版で要約する場合のみimportする
+        import asyncio
+        
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        
+        try:
+            return self._loop.run_until_complete(coro)
+        except asyncio.CancelledError:
+            if not self._cancelled.is_set():
+                raise
+            logger.info("要約が中断されました")
+            return None
+        except KeyboardInterrupt:
+            tasks = asyncio.all_tasks(self._loop)
+            for task in tasks:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            raise
@@ -0,0 +1,209 @@
+"""
+要約の入力テキストの整形モジュール（マークアップの除去とトークン予算内への切り詰め）
+"""
+import re
+from collections import Counter
+from typing import List, Optional
+
+from config.settings import GEMINI_INPUT_TOKEN_BUDGET, GEMINI_INPUT_LEAD_RATIO
+from src.analytics.tokenizer import tokenize
+from src.collectors.language import strip_html
+
+# 中身ごと除く要素（タグだけを除くとスクリプトやCSSが本文として残る）
+_BLOCK_RE = re.compile(r'<(script|style|noscript)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+# 文の区切り（英語は終止符と空白、日本語は句点の直後）
+_SENTENCE_END_RE = re.compile(r'(?<=[.!?])\s+|(?<=[。！？])')
+
+# 切り詰めた箇所に挟む記号
+ELLIPSIS = ' … '
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    入力トークン数を概算（英数字は約4文字、それ以外は1文字で1トークン）
+    
+    Args:
+        text: 対象テキスト
+    
+    Returns:
+        int: 概算トークン数
+    """
+    if not text:
+        return 0
+    ascii_chars = sum(1 for c in text if c.isascii())
+    return ascii_chars // 4 + (len(text) - ascii_chars) + 1
+
+
+class PreparedText:
+    """整形・切り詰め後の入力テキスト"""
+    
+    __slots__ = ('text', 'tokens', 'original_tokens', 'truncated')
+    
+    def __init__(self, text: str, tokens: int, original_tokens: int, truncated: bool):
+        """
+        Args:
+            text: 整形・切り詰め後のテキスト
+            tokens: 整形・切り詰め後の概算トークン数
+            original_tokens: 整形前の概算トークン数
+            truncated: 予算を超えたため切り詰めたか
+        """
+        self.text = text
+        self.tokens = tokens
+        self.original_tokens = original_tokens
+        self.truncated = truncated
+
+
+def clean_text(text: str) -> str:
+    """
+    HTMLのタグ・スクリプト・文字参照を除き、空白を1つにまとめる
+    
+    Args:
+        text: HTMLを含む可能性のあるテキスト
+    
+    Returns:
+        str: 整形したテキスト
+    """
+    if not text:
+        return ''
+    if '<' in text:
+        text = _BLOCK_RE.sub(' ', text)
+    return _WHITESPACE_RE.sub(' ', strip_html(text)).strip()
+
+
+def _cut(text: str, max_tokens: int) -> str:
+    """概算トークン数が「…」を含めてmax_tokens以下になる位置でテキストを切る（英語は単語の途中で切らない）"""
+    marker = ELLIPSIS.strip()
+    # estimate_tokensと同じ計算（末尾に付ける「 …」の分を含める）
+    ascii_chars = 1
+    other_chars = len(marker)
+    for end, char in enumerate(text):
+        if char.isascii():
+            ascii_chars += 1
+        else:
+            other_chars += 1
+        if ascii_chars // 4 + other_chars + 1 > max_tokens:
+            head = text[:end]
+            space = head.rfind(' ')
+            if space > len(head) // 2:
+                head = head[:space]
+            head = head.rstrip()
+            return f"{head} {marker}" if head else (marker if estimate_tokens(marker) <= max_tokens else '')
+    return text
+
+
+def _sentence_scores(sentences: List[str], title: str = '') -> List[float]:
+    """
+    文ごとの重要度（0〜2）
+    
+    テキスト全体で繰り返し出現する語（記事の主題）の多さと、タイトルの語を含む割合の和。
+    """
+    terms = [set(tokenize(sentence)) for sentence in sentences]
+    frequency = Counter(term for sentence_terms in terms for term in sentence_terms)
+    title_terms = set(tokenize(title))
+    
+    density = [
+        sum(frequency[term] for term in sentence_terms) / (len(sentence_terms) + 1)
+        for sentence_terms in terms
+    ]
+    top = max(density) or 1.0
+    return [
+        density[index] / top + (len(sentence_terms & title_terms) / len(title_terms) if title_terms else 0.0)
+        for index, sentence_terms in enumerate(terms)
+    ]
+
+
+def _join(sentences: List[str], selected: List[int]) -> str:
+    """選んだ文を元の順序で連結し、省いた箇所に「…」を挟む"""
+    parts = []
+    previous = -1
+    for index in sorted(selected):
+        if parts and index != previous + 1:
+            parts.append(ELLIPSIS.strip())
+        parts.append(sentences[index].strip())
+        previous = index
+    if previous != len(sentences) - 1:
+        parts.append(ELLIPSIS.strip())
+    return ' '.join(parts)
+
+
+def truncate_text(text: str, max_tokens: int, lead_ratio: Optional[float] = None, title: str = '') -> str:
+    """
+    テキストを予算内に切り詰める（冒頭の文 + 重要な文）
+    
+    予算のlead_ratioまでは冒頭から順に文を残し（ニュースは冒頭に要点がある）、
+    残りの予算で以降の文から重要度（主題の語・タイトルの語を含む度合い）の高い文を選ぶ。選んだ文は元の順序で連結し、
+    省いた箇所には「…」を挟む。
+    
+    Args:
+        text: 整形済みのテキスト
+        max_tokens: 概算トークン数の上限
+        lead_ratio: 冒頭の文に割り当てる予算の割合
+        title: タイトル（重要な文の判定に使用）
+    
+    Returns:
+        str: 切り詰めたテキスト（予算内の場合はそのまま）
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    
+    lead_ratio = GEMINI_INPUT_LEAD_RATIO if lead_ratio is None else lead_ratio
+    sentences = [sentence for sentence in _SENTENCE_END_RE.split(text) if sentence.strip()]
+    costs = [estimate_tokens(sentence) + 1 for sentence in sentences]
+    ellipsis_cost = estimate_tokens(ELLIPSIS)
+    
+    # 冒頭の文（最初の文だけで予算を超える場合はその文を切る）
+    if costs[0] + ellipsis_cost > max_tokens:
+        return _cut(text, max_tokens)
+    
+    selected = []
+    used = ellipsis_cost
+    for index, cost in enumerate(costs):
+        if selected and used + cost > max_tokens * lead_ratio:
+            break
+        selected.append(index)
+        used += cost
+    
+    # 残りの予算で重要度の高い文を選ぶ（省略箇所の記号の分も予算に含める）
+    rest = range(len(selected), len(sentences))
+    scores = _sentence_scores(sentences, title)
+    for index in sorted(rest, key=lambda i: scores[i], reverse=True):
+        cost = costs[index] + ellipsis_cost
+        if used + cost <= max_tokens:
+            selected.append(index)
+            used += cost
+    
+    # 文ごとの概算の合計は連結後の概算とずれることがあるため、予算を超える場合は優先度の低い文から除く
+    result = _join(sentences, selected)
+    while estimate_tokens(result) > max_tokens and len(selected) > 1:
+        selected.pop()
+        result = _join(sentences, selected)
+    if estimate_tokens(result) > max_tokens:
+        return _cut(text, max_tokens)
+    return result
+
+
+def prepare_text(text: str, title: str = '', max_tokens: Optional[int] = None) -> PreparedText:
+    """
+    要約の入力テキストを整形し、トークン予算内に切り詰める
+    
+    呼び出し元はアイテムごとに1回だけ呼び、結果をパッキングの判定・プロンプトの構築・
+    キャッシュキーの計算で使い回す（本文が大きいため結果はキャッシュしない）。
+    
+    Args:
+        text: アイテムのテキスト（HTMLを含む可能性がある）
+        title: タイトル（切り詰める場合の重要な文の判定に使用）
+        max_tokens: 概算トークン数の上限（省略時はGEMINI_INPUT_TOKEN_BUDGET）
+    
+    Returns:
+        PreparedText: 整形・切り詰め後のテキスト
+    """
+    max_tokens = max_tokens or GEMINI_INPUT_TOKEN_BUDGET
+    cleaned = clean_text(text)
+    prepared = truncate_text(cleaned, max_tokens, title=clean_text(title))
+    return PreparedText(
+        text=prepared,
+        tokens=estimate_tokens(prepared),
+        original_tokens=estimate_tokens(text),
+        truncated=prepared != cleaned
+    )
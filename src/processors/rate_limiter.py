@@ -0,0 +1,76 @@
+"""
+トークンバケット方式のレート制限モジュール
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """スレッドセーフなトークンバケット（APIのクォータに合わせてリクエストを平準化）"""
+    
+    def __init__(self, rate_per_minute: float, capacity: int = 1):
+        """
+        Args:
+            rate_per_minute: 1分あたりに補充されるトークン数（0以下で無制限）
+            capacity: バケットの容量（バーストで許容するリクエスト数）
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self):
+        """経過時間に応じてトークンを補充（ロック取得済みで呼び出す）"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+    
+    def _reserve(self, tokens: float) -> float:
+        """
+        トークンの取得を試みる
+        
+        Returns:
+            float: 取得できた場合0、できなかった場合は補充されるまでの待機時間（秒）
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+    
+    def acquire(self, tokens: float = 1.0):
+        """
+        トークンを取得できるまでブロック
+        
+        Args:
+            tokens: 消費するトークン数
+        """
+        if self.rate <= 0:
+            return
+        
+        while True:
+            wait_time = self._reserve(tokens)
+            if not wait_time:
+                return
+            time.sleep(wait_time)
+    
+    async def acquire_async(self, tokens: float = 1.0):
+        """
+        トークンを取得できるまで待機（イベントループはブロックしない）
+        
+        Args:
+            tokens: 消費するトークン数
+        """
+        if self.rate <= 0:
+            return
+        
+        # asyncioは読み込みに時間がかかるため、非同期版を使う場合のみimportする
+        import asyncio
+        
+        while True:
+            wait_time = self._reserve(tokens)
+            if not wait_time:
+                return
+            await asyncio.sleep(wait_time)
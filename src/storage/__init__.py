@@ -0,0 +1,21 @@
+"""
+永続化モジュール
+
+各クラスは参照されたときに初めてimportする。
+"""
+import importlib
+
+_EXPORTS = {
+    'SummaryCache': '.summary_cache',
+    'SeenIndex': '.seen_index',
+    'ArticleStore': '.article_store',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
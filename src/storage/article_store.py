@@ -0,0 +1,223 @@
+"""
+収集したアイテムの履歴を保存・検索するモジュール（SQLite）
+"""
+import hashlib
+import logging
+import sqlite3
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from config.settings import ARTICLE_STORE_PATH
+from src.item import Item
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleStore:
+    """全ソースのアイテムをURLのハッシュをキーに蓄積し、期間・ソース・全文で検索"""
+    
+    # 検索結果として返す列
+    COLUMNS = ('source', 'title', 'url', 'published', 'username', 'summary', 'summary_jp', 'content')
+    
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: SQLiteファイルのパス
+        """
+        self.path = Path(path or ARTICLE_STORE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(str(self.path))
+        # WALモード: 書き込み中も検索（CLI）をブロックしない
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,
+                url_hash TEXT NOT NULL UNIQUE,
+                source TEXT NOT NULL,
+                title TEXT,
+                url TEXT,
+                published TEXT,
+                username TEXT,
+                summary TEXT,
+                summary_jp TEXT,
+                content TEXT,
+                first_seen_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_articles_source_published ON articles(source, published)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published)")
+        self.fts_enabled = self._create_fts()
+        self._conn.commit()
+    
+    def _create_fts(self) -> bool:
+        """全文検索用のFTS5テーブルとトリガーを作成（FTS5が使えない場合はFalse）"""
+        try:
+            self._conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                    title, summary, summary_jp,
+                    content='articles', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5が利用できないため、全文検索は部分一致で行います: {e}")
+            return False
+        
+        # 本体テーブルの変更をFTSインデックスに反映
+        self._conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts(rowid, title, summary, summary_jp)
+                VALUES (new.id, new.title, new.summary, new.summary_jp);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, summary, summary_jp)
+                VALUES ('delete', old.id, old.title, old.summary, old.summary_jp);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, summary, summary_jp)
+                VALUES ('delete', old.id, old.title, old.summary, old.summary_jp);
+                INSERT INTO articles_fts(rowid, title, summary, summary_jp)
+                VALUES (new.id, new.title, new.summary, new.summary_jp);
+            END;
+        """)
+        return True
+    
+    @staticmethod
+    def url_hash(source: str, item: Item) -> str:
+        """
+        アイテムのキー（URLのハッシュ、URLがない場合はソース名と本文のハッシュ）
+        
+        Args:
+            source: ソース名
+            item: 収集したアイテム
+        
+        Returns:
+            str: SHA-1の16進文字列
+        """
+        url = item.url
+        if url and not url.endswith('/status/unknown'):
+            key = url
+        else:
+            key = f"{source}:" + (item.title or item.content or '')
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _format_published(published) -> Optional[str]:
+        """公開日時を辞書順で比較できる文字列に変換（タイムゾーン付きはUTCに変換）"""
+        if not isinstance(published, datetime):
+            return published
+        if published.tzinfo is not None:
+            # フィードの解析結果・他の出力形式と同じく、UTCのnaive datetimeに揃える
+            published = published.astimezone(timezone.utc).replace(tzinfo=None)
+        return published.strftime('%Y-%m-%d %H:%M:%S')
+    
+    def upsert(self, source: str, items: List[Item]) -> int:
+        """
+        アイテムを一括で保存（既存のアイテムは内容を更新、要約は新しい値がある場合のみ更新）
+        
+        Args:
+            source: ソース名
+            items: アイテムのリスト
+        
+        Returns:
+            int: 保存したアイテム数
+        """
+        now = time.time()
+        rows = [
+            (
+                self.url_hash(source, item),
+                source,
+                item.title,
+                item.url,
+                self._format_published(item.published),
+                item.username,
+                item.summary,
+                item.summary_jp or None,
+                item.content,
+                now,
+                now,
+            )
+            for item in items
+        ]
+        
+        with self._conn:
+            self._conn.executemany("""
+                INSERT INTO articles (url_hash, source, title, url, published, username,
+                                      summary, summary_jp, content, first_seen_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url_hash) DO UPDATE SET
+                    title = excluded.title,
+                    published = excluded.published,
+                    summary = excluded.summary,
+                    summary_jp = COALESCE(excluded.summary_jp, articles.summary_jp),
+                    content = excluded.content,
+                    updated_at = excluded.updated_at
+            """, rows)
+        
+        return len(rows)
+    
+    def search(self, query: Optional[str] = None, source: Optional[str] = None,
+               since: Optional[str] = None, until: Optional[str] = None,
+               limit: int = 20) -> List[Dict]:
+        """
+        アイテムを検索（新しい順）
+        
+        Args:
+            query: 全文検索のキーワード（タイトル・概要・AI要約が対象）
+            source: ソース名で絞り込み
+            since: この日付（YYYY-MM-DD）以降に公開されたアイテム
+            until: この日付（YYYY-MM-DD）以前に公開されたアイテム
+            limit: 最大件数
+        
+        Returns:
+            List[Dict]: COLUMNSをキーとするアイテムのリスト
+        """
+        columns = ', '.join(f"a.{column}" for column in self.COLUMNS)
+        sql = f"SELECT {columns} FROM articles a"
+        conditions = []
+        params = []
+        
+        if query:
+            # trigramトークナイザーは3文字未満の語を扱えないため、短いキーワードは部分一致で検索
+            if self.fts_enabled and len(query) >= 3:
+                sql += " JOIN articles_fts f ON f.rowid = a.id"
+                conditions.append("articles_fts MATCH ?")
+                params.append('"' + query.replace('"', '""') + '"')
+            else:
+                conditions.append("(a.title LIKE ? OR a.summary LIKE ? OR a.summary_jp LIKE ?)")
+                params.extend([f"%{query}%"] * 3)
+        if source:
+            conditions.append("a.source = ?")
+            params.append(source)
+        if since:
+            conditions.append("a.published >= ?")
+            params.append(since)
+        if until:
+            conditions.append("a.published < date(?, '+1 day')")
+            params.append(until)
+        
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY a.published DESC LIMIT ?"
+        params.append(limit)
+        
+        rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip(self.COLUMNS, row)) for row in rows]
+    
+    def count(self, source: Optional[str] = None) -> int:
+        """保存済みのアイテム数"""
+        if source:
+            row = self._conn.execute("SELECT COUNT(*) FROM articles WHERE source = ?", (source,)).fetchone()
+        else:
+            row = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+        return row[0]
+    
+    def close(self):
+        """データベース接続を閉じる"""
+        self._conn.close()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+記事履歴の検索スクリプト
+
+使用例:
+    python -m src.storage.query "OpenAI" --source techcrunch --since 2026-09-01
+"""
+import argparse
+import sys
+
+from src.storage.article_store import ArticleStore
+
+
+def main(argv=None) -> int:
+    """検索条件を受け取り、該当するアイテムを新しい順に表示"""
+    parser = argparse.ArgumentParser(description='収集済みアイテムの履歴を検索')
+    parser.add_argument('query', nargs='?', help='検索キーワード（タイトル・概要・AI要約）')
+    parser.add_argument('--source', help='ソース名（例: techcrunch）')
+    parser.add_argument('--since', help='この日付以降（YYYY-MM-DD）')
+    parser.add_argument('--until', help='この日付以前（YYYY-MM-DD）')
+    parser.add_argument('--limit', type=int, default=20, help='最大件数（既定: 20）')
+    parser.add_argument('--db', help='データベースファイルのパス')
+    args = parser.parse_args(argv)
+    
+    store = ArticleStore(args.db)
+    try:
+        results = store.search(
+            query=args.query,
+            source=args.source,
+            since=args.since,
+            until=args.until,
+            limit=args.limit
+        )
+    finally:
+        store.close()
+    
+    for item in results:
+        title = item['title'] or (item['content'] or '')[:80].replace('\n', ' ')
+        print(f"{item['published'] or '-'}  [{item['source']}]  {title}")
+        print(f"    {item['url']}")
+        if item['summary_jp']:
+            print(f"    {item['summary_jp']}")
+    
+    print(f"\n{len(results)} 件")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+処理済みアイテムのインデックスモジュール（インクリメンタルモード用）
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Optional
+
+from config.settings import SEEN_INDEX_PATH, SEEN_INDEX_RETENTION_DAYS
+from src.item import Item
+
+logger = logging.getLogger(__name__)
+
+
+class SeenIndex:
+    """エントリーのURL（またはIDの代替となるハッシュ）をキーに処理済みアイテムを記録"""
+    
+    def __init__(self, path: Optional[Path] = None, retention_days: Optional[int] = None):
+        """
+        Args:
+            path: SQLiteファイルのパス
+            retention_days: 処理済みアイテムを保持する日数
+        """
+        self.path = Path(path or SEEN_INDEX_PATH)
+        self.retention_days = retention_days if retention_days is not None else SEEN_INDEX_RETENTION_DAYS
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_items (
+                key TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                first_seen_date TEXT NOT NULL,
+                first_seen_at REAL NOT NULL,
+                summary_jp TEXT,
+                data TEXT NOT NULL,
+                duplicate INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        # 重複フラグの列がない以前のインデックスに列を追加
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(seen_items)")}
+        if 'duplicate' not in columns:
+            self._conn.execute("ALTER TABLE seen_items ADD COLUMN duplicate INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_seen_items_date ON seen_items(first_seen_date, source)"
+        )
+        self._conn.commit()
+        self._prune()
+    
+    @staticmethod
+    def item_key(source: str, item: Item) -> str:
+        """
+        アイテムのキーを生成（URLが使えない場合は本文のハッシュ）
+        
+        Args:
+            source: ソース名
+            item: 収集したアイテム
+        
+        Returns:
+            str: キー
+        """
+        url = item.url
+        if url and not url.endswith('/status/unknown'):
+            return url
+        
+        text = item.title or item.content or ''
+        return f"{source}:" + hashlib.sha1(text.encode('utf-8')).hexdigest()
+    
+    def _prune(self):
+        """保持期間を過ぎた処理済みアイテムを削除"""
+        cutoff = (datetime.now() - timedelta(days=self.retention_days)).strftime('%Y%m%d')
+        self._conn.execute("DELETE FROM seen_items WHERE first_seen_date < ?", (cutoff,))
+        self._conn.commit()
+    
+    def apply(self, source: str, items: List[Item]) -> int:
+        """
+        処理済みアイテムに保存済みの要約を付与
+        
+        要約が付与されたアイテムは要約対象から外れる。
+        
+        Args:
+            source: ソース名
+            items: 収集したアイテムのリスト（要約はその場で付与）
+        
+        Returns:
+            int: 処理済みだったアイテム数
+        """
+        seen = 0
+        for item in items:
+            row = self._conn.execute(
+                "SELECT summary_jp FROM seen_items WHERE key = ?", (self.item_key(source, item),)
+            ).fetchone()
+            if row is None:
+                continue
+            
+            seen += 1
+            if row[0]:
+                item.summary_jp = row[0]
+        
+        return seen
+    
+    def count_unseen(self, source: str, items: List[Item]) -> int:
+        """
+        未処理のアイテム数を取得
+        
+        Args:
+            source: ソース名
+            items: 収集したアイテムのリスト
+        
+        Returns:
+            int: 処理済みとして記録されていないアイテム数
+        """
+        unseen = 0
+        for item in items:
+            row = self._conn.execute(
+                "SELECT 1 FROM seen_items WHERE key = ?", (self.item_key(source, item),)
+            ).fetchone()
+            if row is None:
+                unseen += 1
+        return unseen
+    
+    def record(self, source: str, items: List[Item], date: datetime, duplicate: bool = False):
+        """
+        アイテムを処理済みとして記録（既存のアイテムは初回記録日を保持したまま内容を更新）
+        
+        Args:
+            source: ソース名
+            items: 要約済みのアイテムリスト
+            date: 実行日
+            duplicate: 重複統合で除いたアイテムか（日次ログには含めず、処理済みとしてのみ扱う）
+        """
+        date_key = date.strftime('%Y%m%d')
+        now = time.time()
+        
+        for item in items:
+            record = item.to_dict()
+            # 取得した記事本文は要約の入力にのみ使うため記録しない（本文のキャッシュに保存済み）
+            record.pop('body', None)
+            data = json.dumps(record, ensure_ascii=False, default=self._encode_value)
+            self._conn.execute("""
+                INSERT INTO seen_items (key, source, first_seen_date, first_seen_at, summary_jp, data, duplicate)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    summary_jp = COALESCE(excluded.summary_jp, seen_items.summary_jp),
+                    data = excluded.data,
+                    duplicate = excluded.duplicate
+            """, (self.item_key(source, item), source, date_key, now, item.summary_jp, data, int(duplicate)))
+        
+        self._conn.commit()
+    
+    def merge_for_date(self, source: str, items: List[Item], date: datetime) -> List[Item]:
+        """
+        今回の収集結果に、同じ日に記録済みで今回のフィードから外れたアイテムを追加
+        
+        これにより日次ログは実行のたびに作り直されるのではなく、追記されていく。
+        重複統合で除いたアイテムは追加しない。
+        
+        Args:
+            source: ソース名
+            items: 今回の収集結果
+            date: 実行日
+        
+        Returns:
+            List[Item]: 今回の収集結果 + 同日の過去の実行で記録されたアイテム
+        """
+        current_keys = {self.item_key(source, item) for item in items}
+        merged = list(items)
+        
+        rows = self._conn.execute(
+            "SELECT key, summary_jp, data FROM seen_items"
+            " WHERE source = ? AND first_seen_date = ? AND duplicate = 0 ORDER BY first_seen_at",
+            (source, date.strftime('%Y%m%d'))
+        ).fetchall()
+        
+        for key, summary_jp, data in rows:
+            if key in current_keys:
+                continue
+            item = Item.from_dict(json.loads(data))
+            if summary_jp:
+                item.summary_jp = summary_jp
+            if item.published:
+                item.published = datetime.fromisoformat(item.published)
+            merged.append(item)
+        
+        return merged
+    
+    def merge_collected(self, collected: Dict[str, List[Item]], date: datetime):
+        """
+        全ソースの収集結果に同じ日の記録済みアイテムを追加（その場で更新）
+        
+        重複統合の前に呼ぶと、過去の実行分や今回収集しなかったソースのアイテムとの重複もまとめられる。
+        
+        Args:
+            collected: ソース名をキーとした収集結果
+            date: 実行日
+        """
+        for source, items in collected.items():
+            collected[source] = self.merge_for_date(source, items, date)
+    
+    @staticmethod
+    def _encode_value(value):
+        """JSONに保存できない値（datetime）を変換"""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"JSONに変換できない型です: {type(value).__name__}")
+    
+    def close(self):
+        """データベース接続を閉じる"""
+        self._conn.close()
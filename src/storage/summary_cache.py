@@ -0,0 +1,154 @@
+"""
+要約結果の永続キャッシュモジュール（SQLite）
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from config.settings import (
+    SUMMARY_CACHE_PATH,
+    SUMMARY_CACHE_TTL_DAYS,
+    SUMMARY_CACHE_MAX_ENTRIES,
+    SUMMARY_CACHE_BYPASS
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryCache:
+    """プロンプト内容のハッシュをキーに要約結果を保存するキャッシュ"""
+    
+    # この回数の書き込みごとに期限切れ・超過分を削除
+    EVICT_INTERVAL = 50
+    
+    def __init__(self, path: Optional[Path] = None,
+                 ttl_days: Optional[float] = None,
+                 max_entries: Optional[int] = None,
+                 bypass: Optional[bool] = None):
+        """
+        Args:
+            path: SQLiteファイルのパス
+            ttl_days: キャッシュの有効期限（日）
+            max_entries: 保持する最大件数
+            bypass: Trueの場合はキャッシュを読まない（書き込みは行う）
+        """
+        self.path = Path(path or SUMMARY_CACHE_PATH)
+        self.ttl_seconds = (ttl_days if ttl_days is not None else SUMMARY_CACHE_TTL_DAYS) * 86400
+        self.max_entries = max_entries if max_entries is not None else SUMMARY_CACHE_MAX_ENTRIES
+        self.bypass = SUMMARY_CACHE_BYPASS if bypass is None else bypass
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries(accessed_at)")
+        self._conn.commit()
+        self.evict()
+    
+    @staticmethod
+    def make_key(prompt: str, title: Optional[str], model: str,
+                 temperature: float, max_tokens: int) -> str:
+        """
+        キャッシュキーを生成
+        
+        Args:
+            prompt: APIに送信するプロンプト全文
+            title: タイトル
+            model: モデル名
+            temperature: 生成温度
+            max_tokens: 最大出力トークン数
+        
+        Returns:
+            str: SHA-256ハッシュ（16進数）
+        """
+        payload = json.dumps([prompt, title or '', model, temperature, max_tokens], ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        キャッシュから要約を取得
+        
+        Args:
+            key: make_key()で生成したキー
+        
+        Returns:
+            str: キャッシュされた要約（存在しない・期限切れ・バイパス時None）
+        """
+        if self.bypass:
+            return None
+        
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary, created_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            
+            self._conn.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+    
+    def set(self, key: str, summary: str):
+        """
+        要約をキャッシュに保存
+        
+        Args:
+            key: make_key()で生成したキー
+            summary: 要約結果
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, summary, now, now)
+            )
+            self._conn.commit()
+            self._writes += 1
+            should_evict = self._writes % self.EVICT_INTERVAL == 0
+        
+        if should_evict:
+            self.evict()
+    
+    def evict(self):
+        """期限切れのエントリーと、最大件数を超えた最終参照の古いエントリーを削除"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM summaries WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+            self._conn.execute("""
+                DELETE FROM summaries WHERE key IN (
+                    SELECT key FROM summaries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+            self._conn.commit()
+    
+    def log_stats(self):
+        """ヒット・ミス件数をログに出力"""
+        total = self.hits + self.misses
+        ratio = (self.hits / total * 100) if total else 0.0
+        suffix = "（バイパス中）" if self.bypass else ""
+        logger.info(f"要約キャッシュ: ヒット {self.hits} 件 / ミス {self.misses} 件（ヒット率 {ratio:.1f}%）{suffix}")
+    
+    def close(self):
+        """データベース接続を閉じる"""
+        with self._lock:
+            self._conn.close()
@@ -1,7 +1,24 @@
 """
 出力モジュール
+
+各ライターは参照されたときに初めてimportする（設定された出力形式のみ読み込むため）。
 """
+import importlib
+
+_EXPORTS = {
+    'MarkdownWriter': '.markdown_writer',
+    'JsonlWriter': '.jsonl_writer',
+    'ParquetWriter': '.parquet_writer',
+    'Writer': '.registry',
+    'create_writers': '.registry',
+    'register_writer_type': '.registry',
+}
+
+__all__ = list(_EXPORTS)
 
-from .markdown_writer import MarkdownWriter
 
-__all__ = ['MarkdownWriter']
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
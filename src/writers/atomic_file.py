@@ -0,0 +1,49 @@
+"""
+出力ファイルを一時ファイル経由で書き込むモジュール（書き込み途中のファイルを残さない）
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+# 書き込みバッファのサイズ（バイト）
+BUFFER_SIZE = 64 * 1024
+
+
+@contextmanager
+def atomic_open(filepath: Path, binary: bool = False, buffering: int = BUFFER_SIZE) -> Iterator[IO]:
+    """
+    同じディレクトリの一時ファイルを開き、正常に閉じたら対象ファイルに置き換える
+    
+    例外が発生した場合は一時ファイルを削除し、既存の対象ファイルはそのまま残す。
+    
+    Args:
+        filepath: 出力先のパス
+        binary: バイナリモードで開く場合True（テキストはUTF-8）
+        buffering: 書き込みバッファのサイズ（バイト）
+    
+    Yields:
+        IO: 書き込み用のファイルオブジェクト
+    """
+    filepath = Path(filepath)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{filepath.name}.", suffix='.tmp', dir=str(filepath.parent))
+    try:
+        if binary:
+            f = open(fd, 'wb', buffering=buffering)
+        else:
+            f = open(fd, 'w', encoding='utf-8', buffering=buffering)
+        with f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, filepath)
+    
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
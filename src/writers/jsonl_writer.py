@@ -0,0 +1,50 @@
+"""
+JSON Lines形式で出力するモジュール（ダッシュボード等の機械処理用）
+"""
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict
+
+from config.settings import OUTPUT_DIR
+from src.writers.atomic_file import atomic_open
+from src.writers.records import iter_records
+
+logger = logging.getLogger(__name__)
+
+
+class JsonlWriter:
+    """1アイテム1行のJSON Lines形式でファイルに出力"""
+    
+    def __init__(self):
+        self.output_dir = Path(OUTPUT_DIR)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def write_sections(self, date: datetime, sections: List[Dict]) -> Path:
+        """
+        JSON Linesファイルを生成
+        
+        Args:
+            date: 日付
+            sections: セクションのリスト（MarkdownWriter.write_sections()と同じ形式）
+        
+        Returns:
+            Path: 生成されたファイルのパス
+        """
+        filepath = self.output_dir / f"log_{date.strftime('%Y%m%d')}.jsonl"
+        
+        try:
+            count = 0
+            with atomic_open(filepath) as f:
+                for record in iter_records(date, sections):
+                    f.write(json.dumps(record, ensure_ascii=False))
+                    f.write('\n')
+                    count += 1
+            
+            logger.info(f"JSON Linesファイルを生成しました: {filepath}（{count} 件）")
+            return filepath
+        
+        except Exception as e:
+            logger.error(f"JSON Linesファイルの書き込みエラー: {e}")
+            raise
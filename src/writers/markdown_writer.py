@@ -2,16 +2,13 @@
 Markdown形式で出力するモジュール
 """
 import logging
-import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict
-
-# プロジェクトルートをパスに追加
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+from typing import List, Dict, Iterator, Optional
 
 from config.settings import OUTPUT_DIR
+from src.writers.atomic_file import atomic_open
+from src.item import Item, coerce_items
 
 logger = logging.getLogger(__name__)
 
@@ -47,169 +44,236 @@ class MarkdownWriter:
         else:
             return "たった今"
     
-    def write(self, date: datetime, nikkei_articles: List[Dict], 
-              twitter_tweets: List[Dict], techcrunch_articles: List[Dict]) -> Path:
+    # write()で使用する既存3ソースの表示設定
+    LEGACY_SECTIONS = {
+        'nikkei': {
+            'label': '🇯🇵 日経電子版テック面', 'column': '📰 日経', 'layout': 'article',
+            'icon': '📄', 'background': '#f6f8fa', 'fallback': 'preview',
+        },
+        'twitter': {
+            'label': '🐦 X（Twitter）', 'column': '🐦 Twitter', 'layout': 'tweet',
+        },
+        'techcrunch': {
+            'label': '🌐 TechCrunch', 'column': '🌐 TechCrunch', 'layout': 'article',
+            'icon': '🚀', 'background': '#fff5f5', 'fallback': 'pending',
+        },
+    }
+    
+    # ツイートカードのスタイル
+    TWEET_STYLE = "background-color: #f0f9ff; padding: 12px; border-left: 4px solid #1da1f2; border-radius: 8px; margin: 8px 0;"
+    
+    def write(self, date: datetime, nikkei_articles: List[Item], 
+              twitter_tweets: List[Item], techcrunch_articles: List[Item]) -> Path:
         """
         Markdownファイルを生成（アプリ風デザイン）
         
         Args:
             date: 日付
-            nikkei_articles: 日経記事リスト
-            twitter_tweets: Twitterツイートリスト
-            techcrunch_articles: TechCrunch記事リスト
-            
+            nikkei_articles: 日経記事リスト（辞書のリストも可）
+            twitter_tweets: Twitterツイートリスト（辞書のリストも可）
+            techcrunch_articles: TechCrunch記事リスト（辞書のリストも可）
+        
         Returns:
             Path: 生成されたファイルのパス
         """
-        filename = f"log_{date.strftime('%Y%m%d')}.md"
-        filepath = self.output_dir / filename
+        sections = [
+            dict(self.LEGACY_SECTIONS['nikkei'], name='nikkei', items=coerce_items(nikkei_articles)),
+            dict(self.LEGACY_SECTIONS['twitter'], name='twitter', items=coerce_items(twitter_tweets)),
+            dict(self.LEGACY_SECTIONS['techcrunch'], name='techcrunch', items=coerce_items(techcrunch_articles)),
+        ]
+        return self.write_sections(date, sections)
+    
+    def _render_card(self, heading: str, style: str, url: str, published: datetime,
+                     time_label: str, link_label: str, body: Optional[str] = None,
+                     summary_jp: Optional[str] = None, fallback: Optional[str] = None,
+                     duplicates: Optional[List[Dict]] = None) -> Iterator[str]:
+        """
+        1件分のカードを描画（全ソース共通）
+        
+        Args:
+            heading: カードの見出し行
+            style: カードのインラインスタイル
+            url: リンク先URL
+            published: 公開・投稿日時
+            time_label: 日時の見出し（例: 公開日時）
+            link_label: リンクの文言（例: 記事を読む）
+            body: 日時の前に表示する本文（ツイート内容など）
+            summary_jp: AI要約
+            fallback: AI要約がない場合に表示するMarkdown
+            duplicates: 統合した同じ話題のアイテム（source, title, url）
+        """
+        yield f"{heading}\n\n"
+        yield f"<div style=\"{style}\">\n\n"
+        
+        if body:
+            yield f"{body}\n\n"
+        
+        yield f"**🕐 {time_label}**: `{self._format_date(published)}` ({self._format_relative_time(published)})\n\n"
         
-        # Markdownコンテンツを構築
-        content = []
+        if summary_jp:
+            yield f"**📝 AI要約**:\n\n"
+            yield f"> {summary_jp}\n\n"
+        elif fallback:
+            yield fallback
         
+        if duplicates:
+            links = ' / '.join(
+                f"[{duplicate['title']}]({duplicate['url']})（{duplicate['source']}）"
+                for duplicate in duplicates
+            )
+            yield f"**🔁 同じ話題**: {links}\n\n"
+        
+        yield f"**🔗 [{link_label} →]({url})**\n\n"
+        yield f"</div>\n\n"
+    
+    def _render_article_section(self, section: Dict) -> Iterator[str]:
+        """記事カード形式のセクションを描画"""
+        icon = section.get('icon', '📄')
+        style = f"background-color: {section.get('background', '#f6f8fa')}; padding: 12px; border-radius: 8px; margin: 8px 0;"
+        fallback_mode = section.get('fallback', 'preview')
+        
+        for idx, article in enumerate(section['items'], 1):
+            title = article.title or 'No Title'
+            url = article.url
+            summary = article.summary or ''
+            summary_jp = article.summary_jp if article.needs_translation else ''
+            
+            fallback = None
+            if fallback_mode == 'pending':
+                fallback = "*要約を生成中...*\n\n"
+            elif summary:
+                preview = summary[:300] + "..." if len(summary) > 300 else summary
+                fallback = f"**📄 概要**:\n\n> {preview}\n\n"
+            
+            yield from self._render_card(
+                heading=f"### {icon} {idx}. [{title}]({url})",
+                style=style,
+                url=url,
+                published=article.published or datetime.now(),
+                time_label='公開日時',
+                link_label='記事を読む',
+                summary_jp=summary_jp,
+                fallback=fallback,
+                duplicates=article.duplicates
+            )
+            yield "---\n\n"
+    
+    def _render_tweet_section(self, section: Dict) -> Iterator[str]:
+        """ユーザーごとのツイート形式のセクションを描画"""
+        # ユーザーごとにグループ化
+        tweets_by_user = {}
+        for tweet in section['items']:
+            username = tweet.username or 'unknown'
+            if username not in tweets_by_user:
+                tweets_by_user[username] = []
+            tweets_by_user[username].append(tweet)
+        
+        for username, tweets in tweets_by_user.items():
+            yield f"### 👤 @{username}\n\n"
+            
+            for idx, tweet in enumerate(tweets, 1):
+                content_text = tweet.content or ''
+                
+                # ツイート内容を表示（改行を保持）
+                display_text = content_text.replace('\n', '  \n')
+                if len(content_text) > 280:
+                    display_text = content_text[:280] + "..."
+                
+                yield from self._render_card(
+                    heading=f"**💬 ツイート #{idx}**",
+                    style=self.TWEET_STYLE,
+                    url=tweet.url,
+                    published=tweet.published or datetime.now(),
+                    time_label='投稿日時',
+                    link_label='ツイートを見る',
+                    body=display_text,
+                    summary_jp=tweet.summary_jp,
+                    duplicates=tweet.duplicates
+                )
+            
+            yield "---\n\n"
+    
+    def _render(self, date: datetime, sections: List[Dict]) -> Iterator[str]:
+        """レポート全体を断片ごとに描画"""
         # 統計情報を計算
-        total_items = len(nikkei_articles) + len(twitter_tweets) + len(techcrunch_articles)
+        total_items = sum(len(section['items']) for section in sections)
         
         # ヘッダー（アプリ風）
         date_str = date.strftime('%Y年%m月%d日')
         weekday = ['月', '火', '水', '木', '金', '土', '日'][date.weekday()]
         
-        content.append("---\n")
-        content.append(f"# 📱 ITトレンド・ウォッチャー\n\n")
-        content.append(f"<div align=\"center\">\n\n")
-        content.append(f"### 📅 {date_str}（{weekday}）\n\n")
-        content.append(f"**📊 本日の収集結果**\n\n")
-        content.append(f"| 📰 日経 | 🐦 Twitter | 🌐 TechCrunch | 📈 合計 |\n")
-        content.append(f"|:---:|:---:|:---:|:---:|\n")
-        content.append(f"| **{len(nikkei_articles)}** | **{len(twitter_tweets)}** | **{len(techcrunch_articles)}** | **{total_items}** |\n\n")
-        content.append(f"</div>\n\n")
-        content.append("---\n\n")
-        
-        # 日経電子版セクション（カード形式）
-        content.append("## 🇯🇵 日経電子版テック面\n\n")
-        if nikkei_articles:
-            for idx, article in enumerate(nikkei_articles, 1):
-                title = article.get('title', 'No Title')
-                url = article.get('url', '')
-                published = article.get('published', datetime.now())
-                summary = article.get('summary', '')
-                summary_jp = article.get('summary_jp', '')
-                needs_translation = article.get('needs_translation', False)
-                relative_time = self._format_relative_time(published)
-                
-                content.append(f"### 📄 {idx}. [{title}]({url})\n\n")
-                content.append(f"<div style=\"background-color: #f6f8fa; padding: 12px; border-radius: 8px; margin: 8px 0;\">\n\n")
-                
-                content.append(f"**🕐 公開日時**: `{self._format_date(published)}` ({relative_time})\n\n")
-                
-                if needs_translation and summary_jp:
-                    content.append(f"**📝 AI要約**:\n\n")
-                    content.append(f"> {summary_jp}\n\n")
-                elif summary:
-                    preview = summary[:300] + "..." if len(summary) > 300 else summary
-                    content.append(f"**📄 概要**:\n\n")
-                    content.append(f"> {preview}\n\n")
-                
-                content.append(f"**🔗 [記事を読む →]({url})**\n\n")
-                content.append(f"</div>\n\n")
-                content.append("---\n\n")
-        else:
-            content.append("<div align=\"center\" style=\"padding: 40px;\">\n\n")
-            content.append("📭 本日の記事はありません\n\n")
-            content.append("</div>\n\n")
-        
-        # Twitterセクション（カード形式）
-        content.append("## 🐦 X（Twitter）\n\n")
-        if twitter_tweets:
-            # ユーザーごとにグループ化
-            tweets_by_user = {}
-            for tweet in twitter_tweets:
-                username = tweet.get('username', 'unknown')
-                if username not in tweets_by_user:
-                    tweets_by_user[username] = []
-                tweets_by_user[username].append(tweet)
+        columns = ' | '.join(section.get('column', section['name']) for section in sections)
+        aligns = '|'.join(':---:' for _ in range(len(sections) + 1))
+        counts = ' | '.join(f"**{len(section['items'])}**" for section in sections)
+        
+        yield "---\n"
+        yield f"# 📱 ITトレンド・ウォッチャー\n\n"
+        yield f"<div align=\"center\">\n\n"
+        yield f"### 📅 {date_str}（{weekday}）\n\n"
+        yield f"**📊 本日の収集結果**\n\n"
+        yield f"| {columns} | 📈 合計 |\n"
+        yield f"|{aligns}|\n"
+        yield f"| {counts} | **{total_items}** |\n\n"
+        yield f"</div>\n\n"
+        yield "---\n\n"
+        
+        # ソースごとのセクション（カード形式）
+        for section in sections:
+            layout = section.get('layout', 'article')
+            yield f"## {section.get('label', section['name'])}\n\n"
             
-            for username, tweets in tweets_by_user.items():
-                content.append(f"### 👤 @{username}\n\n")
-                
-                for idx, tweet in enumerate(tweets, 1):
-                    content_text = tweet.get('content', '')
-                    url = tweet.get('url', '')
-                    published = tweet.get('published', datetime.now())
-                    summary_jp = tweet.get('summary_jp', '')
-                    relative_time = self._format_relative_time(published)
-                    
-                    content.append(f"**💬 ツイート #{idx}**\n\n")
-                    content.append(f"<div style=\"background-color: #f0f9ff; padding: 12px; border-left: 4px solid #1da1f2; border-radius: 8px; margin: 8px 0;\">\n\n")
-                    
-                    if content_text:
-                        # ツイート内容を表示（改行を保持）
-                        display_text = content_text.replace('\n', '  \n')
-                        if len(content_text) > 280:
-                            display_text = content_text[:280] + "..."
-                        content.append(f"{display_text}\n\n")
-                    
-                    content.append(f"**🕐 投稿日時**: `{self._format_date(published)}` ({relative_time})\n\n")
-                    
-                    if summary_jp:
-                        content.append(f"**📝 AI要約**:\n\n")
-                        content.append(f"> {summary_jp}\n\n")
-                    
-                    content.append(f"**🔗 [ツイートを見る →]({url})**\n\n")
-                    content.append(f"</div>\n\n")
-                
-                content.append("---\n\n")
-        else:
-            content.append("<div align=\"center\" style=\"padding: 40px;\">\n\n")
-            content.append("📭 本日のツイートはありません\n\n")
-            content.append("</div>\n\n")
-        
-        # TechCrunchセクション（カード形式）
-        content.append("## 🌐 TechCrunch\n\n")
-        if techcrunch_articles:
-            for idx, article in enumerate(techcrunch_articles, 1):
-                title = article.get('title', 'No Title')
-                url = article.get('url', '')
-                published = article.get('published', datetime.now())
-                summary_jp = article.get('summary_jp', '')
-                relative_time = self._format_relative_time(published)
-                
-                content.append(f"### 🚀 {idx}. [{title}]({url})\n\n")
-                content.append(f"<div style=\"background-color: #fff5f5; padding: 12px; border-radius: 8px; margin: 8px 0;\">\n\n")
-                
-                content.append(f"**🕐 公開日時**: `{self._format_date(published)}` ({relative_time})\n\n")
-                
-                if summary_jp:
-                    content.append(f"**📝 AI要約**:\n\n")
-                    content.append(f"> {summary_jp}\n\n")
+            if section['items']:
+                if layout == 'tweet':
+                    yield from self._render_tweet_section(section)
                 else:
-                    content.append(f"*要約を生成中...*\n\n")
-                
-                content.append(f"**🔗 [記事を読む →]({url})**\n\n")
-                content.append(f"</div>\n\n")
-                content.append("---\n\n")
-        else:
-            content.append("<div align=\"center\" style=\"padding: 40px;\">\n\n")
-            content.append("📭 本日の記事はありません\n\n")
-            content.append("</div>\n\n")
+                    yield from self._render_article_section(section)
+            else:
+                empty_label = 'ツイート' if layout == 'tweet' else '記事'
+                yield "<div align=\"center\" style=\"padding: 40px;\">\n\n"
+                yield f"📭 本日の{empty_label}はありません\n\n"
+                yield "</div>\n\n"
         
         # フッター（アプリ風）
-        content.append("\n---\n\n")
-        content.append("<div align=\"center\">\n\n")
-        content.append(f"**🤖 自動生成レポート**\n\n")
-        content.append(f"生成日時: `{self._format_date(datetime.now())}`\n\n")
-        content.append("---\n\n")
-        content.append("**💡 このレポートは毎日自動的に更新されます**\n\n")
-        content.append("</div>\n")
-        
-        # ファイルに書き込み
+        yield "\n---\n\n"
+        yield "<div align=\"center\">\n\n"
+        yield f"**🤖 自動生成レポート**\n\n"
+        yield f"生成日時: `{self._format_date(datetime.now())}`\n\n"
+        yield "---\n\n"
+        yield "**💡 このレポートは毎日自動的に更新されます**\n\n"
+        yield "</div>\n"
+    
+    def write_sections(self, date: datetime, sections: List[Dict]) -> Path:
+        """
+        任意のソース構成でMarkdownファイルを生成（アプリ風デザイン）
+        
+        本文は断片ごとにバッファ付きで一時ファイルへ書き出し、完了後に置き換えるため、
+        レポート全体をメモリ上に組み立てず、書き込み途中のファイルが残ることもない。
+        
+        Args:
+            date: 日付
+            sections: セクションのリスト（ソースの表示順）
+                - name: ソース名
+                - label: セクション見出し
+                - column: 収集結果テーブルの列名
+                - layout: 'article'（記事カード）または 'tweet'（ユーザーごとのツイート）
+                - icon / background / fallback: 記事カードの表示設定
+                - items: アイテム（Item）のリスト
+        
+        Returns:
+            Path: 生成されたファイルのパス
+        """
+        filename = f"log_{date.strftime('%Y%m%d')}.md"
+        filepath = self.output_dir / filename
+        
+        # ファイルに書き込み（同じディレクトリの一時ファイルに書いてからリネーム）
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(''.join(content))
+            with atomic_open(filepath) as f:
+                for fragment in self._render(date, sections):
+                    f.write(fragment)
             
             logger.info(f"Markdownファイルを生成しました: {filepath}")
             return filepath
-            
+        
         except Exception as e:
             logger.error(f"Markdownファイルの書き込みエラー: {e}")
             raise
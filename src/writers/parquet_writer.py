@@ -0,0 +1,78 @@
+"""
+Parquet形式で出力するモジュール（pyarrowがインストールされている場合のみ使用可能）
+"""
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict
+
+from config.settings import OUTPUT_DIR
+from src.writers.atomic_file import atomic_open
+from src.writers.records import RECORD_FIELDS, iter_records
+
+logger = logging.getLogger(__name__)
+
+
+class ParquetWriter:
+    """列指向のParquet形式でファイルに出力"""
+    
+    def __init__(self):
+        # pyarrowは任意の依存関係のため、このライターを使う場合のみimportする
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise ImportError(
+                "Parquet出力にはpyarrowが必要です（pip install pyarrow）"
+            ) from e
+        
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.output_dir = Path(OUTPUT_DIR)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _schema(self):
+        """出力するテーブルのスキーマ"""
+        pa = self._pa
+        types = {
+            'published': pa.timestamp('s'),
+            'needs_translation': pa.bool_(),
+        }
+        return pa.schema([(field, types.get(field, pa.string())) for field in RECORD_FIELDS])
+    
+    def write_sections(self, date: datetime, sections: List[Dict]) -> Path:
+        """
+        Parquetファイルを生成
+        
+        Args:
+            date: 日付
+            sections: セクションのリスト（MarkdownWriter.write_sections()と同じ形式）
+        
+        Returns:
+            Path: 生成されたファイルのパス
+        """
+        filepath = self.output_dir / f"log_{date.strftime('%Y%m%d')}.parquet"
+        
+        # レコードを列ごとの配列に変換
+        columns = {field: [] for field in RECORD_FIELDS}
+        for record in iter_records(date, sections):
+            if record['published']:
+                published = datetime.fromisoformat(record['published'])
+                if published.tzinfo is not None:
+                    # タイムゾーン付きの日時はUTCに変換してから、他のアイテムと同じnaive datetimeに揃える
+                    published = published.astimezone(timezone.utc).replace(tzinfo=None)
+                record['published'] = published
+            for field in RECORD_FIELDS:
+                columns[field].append(record[field])
+        
+        try:
+            table = self._pa.Table.from_pydict(columns, schema=self._schema())
+            with atomic_open(filepath, binary=True) as f:
+                self._pq.write_table(table, f, compression='zstd')
+            
+            logger.info(f"Parquetファイルを生成しました: {filepath}（{table.num_rows} 件）")
+            return filepath
+        
+        except Exception as e:
+            logger.error(f"Parquetファイルの書き込みエラー: {e}")
+            raise
@@ -0,0 +1,52 @@
+"""
+収集・要約済みアイテムを機械可読な形式のレコードに変換するモジュール
+"""
+from datetime import datetime
+from typing import List, Dict, Iterator
+
+# レコードの列（順序は出力時の列順）
+RECORD_FIELDS = (
+    'date',
+    'source',
+    'title',
+    'url',
+    'published',
+    'username',
+    'content',
+    'summary',
+    'summary_jp',
+    'needs_translation',
+)
+
+
+def iter_records(date: datetime, sections: List[Dict]) -> Iterator[Dict]:
+    """
+    セクションのアイテムを1件ずつレコードに変換
+    
+    Args:
+        date: 日付
+        sections: MarkdownWriter.write_sections()と同じセクションのリスト
+    
+    Yields:
+        Dict: RECORD_FIELDSをキーとするレコード（日時はISO 8601文字列、欠損はNone）
+    """
+    date_str = date.strftime('%Y-%m-%d')
+    
+    for section in sections:
+        for item in section['items']:
+            published = item.published
+            if isinstance(published, datetime):
+                published = published.isoformat()
+            
+            yield {
+                'date': date_str,
+                'source': section['name'],
+                'title': item.title,
+                'url': item.url,
+                'published': published,
+                'username': item.username,
+                'content': item.content,
+                'summary': item.summary,
+                'summary_jp': item.summary_jp or None,
+                'needs_translation': bool(item.needs_translation),
+            }
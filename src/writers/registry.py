@@ -0,0 +1,64 @@
+"""
+出力形式の登録・生成モジュール（設定された形式のライターのみ読み込む）
+"""
+import importlib
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+class Writer(Protocol):
+    """ライターが満たすインターフェース"""
+    
+    def write_sections(self, date: datetime, sections: List[Dict]) -> Path:
+        """セクションのリストをファイルに出力し、そのパスを返す"""
+        ...
+
+
+# 出力形式 -> "モジュール:クラス"（生成時にimportする）
+WRITER_TYPES: Dict[str, str] = {
+    'markdown': 'src.writers.markdown_writer:MarkdownWriter',
+    'jsonl': 'src.writers.jsonl_writer:JsonlWriter',
+    'parquet': 'src.writers.parquet_writer:ParquetWriter',
+}
+
+
+def register_writer_type(format_name: str, target: str):
+    """
+    出力形式を登録
+    
+    Args:
+        format_name: OUTPUT_FORMATSに指定する形式名
+        target: "モジュール:クラス" 形式のライタークラス
+    """
+    WRITER_TYPES[format_name] = target
+
+
+def create_writers(formats: List[str]) -> Dict[str, Writer]:
+    """
+    出力形式のリストからライターを生成（生成に失敗した形式はスキップ）
+    
+    Args:
+        formats: 出力形式のリスト（例: ['markdown', 'jsonl']）
+    
+    Returns:
+        Dict[str, Writer]: 形式名をキーとしたライター（指定の順序）
+    """
+    writers = {}
+    for format_name in formats:
+        if format_name in writers:
+            continue
+        if format_name not in WRITER_TYPES:
+            logger.error(f"未知の出力形式です: {format_name}")
+            continue
+        
+        module_name, class_name = WRITER_TYPES[format_name].split(':')
+        try:
+            writer_class = getattr(importlib.import_module(module_name), class_name)
+            writers[format_name] = writer_class()
+        except Exception as e:
+            logger.error(f"出力形式 {format_name} のライターの生成に失敗: {e}")
+    return writers
@@ -0,0 +1,10 @@
+"""
+テスト共通の設定
+"""
+import sys
+from pathlib import Path
+
+# プロジェクトルートをパスに追加（pytestをどのディレクトリから実行しても src をimportできるようにする）
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
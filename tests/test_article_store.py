@@ -0,0 +1,58 @@
+"""
+記事履歴（ArticleStore）のテスト
+"""
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.item import Item
+from src.storage.article_store import ArticleStore
+
+
+@pytest.fixture
+def tokyo_local_time(monkeypatch):
+    """サーバーのローカルタイムゾーンをUTC以外（Asia/Tokyo）にする"""
+    if not hasattr(time, 'tzset'):
+        pytest.skip("time.tzset()が使えない環境")
+    monkeypatch.setenv('TZ', 'Asia/Tokyo')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_tz_aware_published_is_stored_as_naive_utc(tmp_path, tokyo_local_time):
+    store = ArticleStore(tmp_path / 'articles.sqlite3')
+    try:
+        # 2026-01-02 08:30 (UTC-5) = 2026-01-02 13:30 UTC = 2026-01-02 22:30 JST
+        published = datetime(2026, 1, 2, 8, 30, tzinfo=timezone(timedelta(hours=-5)))
+        store.upsert('feed', [Item(source='Feed', title='t', url='https://example.com/a', published=published)])
+        
+        rows = store.search(source='feed')
+        assert [row['published'] for row in rows] == ['2026-01-02 13:30:00']
+    finally:
+        store.close()
+
+
+def test_date_range_uses_utc_regardless_of_host_timezone(tmp_path, tokyo_local_time):
+    store = ArticleStore(tmp_path / 'articles.sqlite3')
+    try:
+        # UTCでは1月1日、JST（サーバーのローカル時刻）では1月2日
+        published = datetime(2026, 1, 2, 7, 0, tzinfo=timezone(timedelta(hours=9)))
+        store.upsert('feed', [Item(source='Feed', title='t', url='https://example.com/b', published=published)])
+        
+        assert len(store.search(since='2026-01-01', until='2026-01-01')) == 1
+        assert store.search(since='2026-01-02') == []
+    finally:
+        store.close()
+
+
+def test_naive_published_is_stored_unchanged(tmp_path):
+    store = ArticleStore(tmp_path / 'articles.sqlite3')
+    try:
+        store.upsert('feed', [Item(source='Feed', title='t', url='https://example.com/c',
+                                   published=datetime(2026, 1, 2, 3, 4, 5))])
+        assert store.search()[0]['published'] == '2026-01-02 03:04:05'
+    finally:
+        store.close()
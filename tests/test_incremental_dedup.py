@@ -0,0 +1,55 @@
+"""
+インクリメンタルモードでの重複統合のテスト（同日の複数回の実行）
+"""
+from datetime import datetime
+
+import pytest
+
+from src.item import Item
+from src.storage.seen_index import SeenIndex
+
+TEXT = ('Kubernetes 1.40 ships a new scheduler that cuts pod startup latency in half '
+        'for large clusters, according to the release notes published today.')
+
+
+def _item(source: str, url: str) -> Item:
+    return Item(source=source, title='Kubernetes 1.40 released', url=url, summary=TEXT,
+                summary_jp='要約', published=datetime(2026, 1, 2, 3, 0))
+
+
+@pytest.fixture
+def main_module(tmp_path, monkeypatch):
+    """記事履歴・トレンド・ログファイルを一時ディレクトリに閉じ込めてsrc.mainを読み込む"""
+    monkeypatch.chdir(tmp_path)
+    import src.main as main
+    monkeypatch.setattr(main, 'ARTICLE_STORE_ENABLED', False)
+    monkeypatch.setattr(main, 'TREND_ENABLED', False)
+    monkeypatch.setattr(main, 'DEDUP_ENABLED', True)
+    return main
+
+
+def test_merged_representative_does_not_repeat_duplicates(tmp_path, main_module):
+    specs = [{'name': 'a'}, {'name': 'b'}]
+    today = datetime(2026, 1, 2, 12, 0)
+    seen_index = SeenIndex(tmp_path / 'seen.db')
+    try:
+        # 1回目: 両方のソースを収集（一方が代表、もう一方が重複として記録される）
+        first = {'a': [_item('A', 'https://a.example/1')], 'b': [_item('B', 'https://b.example/1')]}
+        main_module.process_collected(specs, first, today, summarizer=None, writers={}, seen_index=seen_index)
+        representative_source = next(source for source, items in first.items() if items)
+        duplicate_source = 'b' if representative_source == 'a' else 'a'
+        
+        # 2回目: 重複側のソースのみを収集（代表は同日の記録から戻される）
+        url = f"https://{duplicate_source}.example/1"
+        second = {representative_source: [], duplicate_source: [_item(duplicate_source.upper(), url)]}
+        main_module.process_collected(specs, second, today, summarizer=None, writers={}, seen_index=seen_index)
+        
+        assert second[duplicate_source] == []
+        [representative] = second[representative_source]
+        assert [duplicate['url'] for duplicate in representative.duplicates] == [url]
+        
+        # 記録された代表も重複を1件だけ持つ
+        [stored] = seen_index.merge_for_date(representative_source, [], today)
+        assert [duplicate['url'] for duplicate in stored.duplicates] == [url]
+    finally:
+        seen_index.close()
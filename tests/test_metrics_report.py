@@ -0,0 +1,33 @@
+"""
+実行レポートの出力のテスト
+"""
+import os
+import time
+
+from src.metrics.registry import MetricsRegistry
+from src.metrics.report import prune_reports, write_run_report
+
+
+def test_old_reports_are_pruned(tmp_path):
+    old = tmp_path / 'run_20250101_000000.json'
+    recent = tmp_path / 'run_20250110_000000.json'
+    other = tmp_path / 'notes.json'
+    for path in (old, recent, other):
+        path.write_text('{}', encoding='utf-8')
+    now = time.time()
+    os.utime(old, (now - 20 * 86400, now - 20 * 86400))
+    os.utime(other, (now - 20 * 86400, now - 20 * 86400))
+    os.utime(recent, (now - 2 * 86400, now - 2 * 86400))
+    
+    assert prune_reports(tmp_path, retention_days=14) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['notes.json', 'run_20250110_000000.json']
+
+
+def test_write_run_report_keeps_new_report(tmp_path):
+    registry = MetricsRegistry()
+    registry.inc('items_total', 3)
+    
+    path = write_run_report('ok', registry=registry, metrics_dir=tmp_path, prometheus_textfile='')
+    
+    assert path is not None and path.exists()
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
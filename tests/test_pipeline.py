@@ -0,0 +1,82 @@
+"""
+パイプライン実行（収集と要約の並行実行）のテスト
+"""
+from datetime import datetime
+
+import pytest
+
+from src.collectors import CollectionOrchestrator
+from src.item import Item
+from src.processors import Deduplicator
+from src.storage.seen_index import SeenIndex
+
+TEXT = ('Kubernetes 1.40 ships a new scheduler that cuts pod startup latency in half '
+        'for large clusters, according to the release notes published today.')
+
+
+def _item(source: str, url: str, title: str = 'Kubernetes 1.40 released', summary: str = TEXT) -> Item:
+    return Item(source=source, title=title, url=url, summary=summary,
+                published=datetime(2026, 1, 2, 3, 0), needs_translation=True)
+
+
+class _Collector:
+    """固定のアイテムを返すコレクター"""
+    
+    def __init__(self, items):
+        self.items = items
+    
+    def collect(self):
+        return list(self.items)
+
+
+class _Summarizer:
+    """要約を依頼されたアイテムを記録する要約処理"""
+    
+    deadline = None
+    
+    def __init__(self):
+        self.requested = []
+    
+    def summarize_batch(self, items, deadline=None):
+        self.requested.extend(item.url for item in items)
+        for item in items:
+            item.summary_jp = '要約'
+    
+    def cancel(self):
+        pass
+
+
+@pytest.fixture
+def pipeline_module(monkeypatch):
+    import src.pipeline as pipeline
+    monkeypatch.setattr(pipeline, 'ENRICH_ENABLED', False)
+    return pipeline
+
+
+def test_same_day_duplicates_are_not_summarized(tmp_path, pipeline_module):
+    today = datetime(2026, 1, 2, 12, 0)
+    seen_index = SeenIndex(tmp_path / 'seen.db')
+    try:
+        # 同日の過去の実行で、ソースaの記事を要約済みとして記録しておく
+        earlier = _item('A', 'https://a.example/1')
+        earlier.summary_jp = '要約'
+        seen_index.record('a', [earlier], today)
+        
+        # 今回はソースbだけが同じ話題の記事（別URL）を返す
+        summarizer = _Summarizer()
+        pipeline = pipeline_module.SummaryPipeline(summarizer, seen_index)
+        pipeline.deduplicator = Deduplicator()
+        other = _item('B', 'https://b.example/other', title='Rust 2.0 announced',
+                      summary='The Rust project announced a new major edition of the language today.')
+        orchestrator = CollectionOrchestrator({
+            'a': _Collector([]),
+            'b': _Collector([_item('B', 'https://b.example/1'), other]),
+        })
+        collected = pipeline.run(orchestrator, today)
+        
+        # 最後の重複統合で除かれるアイテムはAPIに送らない
+        assert summarizer.requested == ['https://b.example/other']
+        assert [item.url for item in collected['a']] == ['https://a.example/1']
+        assert [item.url for item in collected['b']] == ['https://b.example/other']
+    finally:
+        seen_index.close()